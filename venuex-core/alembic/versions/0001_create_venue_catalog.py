@@ -0,0 +1,59 @@
+"""create venue catalog
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'venue_catalog',
+        sa.Column('platform', sa.String(length=64), nullable=False),
+        sa.Column('venue_id', sa.String(length=128), nullable=False),
+        sa.Column('name', sa.String(length=512), nullable=False),
+        sa.Column('city', sa.String(length=128), nullable=False),
+        sa.Column('area', sa.String(length=256), nullable=True),
+        sa.Column('address', sa.Text(), nullable=True),
+        sa.Column('sports_offered', sa.JSON(), nullable=False),
+        sa.Column('rating', sa.Float(), nullable=True),
+        sa.Column('rating_count', sa.Integer(), nullable=True),
+        sa.Column('is_bookable', sa.Boolean(), nullable=False),
+        sa.Column('booking_url', sa.Text(), nullable=True),
+        sa.Column('venue_url', sa.Text(), nullable=True),
+        sa.Column('distance', sa.Float(), nullable=True),
+        sa.Column('last_updated', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('platform', 'venue_id'),
+    )
+    op.create_table(
+        'venue_listings',
+        sa.Column('platform', sa.String(length=64), nullable=False),
+        sa.Column('location', sa.String(length=128), nullable=False),
+        sa.Column('venue_id', sa.String(length=128), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('seen_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('platform', 'location', 'venue_id'),
+    )
+    op.create_index(
+        'ix_venue_listings_platform_location_position',
+        'venue_listings',
+        ['platform', 'location', 'position'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_venue_listings_platform_location_position', table_name='venue_listings')
+    op.drop_table('venue_listings')
+    op.drop_table('venue_catalog')
@@ -0,0 +1,29 @@
+"""
+Request dependencies for the services the app lifespan creates.
+
+Routes take these through ``Depends`` rather than importing module-level
+instances, so tests can swap any of them with ``app.dependency_overrides``.
+"""
+
+from fastapi import Request
+
+from app.services.agents import AgentRouter
+from app.services.pagination import ResultPager
+from app.services.scraping.prewarm import PrewarmScheduler
+from app.services.scraping.venue_service import VenueService
+
+
+def get_agent_router(request: Request) -> AgentRouter:
+    return request.app.state.agent_router
+
+
+def get_prewarm_scheduler(request: Request) -> PrewarmScheduler:
+    return request.app.state.prewarm_scheduler
+
+
+def get_result_pager(request: Request) -> ResultPager:
+    return request.app.state.result_pager
+
+
+def get_venue_service(request: Request) -> VenueService:
+    return request.app.state.venue_service
@@ -1,9 +1,17 @@
-from fastapi import APIRouter, HTTPException
+import json
+import time
+from typing import Any, AsyncIterator, Dict
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from app.api.dependencies import get_agent_router, get_result_pager, get_venue_service
+from app.core.metrics import STAGE_SECONDS, observe_stage
 from app.schemas.agent import AgentChatRequest, AgentChatResponse
 from app.services.agents import AgentRouter
+from app.services.pagination import CursorError, ResultPager, project
+from app.services.scraping.venue_service import VenueService
 
 router = APIRouter()
-agents = AgentRouter()
 
 @router.post("/chat", response_model=AgentChatResponse,
             summary="Chat with AI Agent",
@@ -18,11 +26,18 @@ agents = AgentRouter()
             **Supported Sports:** cricket, football, badminton  
             **Supported Cities:** Mumbai, Delhi, Bangalore, Kakkanad
             
+            Results are paginated: `slots_found` holds one page and `next_cursor`
+            fetches the next one from the stored result set without searching
+            again; send it with the same `user_id` as the search. `fields`
+            limits each venue to the listed keys.
+            
             **Example Request:**
             ```json
             {
                 "message": "Find cricket venues in Mumbai",
-                "user_id": "user123"
+                "user_id": "user123",
+                "page_size": 20,
+                "fields": ["venue_name", "platform", "rating", "is_bookable", "booking_url"]
             }
             ```
             
@@ -38,20 +53,89 @@ agents = AgentRouter()
                         "is_bookable": true,
                         "booking_url": "https://playo.co/booking?venueId=123"
                     }
-                ]
+                ],
+                "total_found": 45,
+                "next_cursor": "cTNmWl9kRzJ4OjIwOjIw"
             }
             ```
             """)
-async def chat_with_agent(request: AgentChatRequest):
-    try:
-        result = await agents.process_message(request.message, request.user_id)
+async def chat_with_agent(
+    request: AgentChatRequest,
+    agents: AgentRouter = Depends(get_agent_router),
+    result_pager: ResultPager = Depends(get_result_pager),
+    venue_service: VenueService = Depends(get_venue_service),
+):
+    if request.cursor:
+        try:
+            page = result_pager.next_page(request.cursor, request.user_id, request.page_size, request.fields)
+        except CursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         return AgentChatResponse(
-            response=result["response"],
-            slots_found=result.get("slots_found", [])
+            response=f"Showing venues {page.offset + 1}-{page.offset + len(page.items)} of {page.total}",
+            slots_found=page.items,
+            total_found=page.total,
+            next_cursor=page.next_cursor
         )
+
+    try:
+        start = time.perf_counter()
+        result = await agents.process_message(request.message, request.user_id)
+        location = result.get("location", "")
+        provider = venue_service.default_provider if location else ""
+        with observe_stage("response_build", provider, location):
+            page = result_pager.first_page(
+                result.get("records") or (), result.get("sport", ""), request.user_id, request.page_size, request.fields
+            )
+            response = AgentChatResponse(
+                response=result["response"],
+                slots_found=page.items,
+                total_found=page.total,
+                next_cursor=page.next_cursor
+            )
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage="chat", provider=provider, city=location)
+        return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing message: {str(e)}")
 
+@router.post("/chat/stream",
+            summary="Chat with AI Agent (streaming)",
+            description="""
+            Streaming variant of `/chat`. Events are sent as they become available:
+            
+            - `ack`: the understood sport and location, sent before any scraping
+            - `venues`: a batch of venues from one provider, as soon as that provider finishes
+            - `provider_error`: a provider failed or timed out
+            - `summary`: the final response text and `total_found`
+            
+            The body is newline-delimited JSON (`application/x-ndjson`), or
+            server-sent events when the request sends `Accept: text/event-stream`.
+            `fields` applies to every venue batch; `cursor` and `page_size` are ignored.
+            """)
+async def chat_with_agent_stream(
+    request: AgentChatRequest,
+    http_request: Request,
+    agents: AgentRouter = Depends(get_agent_router),
+):
+    use_sse = "text/event-stream" in http_request.headers.get("accept", "")
+    events = _encode_events(agents.stream_message(request.message, request.user_id), request.fields, use_sse)
+    media_type = "text/event-stream" if use_sse else "application/x-ndjson"
+    return StreamingResponse(events, media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+async def _encode_events(events: AsyncIterator[Dict[str, Any]], fields, use_sse: bool) -> AsyncIterator[str]:
+    try:
+        async for event in events:
+            if event["event"] == "venues":
+                event["venues"] = project(event["venues"], fields)
+            yield _encode_event(event, use_sse)
+    except Exception as e:
+        yield _encode_event({"event": "error", "detail": f"Error processing message: {str(e)}"}, use_sse)
+
+def _encode_event(event: Dict[str, Any], use_sse: bool) -> str:
+    data = json.dumps(event, default=str, ensure_ascii=False)
+    if use_sse:
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
 @router.get("/health",
            summary="Agent Health Check",
            description="Check if the AI agent service is running and healthy")
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional
 import os
 
 class Settings(BaseSettings):
@@ -20,6 +20,69 @@ class Settings(BaseSettings):
     # Firebase
     firebase_credentials_path: Optional[str] = os.getenv("FIREBASE_CREDENTIALS_PATH")
     
+    # Logging
+    log_level: str = "INFO"
+    log_levels: Dict[str, str] = {}
+    log_debug_sample_rate: float = 1.0
+    
+    # Venue listing cache
+    venue_cache_ttl_seconds: float = 300.0
+    venue_cache_stale_seconds: float = 900.0
+    venue_cache_max_entries: int = 256
+    venue_cache_max_bytes: int = 64 * 1024 * 1024
+    
+    # Crawler backend: firecrawl (live), http (direct fetch), record (live, saving cassettes) or replay (offline)
+    crawler_backend: str = "firecrawl"
+    crawler_backends: Dict[str, str] = {}
+    crawler_cassette_dir: str = "cassettes"
+    crawler_replay_latency_seconds: float = 0.0
+    crawler_replay_jitter_seconds: float = 0.0
+    crawler_replay_failure_rate: float = 0.0
+    crawler_replay_seed: Optional[int] = None
+    crawler_http_timeout_seconds: float = 10.0
+    crawler_http_max_connections: int = 20
+    crawler_http_keepalive_seconds: float = 30.0
+    crawler_http_fallback: bool = True
+    crawler_warmup_enabled: bool = True
+    crawler_warmup_timeout_seconds: float = 5.0
+    
+    # Multi-provider fan-out
+    provider_timeout_seconds: float = 20.0
+    
+    # Persistent venue catalog
+    venue_catalog_enabled: bool = False
+    venue_catalog_max_age_seconds: float = 3600.0
+    
+    # Chat result pagination
+    chat_page_size: int = 20
+    chat_max_page_size: int = 100
+    chat_result_ttl_seconds: float = 600.0
+    chat_result_max_entries: int = 1024
+    chat_stream_batch_size: int = 20
+    
+    # Background pre-warming of popular listings
+    prewarm_enabled: bool = False
+    prewarm_interval_seconds: float = 60.0
+    prewarm_refresh_margin_seconds: float = 60.0
+    prewarm_top_n: int = 10
+    prewarm_max_refreshes_per_cycle: int = 3
+    prewarm_max_refreshes_per_hour: int = 60
+    prewarm_popularity_half_life_seconds: float = 3600.0
+    prewarm_startup_cities: List[str] = ["mumbai", "delhi", "bangalore"]
+    
+    # Push notifications
+    notifications_enabled: bool = False
+    notification_queue_size: int = 1000
+    notification_batch_size: int = 500
+    notification_batch_window_seconds: float = 0.5
+    notification_dedupe_window_seconds: float = 600.0
+    
+    # LLM intent fallback
+    llm_intent_timeout_seconds: float = 2.0
+    llm_intent_max_concurrent: int = 8
+    llm_intent_cache_ttl_seconds: float = 3600.0
+    llm_intent_cache_max_entries: int = 4096
+    
     class Config:
         env_file = ".env"
 
@@ -0,0 +1,96 @@
+"""
+Logging setup: key=value output, per-module levels and sampled debug records.
+"""
+
+import logging
+import sys
+from typing import Dict, Optional
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RESERVED = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime'}
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formats records as ``key=value`` pairs.
+
+    Fields passed through ``extra=`` are appended after the message, so
+    ``logger.info("scraped", extra={"city": "mumbai", "venues": 40})`` gives
+    ``... msg="scraped" city=mumbai venues=40``.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        parts = [
+            f"time={self.formatTime(record, '%Y-%m-%dT%H:%M:%S')}",
+            f"level={record.levelname}",
+            f"logger={record.name}",
+            f"msg={_quote(record.getMessage())}",
+        ]
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith('_'):
+                parts.append(f"{key}={_quote(str(value))}")
+        if record.exc_info:
+            parts.append(f"exc={_quote(self.formatException(record.exc_info))}")
+        return ' '.join(parts)
+
+
+def _quote(value: str) -> str:
+    if value and not any(c in value for c in ' "=\n'):
+        return value
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') + '"'
+
+
+class DebugSampler(logging.Filter):
+    """
+    Lets through only a fraction ``rate`` of DEBUG records; other levels pass.
+
+    Sampling is deterministic (every ``1 / rate``-th record), so a burst of
+    identical debug lines is thinned evenly rather than randomly.
+    """
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = min(max(rate, 0.0), 1.0)
+        self._credit = 0.0
+        self.suppressed = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno != logging.DEBUG or self.rate >= 1.0:
+            return True
+        self._credit += self.rate
+        if self._credit >= 1.0:
+            self._credit -= 1.0
+            return True
+        self.suppressed += 1
+        return False
+
+
+def configure_logging(
+    level: str = "INFO",
+    module_levels: Optional[Dict[str, str]] = None,
+    debug_sample_rate: float = 1.0,
+    stream=None,
+) -> logging.Handler:
+    """
+    Install a structured handler on the ``app`` logger.
+
+    ``module_levels`` maps logger names to levels, e.g.
+    ``{"app.services.scraping.providers.playo_provider": "DEBUG"}`` turns on
+    debug output (and the costly page diagnostics gated on it) for Playo
+    only. Debug records are thinned to ``debug_sample_rate``.
+    """
+    root = logging.getLogger("app")
+    for handler in list(root.handlers):
+        if getattr(handler, '_venuex', False):
+            root.removeHandler(handler)
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(StructuredFormatter())
+    handler.addFilter(DebugSampler(debug_sample_rate))
+    handler._venuex = True
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+
+    for name, module_level in (module_levels or {}).items():
+        logging.getLogger(name).setLevel(module_level.upper())
+    return handler
@@ -0,0 +1,13 @@
+"""
+Database engine, session and declarative base.
+"""
+
+from .base import Base
+from .session import create_engine, create_sessionmaker, to_async_url
+
+__all__ = [
+    'Base',
+    'create_engine',
+    'create_sessionmaker',
+    'to_async_url'
+]
@@ -0,0 +1,10 @@
+"""
+Declarative base shared by all ORM models.
+"""
+
+from sqlalchemy.orm import DeclarativeBase
+
+
+class Base(DeclarativeBase):
+    """Base class for ORM models."""
+    pass
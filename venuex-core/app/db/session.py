@@ -0,0 +1,38 @@
+"""
+Async engine and session factory.
+"""
+
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+
+# Sync driver prefixes (as used by Alembic) mapped to their async equivalents
+_ASYNC_DRIVERS = {
+    'postgres://': 'postgresql+asyncpg://',
+    'postgresql://': 'postgresql+asyncpg://',
+    'postgresql+psycopg2://': 'postgresql+asyncpg://',
+    'sqlite://': 'sqlite+aiosqlite://',
+}
+
+
+def to_async_url(url: str) -> str:
+    """Map a sync DATABASE_URL onto the matching async driver."""
+    for prefix, async_prefix in _ASYNC_DRIVERS.items():
+        if url.startswith(prefix):
+            return async_prefix + url[len(prefix):]
+    return url
+
+
+def create_engine(url: Optional[str] = None, **kwargs) -> AsyncEngine:
+    """Create an async engine for ``url`` (defaults to settings.database_url)."""
+    url = url or settings.database_url
+    if not url:
+        raise ValueError("DATABASE_URL is not configured")
+    return create_async_engine(to_async_url(url), pool_pre_ping=True, **kwargs)
+
+
+def create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """Session factory bound to ``engine``."""
+    return async_sessionmaker(engine, expire_on_commit=False)
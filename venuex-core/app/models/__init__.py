@@ -0,0 +1,10 @@
+"""
+ORM models.
+"""
+
+from .venue import VenueCatalogEntry, VenueListingEntry
+
+__all__ = [
+    'VenueCatalogEntry',
+    'VenueListingEntry'
+]
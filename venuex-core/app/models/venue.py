@@ -0,0 +1,46 @@
+"""
+Persistent venue catalog tables.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import JSON, Boolean, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class VenueCatalogEntry(Base):
+    """One venue as last seen on a provider, keyed by (platform, venue_id)."""
+    __tablename__ = 'venue_catalog'
+
+    platform: Mapped[str] = mapped_column(String(64), primary_key=True)
+    venue_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    name: Mapped[str] = mapped_column(String(512))
+    city: Mapped[str] = mapped_column(String(128))
+    area: Mapped[Optional[str]] = mapped_column(String(256), nullable=True)
+    address: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    sports_offered: Mapped[List[str]] = mapped_column(JSON, default=list)
+    rating: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    rating_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    is_bookable: Mapped[bool] = mapped_column(Boolean, default=False)
+    booking_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    venue_url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    distance: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
+    last_updated: Mapped[datetime] = mapped_column(DateTime)
+
+
+class VenueListingEntry(Base):
+    """Membership of a venue in a provider's listing for a location."""
+    __tablename__ = 'venue_listings'
+
+    platform: Mapped[str] = mapped_column(String(64), primary_key=True)
+    location: Mapped[str] = mapped_column(String(128), primary_key=True)
+    venue_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    position: Mapped[int] = mapped_column(Integer)
+    seen_at: Mapped[datetime] = mapped_column(DateTime)
+
+    __table_args__ = (
+        Index('ix_venue_listings_platform_location_position', 'platform', 'location', 'position'),
+    )
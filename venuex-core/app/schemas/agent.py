@@ -1,6 +1,11 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Literal
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional, Literal, List
 from datetime import datetime
+
+from app.core.config import settings
+from app.services.pagination import SLOT_FIELDS
+
+
 class AgentChatRequest(BaseModel):
     message: str = Field(
         description="Natural language message to the AI agent",
@@ -10,6 +15,32 @@ class AgentChatRequest(BaseModel):
         description="User identifier",
         example="user123"
     )
+    cursor: Optional[str] = Field(
+        None,
+        description="next_cursor from a previous response; returns the next page of that search instead of searching again"
+    )
+    page_size: Optional[int] = Field(
+        None,
+        ge=1,
+        le=settings.chat_max_page_size,
+        description="Number of venues per page (defaults to CHAT_PAGE_SIZE)"
+    )
+    fields: Optional[List[str]] = Field(
+        None,
+        description="Venue keys to include in slots_found (defaults to all)",
+        example=["venue_name", "rating", "booking_url"]
+    )
+
+    @field_validator('fields')
+    @classmethod
+    def validate_fields(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        if value is None:
+            return value
+        unknown = [field for field in value if field not in SLOT_FIELDS]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return list(dict.fromkeys(value))
+
 
 class AgentChatResponse(BaseModel):
     response: str = Field(
@@ -18,5 +49,13 @@ class AgentChatResponse(BaseModel):
     )
     slots_found: Optional[list] = Field(
         None,
-        description="List of venues found by the agent"
+        description="One page of venues found by the agent"
+    )
+    total_found: int = Field(
+        0,
+        description="Number of venues in the whole result set"
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Pass as cursor to fetch the next page; null on the last page"
     )
@@ -1,12 +1,21 @@
+import logging
 from langchain_openai import ChatOpenAI
-from langchain.schema.messages import HumanMessage, SystemMessage
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Any, List, Optional, Sequence, Tuple
 from app.core.config import settings
-from datetime import datetime
+from app.services.intent import LLMIntentParser, load_gazetteer
+from app.services.scraping.base.models import VenueRecord
+from app.services.scraping.cache import TTLCache
+
+if TYPE_CHECKING:
+    from app.services.scraping.venue_service import VenueService
+
+logger = logging.getLogger(__name__)
 
 class AgentRouter:
-    def __init__(self):
+    def __init__(self, venue_service: "VenueService"):
+        self.venue_service = venue_service
         self.llm = None
+        self.gazetteer = load_gazetteer()
         
         if settings.openai_api_key:
             try:
@@ -16,79 +25,51 @@ class AgentRouter:
                     openai_api_key=settings.openai_api_key
                 )
             except Exception as e:
-                print(f"Warning: Could not initialize OpenAI: {e}")
+                logger.warning("Could not initialize OpenAI: %s", e)
                 self.llm = None
         
+        self.intent_parser = None
+        if self.llm is not None:
+            self.intent_parser = LLMIntentParser(
+                self.llm,
+                self.gazetteer,
+                timeout=settings.llm_intent_timeout_seconds,
+                max_concurrent=settings.llm_intent_max_concurrent,
+                cache=TTLCache(
+                    ttl=settings.llm_intent_cache_ttl_seconds,
+                    max_entries=settings.llm_intent_cache_max_entries
+                )
+            )
+        
     async def process_message(self, message: str, user_id: str) -> Dict[str, Any]:
-        """Process message and return venue search results only."""
+        """
+        Process message and return venue search results only.
+
+        The matched venues come back as ``records`` for the caller to page
+        through; only the few named in the reply are projected here.
+        """
         # Extract intent from message
-        args = self._extract_search_args(message)
+        args = await self._resolve_search_args(message)
         if args:
             # Get venue data from scraper
-            venues_found = await self._search_venues_immediately(args["sport"], args["location"])
+            records = await self._find_venue_records(args["sport"], args["location"])
             
-            if venues_found:
-                response_msg = f"🔍 Found {len(venues_found)} venues for {args['sport']} in {args['location']}:\n\n"
-                
-                # Show brief summary of top venues
-                for i, venue in enumerate(venues_found[:3], 1):
-                    platform = venue.get('platform', 'Unknown')
-                    venue_name = venue.get('venue_name', 'Unknown Venue')
-                    rating = venue.get('rating', 0)
-                    is_bookable = venue.get('is_bookable', False)
-                    status = "✅ Available" if is_bookable else "❌ Not Available"
-                    
-                    response_msg += f"{i}. **{venue_name}** ({platform})\n"
-                    if rating > 0:
-                        response_msg += f"   ⭐ {rating:.1f}/5\n"
-                    response_msg += f"   {status}\n\n"
-                
-                if len(venues_found) > 3:
-                    response_msg += f"... and {len(venues_found) - 3} more venues\n\n"
-                
-                response_msg += "📋 See all venues below with booking links!"
-                
-                return {
-                    "response": response_msg,
-                    "slots_found": venues_found
-                }
-            else:
-                return {
-                    "response": f"❌ No venues found for {args['sport']} in {args['location']}. This could be due to:\n\n1. No venues available in this area\n2. Scraping temporarily unavailable\n3. Try a different city (Mumbai, Delhi, Bangalore, Kakkanad)",
-                    "slots_found": []
-                }
-        
-        # Temporarily disable OpenAI to test fallback responses
-        # if self.llm:
-        #     try:
-        #         system_prompt = """
-        #         You are a sports venue finder agent. Help users find cricket, football, and badminton venues.
-        #         You can search in Mumbai, Delhi, Bangalore, and Kakkanad.
-        #         
-        #         If the user asks about sports venues, guide them to be more specific about:
-        #         - Sport type (cricket, football, badminton)
-        #         - Location (city name)
-        #         
-        #         For non-sports queries, politely redirect to sports venue finding.
-        #         """
-        #         
-        #         messages = [
-        #             SystemMessage(content=system_prompt),
-        #             HumanMessage(content=message)
-        #         ]
-        #         
-        #         response = self.llm.invoke(messages)
-        #         return {"response": response.content, "slots_found": []}
-        #     except Exception as e:
-        #         print(f"Error in OpenAI processing: {e}")
-        
-        print(f"Using fallback responses for message: {message}")
+            return {
+                "response": self._format_results(args["sport"], args["location"], records),
+                "records": records,
+                "sport": args["sport"],
+                "location": args["location"]
+            }
         
-        # Fallback response
+        logger.debug("No search intent; using fallback response for message: %s", message)
+        return self._fallback_response(message)
+
+    def _fallback_response(self, message: str) -> Dict[str, Any]:
+        """Build the reply for a message with no resolvable search intent."""
         if any(sport in message.lower() for sport in ["cricket", "football", "badminton"]):
             return {
                 "response": "I can help you find sports venues! Please specify both the sport and location, like:\n• 'Find cricket venues in Mumbai'\n• 'Show badminton courts in Kakkanad'", 
-                "slots_found": []
+                "records": ()
             }
         else:
             return {
@@ -102,105 +83,147 @@ class AgentRouter:
                     "Try asking something like \"Find cricket venues in Mumbai for this weekend\" or "
                     "\"I need badminton courts in Kakkanad tomorrow evening\""
                 ),
-                "slots_found": []
+                "records": ()
             }
     
-    async def _search_venues_immediately(self, sport: str, location: str) -> list:
-        """Search for venues using the venue service abstraction."""
+    async def stream_message(self, message: str, user_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process a message as a stream of events.
+
+        Yields an ``ack`` as soon as the intent is known, a ``venues`` batch
+        per provider (split into chunks of ``chat_stream_batch_size``) as each
+        provider finishes, ``provider_error`` for providers that failed or
+        timed out, and a final ``summary`` carrying the full response text.
+        """
+        args = await self._resolve_search_args(message)
+        if not args:
+            result = self._fallback_response(message)
+            yield {"event": "summary", "response": result["response"], "total_found": 0}
+            return
+        
+        sport, location = args["sport"], args["location"]
+        yield {
+            "event": "ack",
+            "sport": sport,
+            "location": location,
+            "response": f"🔍 Searching for {sport} venues in {location}..."
+        }
+        
+        records_found: List[VenueRecord] = []
+        batch_size = settings.chat_stream_batch_size
         try:
-            print(f"Searching for {sport} venues in {location}")
-            
-            # Use venue service abstraction instead of calling provider directly
-            from app.services.scraping.venue_service import venue_service
-            
-            try:
-                # Get venue details through the abstraction
-                venues = await venue_service.get_venue_details(location.lower())
-                
-                if venues:
-                    # Convert VenueInfo to response format
-                    venues_data = []
-                    for venue in venues:
-                        # Filter venues that offer the requested sport (if sports data available)
-                        if venue.sports_offered and not any(sport.lower() in s.lower() for s in venue.sports_offered):
-                            continue  # Skip venues that don't offer the requested sport
-                            
-                        venues_data.append({
-                            'platform': venue.platform,
-                            'venue_name': venue.name,
-                            'venue_id': venue.venue_id,
-                            'city': venue.city,
-                            'area': venue.area,
-                            'address': venue.address,
-                            'sport': sport,
-                            'sports_offered': venue.sports_offered,
-                            'rating': venue.rating,
-                            'rating_count': venue.rating_count,
-                            'is_bookable': venue.is_bookable,
-                            'booking_url': venue.booking_url,
-                            'venue_url': venue.venue_url,
-                            'price': 'Check venue for pricing',
-                            'time_slots': 'Available slots vary by date',
-                            'is_available': venue.is_bookable,
-                            'detected_at': datetime.utcnow().isoformat(),
-                            'distance': venue.distance
-                        })
-                    
-                    print(f"Venue service: found {len(venues_data)} venues")
-                    return venues_data
-                    
-            except Exception as e:
-                print(f"Error using venue service: {e}")
-                return []
+            async for outcome in self.venue_service.iter_venue_details(location):
+                if outcome.status != 'ok':
+                    yield {
+                        "event": "provider_error",
+                        "provider": outcome.provider,
+                        "status": outcome.status,
+                        "error": outcome.error
+                    }
+                    continue
                 
+                records = outcome.listing.matching(sport)
+                for start in range(0, len(records), batch_size):
+                    yield {
+                        "event": "venues",
+                        "provider": outcome.provider,
+                        "venues": [record.to_slot(sport) for record in records[start:start + batch_size]]
+                    }
+                records_found.extend(records)
         except Exception as e:
-            print(f"Error searching venues: {e}")
-            return []
+            logger.warning("Error streaming venues: %s", e)
+        
+        yield {
+            "event": "summary",
+            "response": self._format_results(sport, location, records_found),
+            "total_found": len(records_found)
+        }
     
-    def _extract_search_args(self, message: str) -> Optional[Dict[str, Any]]:
-        """Extract sport and location from message."""
-        message_lower = message.lower()
+    def _format_results(self, sport: str, location: str, records: Sequence[VenueRecord]) -> str:
+        """Build the chat reply summarising the venues found; only the top three are projected."""
+        if not records:
+            return f"❌ No venues found for {sport} in {location}. This could be due to:\n\n1. No venues available in this area\n2. Scraping temporarily unavailable\n3. Try a different city (Mumbai, Delhi, Bangalore, Kakkanad)"
         
-        # Extract sport
-        sport = None
-        for s in ["cricket", "football", "badminton"]:
-            if s in message_lower:
-                sport = s
-                break
+        response_msg = f"🔍 Found {len(records)} venues for {sport} in {location}:\n\n"
         
-        if not sport:
-            return None
+        # Show brief summary of top venues
+        for i, record in enumerate(records[:3], 1):
+            venue = record.to_slot(sport)
+            platform = venue.get('platform', 'Unknown')
+            venue_name = venue.get('venue_name', 'Unknown Venue')
+            rating = venue.get('rating') or 0
+            is_bookable = venue.get('is_bookable', False)
+            status = "✅ Available" if is_bookable else "❌ Not Available"
+            
+            response_msg += f"{i}. **{venue_name}** ({platform})\n"
+            if rating > 0:
+                response_msg += f"   ⭐ {rating:.1f}/5\n"
+            response_msg += f"   {status}\n\n"
         
-        # Extract location
-        location = None
-        cities = ["mumbai", "delhi", "bangalore", "bengaluru", "chennai", "kolkata", "hyderabad", 
-                 "pune", "kochi", "kakkanad", "trivandrum"]
-        for city in cities:
-            if city in message_lower:
-                # Map bengaluru to bangalore for consistency
-                if city == "bengaluru":
-                    location = "bangalore"
-                else:
-                    location = city
-                break
+        if len(records) > 3:
+            response_msg += f"... and {len(records) - 3} more venues\n\n"
         
-        if not location:
-            # Try to extract after "in"
-            words = message_lower.split()
-            try:
-                in_idx = words.index("in")
-                if in_idx + 1 < len(words):
-                    potential_city = words[in_idx + 1]
-                    # Only accept if it's a supported city
-                    if potential_city in ["mumbai", "delhi", "bangalore", "bengaluru", "kakkanad"]:
-                        location = "bangalore" if potential_city == "bengaluru" else potential_city
-            except ValueError:
-                pass
+        response_msg += "📋 See all venues below with booking links!"
+        return response_msg
+    
+    async def _search_venues_immediately(self, sport: str, location: str) -> list:
+        """Search for venues using the venue service abstraction."""
+        return [record.to_slot(sport) for record in await self._find_venue_records(sport, location)]
+    
+    async def _find_venue_records(self, sport: str, location: str) -> Tuple[VenueRecord, ...]:
+        """
+        Records of venues offering ``sport`` at ``location``, from every
+        provider that supports it.
         
-        if not location:
-            return None
+        Uses the same fan-out as ``stream_message`` so both endpoints return
+        the same venues. The records belong to the cached listings and are
+        shared between requests, so callers project them with ``to_slot``
+        rather than modifying them.
+        """
+        logger.debug("Searching for %s venues in %s", sport, location)
+        records: List[VenueRecord] = []
+        try:
+            async for outcome in self.venue_service.iter_venue_details(location.lower()):
+                if outcome.status != 'ok':
+                    logger.warning("Provider %s %s: %s", outcome.provider, outcome.status, outcome.error)
+                    continue
+                # Listings build their records once per scrape, so only filter here
+                records.extend(outcome.listing.matching(sport))
+        except Exception as e:
+            logger.warning("Error using venue service: %s", e)
         
-        return {
-            "sport": sport,
-            "location": location
-        }
\ No newline at end of file
+        logger.debug("Venue service: found %d venues", len(records))
+        return tuple(records)
+    
+    async def _resolve_search_args(self, message: str) -> Optional[Dict[str, Any]]:
+        """
+        Rule-based extraction first; the LLM is only asked when that misses.
+        
+        The LLM path has its own timeout and load shedding, so it never
+        answers slower than its budget; when it cannot answer the rule-based
+        result (no intent) stands.
+        """
+        args = self._extract_search_args(message)
+        if args or self.intent_parser is None:
+            return args
+        
+        intent = await self.intent_parser.parse(message)
+        if not intent:
+            return None
+        return self._intent_to_args(intent)
+    
+    def _extract_search_args(self, message: str) -> Optional[Dict[str, Any]]:
+        """Extract sport and location (plus locality, if one was named) from message."""
+        intent = self.gazetteer.extract(message)
+        if not intent:
+            return None
+        return self._intent_to_args(intent)
+    
+    def _intent_to_args(self, intent) -> Dict[str, Any]:
+        args = {
+            "sport": intent.sport,
+            "location": intent.location
+        }
+        if intent.locality:
+            args["locality"] = intent.locality
+        return args
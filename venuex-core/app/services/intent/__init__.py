@@ -0,0 +1,15 @@
+"""
+Intent extraction for chat messages.
+"""
+
+from .gazetteer import STOPWORDS, Gazetteer, GazetteerMatch, SearchIntent, load_gazetteer
+from .llm import LLMIntentParser
+
+__all__ = [
+    'Gazetteer',
+    'GazetteerMatch',
+    'LLMIntentParser',
+    'STOPWORDS',
+    'SearchIntent',
+    'load_gazetteer'
+]
@@ -0,0 +1,282 @@
+"""
+Compiled gazetteer of sports, cities, localities and their aliases.
+
+Phrases are stored in a token trie, so a message is matched in a single
+left-to-right pass whose cost depends on the message length and the longest
+phrase, not on how many places the gazetteer holds. Misspelt words are
+corrected against the gazetteer vocabulary through a trigram index before
+matching, and results for repeated messages are memoised.
+
+Ordinary English words are never corrected (see ``common_words.txt``), and
+a corrected locality only counts when the message marks it as a place.
+"""
+
+import json
+import re
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+DEFAULT_GAZETTEER_PATH = Path(__file__).with_name("gazetteer.json")
+DEFAULT_COMMON_WORDS_PATH = Path(__file__).with_name("common_words.txt")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Words common in chat messages that must never be "corrected" into a place or sport
+STOPWORDS = frozenset({
+    'find', 'show', 'need', 'want', 'looking', 'search', 'book', 'booking', 'near', 'nearby',
+    'venue', 'venues', 'court', 'courts', 'ground', 'grounds', 'turf', 'turfs', 'slot', 'slots',
+    'today', 'tomorrow', 'tonight', 'weekend', 'morning', 'evening', 'afternoon', 'night',
+    'please', 'there', 'where', 'which', 'available', 'play', 'playing', 'games', 'match',
+})
+
+# Words that introduce a place; a typo-corrected locality must follow one
+# unless its city is named exactly elsewhere in the message
+_PLACE_CUES = frozenset({'in', 'at', 'near', 'around'})
+
+
+def load_common_words(path: Path = DEFAULT_COMMON_WORDS_PATH) -> frozenset:
+    """Words from a list file, one or more per line; ``#`` starts a comment line."""
+    with open(path, encoding='utf-8') as f:
+        return frozenset(
+            word for line in f if not line.startswith('#') for word in normalize(line)
+        )
+
+
+class GazetteerMatch(NamedTuple):
+    """A gazetteer phrase found in a message."""
+    kind: str               # 'sport', 'city' or 'locality'
+    canonical: str          # canonical sport or city; locality name for localities
+    city: Optional[str]     # city a locality belongs to (the city itself for cities)
+    start: int              # token span in the normalised message
+    end: int
+    fuzzy: bool             # at least one token was typo-corrected
+
+
+class SearchIntent(NamedTuple):
+    """Sport and place extracted from a message."""
+    sport: str
+    location: str
+    locality: Optional[str] = None
+
+
+def normalize(text: str) -> List[str]:
+    """Lower-case a message and split it into alphanumeric tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _trigrams(token: str) -> List[str]:
+    padded = f"  {token} "
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def _max_typos(token: str) -> int:
+    """Edits tolerated for a word of this length; short words must match exactly."""
+    if len(token) < 5:
+        return 0
+    return 1 if len(token) < 8 else 2
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal string alignment distance (adjacent swaps cost 1), capped at ``limit + 1``."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev_prev: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev_prev[j - 2] + 1)
+        if min(cur) > limit:
+            return limit + 1
+        prev_prev, prev = prev, cur
+    return prev[-1]
+
+
+class Gazetteer:
+    """
+    Matches sports and places in free text.
+
+    Built once from a data file; see ``gazetteer.json`` for the format. Each
+    phrase (canonical name, alias or locality) becomes a path in the token
+    trie whose terminal node holds what the phrase resolves to.
+    """
+
+    def __init__(
+        self,
+        sports: Dict[str, Dict[str, Any]],
+        cities: Dict[str, Dict[str, Any]],
+        memo_size: int = 2048,
+        common_words: Iterable[str] = (),
+    ):
+        self._trie: Dict[str, Any] = {}
+        self._common_words = frozenset(common_words)
+        self._vocabulary: set = set()
+        self.phrase_count = 0
+
+        for sport, entry in sports.items():
+            for phrase in [sport, *entry.get('aliases', [])]:
+                self._add(phrase, ('sport', sport, None))
+        for city, entry in cities.items():
+            for phrase in [city, *entry.get('aliases', [])]:
+                self._add(phrase, ('city', city, city))
+            for locality in entry.get('localities', []):
+                self._add(locality, ('locality', ' '.join(normalize(locality)), city))
+
+        self._trigram_index: Dict[str, List[str]] = defaultdict(list)
+        for word in self._vocabulary:
+            if _max_typos(word):
+                for gram in set(_trigrams(word)):
+                    self._trigram_index[gram].append(word)
+
+        self._corrections: Dict[str, Optional[str]] = {}
+        self._memo_size = memo_size
+        self._memo: "OrderedDict[Tuple[str, ...], Optional[SearchIntent]]" = OrderedDict()
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], **kwargs) -> "Gazetteer":
+        return cls(data.get('sports', {}), data.get('cities', {}), **kwargs)
+
+    @classmethod
+    def from_file(cls, path: Path = DEFAULT_GAZETTEER_PATH, **kwargs) -> "Gazetteer":
+        """Gazetteer from a data file, with the bundled common words unless ``common_words`` is given."""
+        kwargs.setdefault('common_words', load_common_words())
+        with open(path, encoding='utf-8') as f:
+            return cls.from_dict(json.load(f), **kwargs)
+
+    def _add(self, phrase: str, target: Tuple[str, str, Optional[str]]) -> None:
+        tokens = normalize(phrase)
+        if not tokens:
+            return
+        node = self._trie
+        for token in tokens:
+            node = node.setdefault(token, {})
+            self._vocabulary.add(token)
+        # First definition wins, so an alias can never shadow a canonical name
+        if None not in node:
+            node[None] = target
+            self.phrase_count += 1
+
+    def correct(self, token: str) -> Optional[str]:
+        """Closest vocabulary word within the typo budget for ``token``, or None."""
+        limit = _max_typos(token)
+        if not limit or token in STOPWORDS or token in self._common_words:
+            return None
+
+        grams = _trigrams(token)
+        # q-gram lemma: one edit destroys at most 3 trigrams, an adjacent swap 4
+        needed = max(1, len(grams) - 4 * limit)
+        counts: Dict[str, int] = defaultdict(int)
+        for gram in set(grams):
+            for word in self._trigram_index.get(gram, ()):
+                counts[word] += 1
+
+        best, best_distance = None, limit + 1
+        for word, shared in counts.items():
+            if shared < needed:
+                continue
+            distance = _edit_distance(token, word, limit)
+            if distance < best_distance or (distance == best_distance and best is not None and word < best):
+                best, best_distance = word, distance
+        return best
+
+    def _cached_correction(self, token: str) -> Optional[str]:
+        if token not in self._corrections:
+            if len(self._corrections) >= self._memo_size * 4:
+                self._corrections.clear()
+            self._corrections[token] = self.correct(token)
+        return self._corrections[token]
+
+    def match(self, text: str) -> List[GazetteerMatch]:
+        """All non-overlapping phrases in ``text``, longest match first at each position."""
+        return self._match_tokens(tuple(normalize(text)))
+
+    def _match_tokens(self, tokens: Sequence[str]) -> List[GazetteerMatch]:
+        corrected: List[Optional[str]] = [
+            token if token in self._vocabulary else self._cached_correction(token)
+            for token in tokens
+        ]
+
+        matches = []
+        i = 0
+        while i < len(tokens):
+            node = self._trie
+            found = None
+            j = i
+            while j < len(tokens) and corrected[j] is not None and corrected[j] in node:
+                node = node[corrected[j]]
+                j += 1
+                if None in node:
+                    found = (j, node[None])
+            if found is None:
+                i += 1
+                continue
+            end, (kind, canonical, city) = found
+            fuzzy = any(corrected[k] != tokens[k] for k in range(i, end))
+            matches.append(GazetteerMatch(kind, canonical, city, i, end, fuzzy))
+            i = end
+        return matches
+
+    def extract(self, text: str) -> Optional[SearchIntent]:
+        """
+        The first sport and the first place mentioned in ``text``.
+
+        Returns None unless both are present. A locality resolves to its
+        city, with the locality kept alongside; a locality following its own
+        city refines it. A typo-corrected locality is ignored unless it
+        follows a place cue ("in", "at", "near") or its city is named
+        exactly in the message.
+        """
+        tokens = tuple(normalize(text))
+        if tokens in self._memo:
+            self._memo.move_to_end(tokens)
+            self.memo_hits += 1
+            return self._memo[tokens]
+        self.memo_misses += 1
+
+        matches = self._match_tokens(tokens)
+        exact_cities = {m.city for m in matches if m.kind == 'city' and not m.fuzzy}
+        sport = place = None
+        for match in matches:
+            if match.kind == 'locality' and match.fuzzy and not (
+                (match.start > 0 and tokens[match.start - 1] in _PLACE_CUES) or match.city in exact_cities
+            ):
+                continue
+            if match.kind == 'sport':
+                sport = sport or match
+            elif place is None:
+                place = match
+            elif place.kind == 'city' and match.kind == 'locality' and match.city == place.city:
+                # "bangalore hsr layout": the locality narrows the city already named
+                place = match
+
+        intent = None
+        if sport and place:
+            locality = place.canonical if place.kind == 'locality' else None
+            intent = SearchIntent(sport.canonical, place.city, locality)
+
+        self._memo[tokens] = intent
+        if len(self._memo) > self._memo_size:
+            self._memo.popitem(last=False)
+        return intent
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'phrases': self.phrase_count,
+            'vocabulary': len(self._vocabulary),
+            'memo_entries': len(self._memo),
+            'memo_hits': self.memo_hits,
+            'memo_misses': self.memo_misses,
+        }
+
+
+@lru_cache(maxsize=None)
+def load_gazetteer(path: Optional[str] = None) -> Gazetteer:
+    """Shared gazetteer compiled from ``path`` (defaults to the bundled data file)."""
+    return Gazetteer.from_file(Path(path) if path else DEFAULT_GAZETTEER_PATH)
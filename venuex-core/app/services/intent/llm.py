@@ -0,0 +1,142 @@
+"""
+LLM fallback for intent extraction.
+
+Only consulted when the gazetteer finds no sport/location pair. Calls are
+async with a hard timeout, answers are cached by normalised message, and the
+path sheds load (answering None, i.e. "no intent") when too many calls are in
+flight or the model keeps failing.
+"""
+
+import asyncio
+import json
+import logging
+import re
+from typing import Any, Dict, Optional
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from app.services.scraping.base.exceptions import CircuitOpenError
+from app.services.scraping.cache import CacheState, TTLCache
+from app.services.scraping.circuit_breaker import CircuitBreaker
+
+from .gazetteer import STOPWORDS, Gazetteer, SearchIntent, normalize
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = """You extract sports venue searches from user messages.
+Supported sports: cricket, football, badminton.
+Reply with JSON only: {"sport": <sport or null>, "location": <city or null>, "locality": <neighbourhood or null>}.
+Use null for anything the user did not say. Do not guess."""
+
+# Filler words dropped from the cache key so rephrasings share an entry
+_FILLER = frozenset({'a', 'an', 'the', 'in', 'at', 'on', 'for', 'to', 'me', 'i', 'some', 'any', 'can', 'you'})
+
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+# Cached "the model found nothing", distinct from a cache miss
+_NO_INTENT = object()
+
+
+def cache_key(message: str) -> str:
+    """Normalised form of a message used as the cache key."""
+    return ' '.join(t for t in normalize(message) if t not in _FILLER and t not in STOPWORDS)
+
+
+class LLMIntentParser:
+    """Extracts a SearchIntent with a chat model, within a latency budget."""
+
+    def __init__(
+        self,
+        llm: Any,
+        gazetteer: Gazetteer,
+        timeout: float = 2.0,
+        max_concurrent: int = 8,
+        cache: Optional[TTLCache] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.llm = llm
+        self.gazetteer = gazetteer
+        self.timeout = timeout
+        self.max_concurrent = max_concurrent
+        self.cache = cache if cache is not None else TTLCache(ttl=3600, max_entries=4096)
+        self.breaker = breaker or CircuitBreaker("llm-intent", failure_threshold=3, cooldown=30.0)
+
+        self.in_flight = 0
+        self.calls = 0
+        self.shed = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    async def parse(self, message: str) -> Optional[SearchIntent]:
+        """
+        Intent for ``message``, or None if there is none or the model could
+        not answer within budget.
+        """
+        key = cache_key(message)
+        if not key:
+            return None
+
+        cached, state = self.cache.get(key)
+        if state is not CacheState.MISS:
+            return None if cached is _NO_INTENT else cached
+
+        if self.in_flight >= self.max_concurrent:
+            self.shed += 1
+            return None
+
+        self.in_flight += 1
+        self.calls += 1
+        try:
+            content = await self.breaker.call(self._ask(message))
+        except CircuitOpenError:
+            self.shed += 1
+            return None
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            logger.warning("LLM intent parsing timed out after %.1fs", self.timeout)
+            return None
+        except Exception as e:
+            self.errors += 1
+            logger.warning("LLM intent parsing failed: %s", e)
+            return None
+        finally:
+            self.in_flight -= 1
+
+        intent = self._to_intent(content)
+        self.cache.set(key, intent if intent is not None else _NO_INTENT)
+        return intent
+
+    def _ask(self, message: str):
+        async def ask() -> str:
+            messages = [SystemMessage(content=SYSTEM_PROMPT), HumanMessage(content=message)]
+            response = await asyncio.wait_for(self.llm.ainvoke(messages), self.timeout)
+            return response.content
+        return ask
+
+    def _to_intent(self, content: str) -> Optional[SearchIntent]:
+        """Map the model's JSON answer onto the gazetteer, so only known sports and places come back."""
+        found = _JSON_OBJECT_RE.search(content or '')
+        if not found:
+            return None
+        try:
+            data = json.loads(found.group(0))
+        except ValueError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        parts = [data.get('sport'), data.get('locality'), data.get('location')]
+        return self.gazetteer.extract(' '.join(p for p in parts if isinstance(p, str)))
+
+    def stats(self) -> Dict[str, Any]:
+        cache = self.cache.stats()
+        return {
+            'calls': self.calls,
+            'in_flight': self.in_flight,
+            'shed': self.shed,
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+            'cache_hits': cache['hits'],
+            'cache_misses': cache['misses'],
+            'circuit': self.breaker.stats()['state'],
+        }
@@ -0,0 +1,20 @@
+"""
+Push notification delivery.
+"""
+
+from .dispatcher import NotificationDispatcher, SeenSet, build_multicasts, create_notification_dispatcher
+from .models import MulticastMessage, Notification, SendResult
+from .senders import FirebaseSender, InMemorySender, NotificationSender
+
+__all__ = [
+    'NotificationDispatcher',
+    'SeenSet',
+    'build_multicasts',
+    'create_notification_dispatcher',
+    'MulticastMessage',
+    'Notification',
+    'SendResult',
+    'FirebaseSender',
+    'InMemorySender',
+    'NotificationSender'
+]
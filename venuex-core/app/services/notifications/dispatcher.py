@@ -0,0 +1,278 @@
+"""
+Async notification queue with batching, per-user dedupe and backpressure.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from app.core.config import settings
+
+from .models import MulticastMessage, Notification
+from .senders import FirebaseSender, InMemorySender, NotificationSender
+
+logger = logging.getLogger(__name__)
+
+
+class SeenSet:
+    """
+    Remembers (user, alert) pairs for roughly ``window`` seconds.
+
+    Pairs are stored as 64-bit digests in two generations; the older one is
+    dropped once the newer one is ``window`` seconds old. Memory is bounded by
+    the alerts of the last two windows, and a pair is remembered for between
+    one and two windows.
+    """
+
+    def __init__(self, window: float, clock: Callable[[], float] = time.monotonic):
+        self.window = window
+        self._clock = clock
+        self._current: Set[int] = set()
+        self._previous: Set[int] = set()
+        self._rotated_at = clock()
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    @staticmethod
+    def digest(user_id: str, key: str) -> int:
+        raw = hashlib.blake2b(f"{user_id}\x00{key}".encode(), digest_size=8).digest()
+        return int.from_bytes(raw, 'big')
+
+    def add(self, user_id: str, key: str) -> bool:
+        """Record the pair; returns False if it was already seen within the window."""
+        self._rotate()
+        digest = self.digest(user_id, key)
+        if digest in self._current or digest in self._previous:
+            return False
+        self._current.add(digest)
+        return True
+
+    def discard(self, user_id: str, key: str) -> None:
+        """Forget the pair so the same alert can be sent again."""
+        digest = self.digest(user_id, key)
+        self._current.discard(digest)
+        self._previous.discard(digest)
+
+    def _rotate(self) -> None:
+        now = self._clock()
+        if now - self._rotated_at < self.window:
+            return
+        # Two windows without a rotation means everything remembered is too old
+        self._previous = self._current if now - self._rotated_at < 2 * self.window else set()
+        self._current = set()
+        self._rotated_at = now
+
+
+class NotificationDispatcher:
+    """
+    Queues notifications and sends them in multicast batches.
+
+    ``notify`` never waits: duplicates within ``dedupe_window`` are dropped
+    (alerts whose send failed are forgotten again, so they can be retried),
+    and when ``queue_size`` notifications are already waiting new ones are
+    rejected (counted as ``dropped``) instead of blocking the caller. A
+    worker collects up to ``batch_size`` notifications, waiting at most
+    ``batch_window`` seconds for more, merges those with identical content
+    into multicasts of up to the sender's token limit and sends them with at
+    most ``max_concurrent_sends`` in flight.
+    """
+
+    def __init__(
+        self,
+        sender: NotificationSender,
+        queue_size: int = 1000,
+        batch_size: int = 500,
+        batch_window: float = 0.5,
+        dedupe_window: float = 600.0,
+        max_concurrent_sends: int = 4,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.sender = sender
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.max_concurrent_sends = max_concurrent_sends
+        self.seen = SeenSet(dedupe_window, clock=clock)
+        self._queue: "asyncio.Queue[Notification]" = asyncio.Queue(maxsize=queue_size)
+        self._task: Optional[asyncio.Task] = None
+
+        self.enqueued = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.batches = 0
+        self.multicasts = 0
+        self.delivered = 0
+        self.failed = 0
+        self.send_errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def notify(self, notification: Notification) -> bool:
+        """Queue a notification without waiting; returns False if it was deduplicated or dropped."""
+        if self._queue.full():
+            # Checked before the seen-set so a dropped alert can be retried
+            self.dropped += 1
+            logger.warning("Notification queue full; dropped alert for user %s", notification.user_id)
+            return False
+        if not self.seen.add(notification.user_id, _dedupe_key(notification)):
+            self.deduplicated += 1
+            return False
+        self._queue.put_nowait(notification)
+        self.enqueued += 1
+        return True
+
+    def start(self) -> None:
+        """Start the send loop on the running event loop."""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self, drain_timeout: float = 5.0) -> None:
+        """Send what is still queued (up to ``drain_timeout`` seconds), then stop."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Stopping with %d notifications unsent", self._queue.qsize())
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.sender.close()
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self.send_batch(batch)
+            except Exception as e:
+                logger.warning("Sending notification batch failed: %s", e)
+                self._forget(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _next_batch(self) -> List[Notification]:
+        """Wait for one notification, then collect more until the batch is full or the window ends."""
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.batch_window
+        while len(batch) < self.batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def send_batch(self, batch: List[Notification]) -> None:
+        """Merge notifications with the same content and send them as multicasts."""
+        self.batches += 1
+        messages = build_multicasts(batch, self.sender.max_tokens)
+        semaphore = asyncio.Semaphore(self.max_concurrent_sends)
+
+        async def send(message: MulticastMessage) -> None:
+            async with semaphore:
+                try:
+                    result = await self.sender.send_multicast(message)
+                except Exception as e:
+                    self.send_errors += 1
+                    self.failed += len(message.tokens)
+                    logger.warning("Multicast to %d devices failed: %s", len(message.tokens), e)
+                    self._forget(_undelivered(batch, message, set(message.tokens)))
+                    return
+            self.multicasts += 1
+            self.delivered += result.success_count
+            self.failed += result.failure_count
+            if result.failed_tokens:
+                self._forget(_undelivered(batch, message, set(result.failed_tokens)))
+
+        await asyncio.gather(*(send(message) for message in messages))
+
+    def _forget(self, notifications: List[Notification]) -> None:
+        for notification in notifications:
+            self.seen.discard(notification.user_id, _dedupe_key(notification))
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and delivery counters."""
+        return {
+            'running': self.running,
+            'queue_depth': self._queue.qsize(),
+            'queue_capacity': self._queue.maxsize,
+            'enqueued': self.enqueued,
+            'deduplicated': self.deduplicated,
+            'dropped': self.dropped,
+            'batches': self.batches,
+            'multicasts': self.multicasts,
+            'delivered': self.delivered,
+            'failed': self.failed,
+            'send_errors': self.send_errors,
+            'seen_entries': len(self.seen),
+        }
+
+
+def _dedupe_key(notification: Notification) -> str:
+    return notification.dedupe_key or f"{notification.title}\x00{notification.body}"
+
+
+def _undelivered(batch: List[Notification], message: MulticastMessage, failed: Set[str]) -> List[Notification]:
+    """Notifications in ``message`` whose tokens there all failed."""
+    payload = (message.title, message.body, tuple(sorted(message.data.items())))
+    sent = set(message.tokens)
+    undelivered = []
+    for notification in batch:
+        tokens = sent.intersection(notification.tokens)
+        if notification.payload_key() == payload and tokens and tokens <= failed:
+            undelivered.append(notification)
+    return undelivered
+
+
+def build_multicasts(batch: List[Notification], max_tokens: int) -> List[MulticastMessage]:
+    """Group notifications by content and split each group into token chunks."""
+    groups: "OrderedDict[Tuple, Tuple[Notification, List[str]]]" = OrderedDict()
+    for notification in batch:
+        key = notification.payload_key()
+        if key not in groups:
+            groups[key] = (notification, [])
+        groups[key][1].extend(notification.tokens)
+
+    messages = []
+    for first, tokens in groups.values():
+        tokens = list(dict.fromkeys(tokens))
+        for start in range(0, len(tokens), max_tokens):
+            messages.append(MulticastMessage(
+                title=first.title,
+                body=first.body,
+                data=first.data,
+                tokens=tokens[start:start + max_tokens],
+            ))
+    return messages
+
+
+def create_notification_dispatcher() -> NotificationDispatcher:
+    """
+    Dispatcher configured from the NOTIFICATION_* settings.
+
+    Uses Firebase when FIREBASE_CREDENTIALS_PATH is set, otherwise an
+    in-memory sender that only records what would have been sent.
+    """
+    if settings.firebase_credentials_path:
+        sender: NotificationSender = FirebaseSender(settings.firebase_credentials_path)
+    else:
+        logger.info("FIREBASE_CREDENTIALS_PATH not set; notifications are recorded in memory only")
+        sender = InMemorySender()
+    return NotificationDispatcher(
+        sender,
+        queue_size=settings.notification_queue_size,
+        batch_size=settings.notification_batch_size,
+        batch_window=settings.notification_batch_window_seconds,
+        dedupe_window=settings.notification_dedupe_window_seconds,
+    )
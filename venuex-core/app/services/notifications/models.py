@@ -0,0 +1,39 @@
+"""
+Notification payloads and send results.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from pydantic import BaseModel, Field
+
+
+class Notification(BaseModel):
+    """An alert for one user, delivered to each of their devices."""
+    user_id: str = Field(..., description="User the alert is for")
+    tokens: List[str] = Field(..., description="Device registration tokens of the user")
+    title: str = Field(..., description="Notification title")
+    body: str = Field(..., description="Notification body")
+    data: Dict[str, str] = Field(default_factory=dict, description="Extra key/value payload")
+    dedupe_key: Optional[str] = Field(
+        None,
+        description="Alerts with the same key are sent once per user per window (defaults to title + body)",
+    )
+
+    def payload_key(self) -> Tuple[str, str, Tuple[Tuple[str, str], ...]]:
+        """Identity of the message content; equal payloads share a multicast."""
+        return self.title, self.body, tuple(sorted(self.data.items()))
+
+
+class MulticastMessage(BaseModel):
+    """One message sent to many device tokens in a single call."""
+    title: str = Field(..., description="Notification title")
+    body: str = Field(..., description="Notification body")
+    data: Dict[str, str] = Field(default_factory=dict, description="Extra key/value payload")
+    tokens: List[str] = Field(..., description="Device registration tokens")
+
+
+class SendResult(BaseModel):
+    """Outcome of a multicast send."""
+    success_count: int = Field(0, description="Tokens the message was delivered to")
+    failure_count: int = Field(0, description="Tokens the message could not be delivered to")
+    failed_tokens: List[str] = Field(default_factory=list, description="Tokens that failed")
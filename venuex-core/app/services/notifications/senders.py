@@ -0,0 +1,75 @@
+"""
+Pluggable notification senders.
+"""
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from .models import MulticastMessage, SendResult
+
+# FCM accepts at most this many tokens per multicast
+FCM_MAX_TOKENS = 500
+
+
+class NotificationSender(ABC):
+    """Delivers multicast messages."""
+
+    max_tokens: int = FCM_MAX_TOKENS
+
+    @abstractmethod
+    async def send_multicast(self, message: MulticastMessage) -> SendResult:
+        """Send one message to every token in it."""
+
+    async def close(self) -> None:
+        """Release any resources held by the sender."""
+
+
+class FirebaseSender(NotificationSender):
+    """Sends through Firebase Cloud Messaging using ``firebase_admin``."""
+
+    def __init__(self, credentials_path: str, app_name: str = "venuex-notifications"):
+        import firebase_admin
+        from firebase_admin import credentials, messaging
+
+        self._messaging = messaging
+        try:
+            self._app = firebase_admin.get_app(app_name)
+        except ValueError:
+            self._app = firebase_admin.initialize_app(credentials.Certificate(credentials_path), name=app_name)
+
+    async def send_multicast(self, message: MulticastMessage) -> SendResult:
+        messaging = self._messaging
+        fcm_message = messaging.MulticastMessage(
+            tokens=message.tokens,
+            notification=messaging.Notification(title=message.title, body=message.body),
+            data=message.data or None,
+        )
+        # The Admin SDK is blocking; keep it off the event loop
+        response = await asyncio.to_thread(messaging.send_each_for_multicast, fcm_message, app=self._app)
+        failed = [token for token, r in zip(message.tokens, response.responses) if not r.success]
+        return SendResult(
+            success_count=response.success_count,
+            failure_count=response.failure_count,
+            failed_tokens=failed,
+        )
+
+
+class InMemorySender(NotificationSender):
+    """Keeps sent messages in memory; for tests and local development."""
+
+    def __init__(self, delay: float = 0.0, fail_tokens: Optional[List[str]] = None):
+        self.delay = delay
+        self.fail_tokens = set(fail_tokens or [])
+        self.sent: List[MulticastMessage] = []
+
+    async def send_multicast(self, message: MulticastMessage) -> SendResult:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.sent.append(message)
+        failed = [token for token in message.tokens if token in self.fail_tokens]
+        return SendResult(
+            success_count=len(message.tokens) - len(failed),
+            failure_count=len(failed),
+            failed_tokens=failed,
+        )
@@ -0,0 +1,134 @@
+"""
+Cursor pagination over cached chat result sets.
+
+The result of a search is stored once under a random result id, as the
+shared VenueRecords the venue cache already holds plus the searched sport;
+every page, including the first, is a slice of those records projected to
+slot dicts, so a follow-up page never re-runs the search and a stored
+result set costs a reference per venue.
+"""
+
+import base64
+import secrets
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.services.scraping.base.models import VenueRecord
+from app.services.scraping.cache import TTLCache
+
+# Keys of a venue slot dict (see VenueRecord.to_slot) that ``fields`` may select
+SLOT_FIELDS = (
+    'platform', 'venue_name', 'venue_id', 'city', 'area', 'address', 'sport',
+    'sports_offered', 'rating', 'rating_count', 'is_bookable', 'booking_url',
+    'venue_url', 'price', 'time_slots', 'is_available', 'detected_at', 'distance',
+)
+
+
+class CursorError(ValueError):
+    """Raised for malformed cursors or cursors whose result set has expired."""
+
+
+class Page(NamedTuple):
+    items: List[Dict[str, Any]]
+    offset: int
+    total: int
+    next_cursor: Optional[str]
+
+
+def encode_cursor(result_id: str, offset: int, page_size: int) -> str:
+    raw = f"{result_id}:{offset}:{page_size}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str):
+    """Return ``(result_id, offset, page_size)`` from a cursor string."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        result_id, offset, page_size = base64.urlsafe_b64decode(padded).decode().split(':')
+        return result_id, int(offset), int(page_size)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise CursorError("Invalid cursor") from e
+
+
+def project(items: Sequence[Dict[str, Any]], fields: Optional[Sequence[str]]) -> List[Dict[str, Any]]:
+    """Keep only ``fields`` of each item; None keeps everything."""
+    if not fields:
+        return list(items)
+    return [{field: item.get(field) for field in fields} for item in items]
+
+
+class _ResultSet(NamedTuple):
+    owner: str
+    sport: str
+    records: Tuple[VenueRecord, ...]
+
+
+class ResultPager:
+    """
+    Stores result sets in a TTLCache and hands them out page by page.
+
+    A result set belongs to the user it was created for; cursors presented
+    by anyone else are rejected as if the set had expired.
+    """
+
+    def __init__(self, cache: TTLCache, default_page_size: int = 20, max_page_size: int = 100):
+        self.cache = cache
+        self.default_page_size = default_page_size
+        self.max_page_size = max_page_size
+
+    def first_page(
+        self,
+        records: Sequence[VenueRecord],
+        sport: str,
+        owner: str,
+        page_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """Page one of a new result set for ``owner``; the set is only stored if there is a next page."""
+        page_size = self._page_size(page_size)
+        result = _ResultSet(owner, sport, tuple(records))
+        result_id = None
+        if len(result.records) > page_size:
+            result_id = secrets.token_urlsafe(12)
+            self.cache.set(result_id, result)
+        return self._slice(result_id, result, 0, page_size, fields)
+
+    def next_page(
+        self,
+        cursor: str,
+        owner: str,
+        page_size: Optional[int] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Page:
+        """The page a cursor points at; ``page_size`` overrides the one in the cursor."""
+        result_id, offset, cursor_page_size = decode_cursor(cursor)
+        result, _ = self.cache.get(result_id)
+        if result is None or result.owner != owner:
+            raise CursorError("Cursor has expired; repeat the search")
+        if offset < 0 or offset >= len(result.records):
+            raise CursorError("Cursor is out of range")
+        return self._slice(result_id, result, offset, self._page_size(page_size or cursor_page_size), fields)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self.cache.stats()
+        stats.pop('ages', None)
+        return stats
+
+    def _page_size(self, page_size: Optional[int]) -> int:
+        return min(page_size or self.default_page_size, self.max_page_size)
+
+    def _slice(self, result_id, result: _ResultSet, offset: int, page_size: int, fields) -> Page:
+        end = offset + page_size
+        total = len(result.records)
+        next_cursor = encode_cursor(result_id, end, page_size) if end < total else None
+        items = [record.to_slot(result.sport) for record in result.records[offset:end]]
+        return Page(project(items, fields), offset, total, next_cursor)
+
+
+def create_result_pager() -> ResultPager:
+    """Pager configured from the CHAT_* settings."""
+    return ResultPager(
+        TTLCache(ttl=settings.chat_result_ttl_seconds, max_entries=settings.chat_result_max_entries),
+        default_page_size=settings.chat_page_size,
+        max_page_size=settings.chat_max_page_size,
+    )
@@ -3,16 +3,16 @@ Sports venue scraping service with multi-provider support.
 """
 
 from .base.models import CrawlResult, ProviderConfig, VenueInfo
-from .providers.factory import provider_factory
-from .providers import PlayoProvider, create_playo_config
-from .venue_service import venue_service
+from .providers import PlayoProvider, create_playo_config, create_provider_factory
+from .venue_service import VenueService, create_venue_service
 
 __all__ = [
     'CrawlResult',
     'ProviderConfig',
     'VenueInfo',
-    'provider_factory',
     'PlayoProvider',
+    'VenueService',
     'create_playo_config',
-    'venue_service'
-] 
\ No newline at end of file
+    'create_provider_factory',
+    'create_venue_service'
+]
\ No newline at end of file
@@ -2,13 +2,22 @@
 Base abstractions for sports venue scraping.
 """
 
-from .provider import BaseProvider, ProviderError
-from .models import VenueInfo, ProviderConfig, CrawlResult
+from .exceptions import CircuitOpenError, ProviderError
+from .provider import BaseProvider
+from .models import VenueInfo, ProviderConfig, CrawlResult, ProviderOutcome, AggregatedVenues, ScrapeProfile, VenueListing, VenueRecord, VenueChange, VenueDelta
 
 __all__ = [
     'BaseProvider',
     'ProviderError',
+    'CircuitOpenError',
     'VenueInfo',
     'ProviderConfig',
-    'CrawlResult'
+    'CrawlResult',
+    'ProviderOutcome',
+    'AggregatedVenues',
+    'ScrapeProfile',
+    'VenueListing',
+    'VenueRecord',
+    'VenueChange',
+    'VenueDelta'
 ] 
\ No newline at end of file
@@ -0,0 +1,13 @@
+"""
+Exceptions raised by sports venue scraping providers.
+"""
+
+
+class ProviderError(Exception):
+    """Base exception for provider-related errors."""
+    pass
+
+
+class CircuitOpenError(ProviderError):
+    """Raised without calling the provider while its circuit is open."""
+    pass
@@ -3,7 +3,7 @@ Data models for sports venue scraping system.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
 from pydantic import BaseModel, Field, HttpUrl
 from enum import Enum
 
@@ -43,6 +43,86 @@ class VenueInfo(BaseModel):
     last_updated: datetime = Field(default_factory=datetime.utcnow)
 
 
+class VenueRecord:
+    """
+    A VenueInfo with what sport filtering needs precomputed.
+
+    Built once per scrape and shared by every request; the slot dict for a
+    response is projected on demand so records stay small.
+    """
+    __slots__ = ('venue', 'sports_lower', 'detected_at')
+
+    def __init__(self, venue: VenueInfo, detected_at: str):
+        self.venue = venue
+        self.sports_lower: Tuple[str, ...] = tuple(s.lower() for s in venue.sports_offered)
+        self.detected_at = detected_at
+
+    def offers(self, sport: str) -> bool:
+        """Whether the venue offers ``sport`` (lower-case); venues without sports data match everything."""
+        if not self.sports_lower:
+            return True
+        return any(sport in s for s in self.sports_lower)
+
+    def to_slot(self, sport: str) -> Dict[str, Any]:
+        """
+        Slot dict for the chat response.
+
+        Every call returns a new dict and a new ``sports_offered`` list, so
+        callers may modify it without touching the cached venue.
+        """
+        venue = self.venue
+        return {
+            'platform': venue.platform,
+            'venue_name': venue.name,
+            'venue_id': venue.venue_id,
+            'city': venue.city,
+            'area': venue.area,
+            'address': venue.address,
+            'sport': sport,
+            'sports_offered': list(venue.sports_offered),
+            'rating': venue.rating,
+            'rating_count': venue.rating_count,
+            'is_bookable': venue.is_bookable,
+            'booking_url': venue.booking_url,
+            'venue_url': venue.venue_url,
+            'price': 'Check venue for pricing',
+            'time_slots': 'Available slots vary by date',
+            'is_available': venue.is_bookable,
+            'detected_at': self.detected_at,
+            'distance': venue.distance,
+        }
+
+
+class VenueListing:
+    """One provider's venues for a location as fetched by a single scrape."""
+    __slots__ = ('venues', 'fetched_at', '_records', '_by_sport')
+
+    def __init__(self, venues: Sequence[VenueInfo], fetched_at: Optional[datetime] = None):
+        self.venues: Tuple[VenueInfo, ...] = tuple(venues)
+        self.fetched_at = fetched_at or datetime.utcnow()
+        self._records: Optional[Tuple[VenueRecord, ...]] = None
+        self._by_sport: Dict[str, Tuple[VenueRecord, ...]] = {}
+
+    def __len__(self) -> int:
+        return len(self.venues)
+
+    @property
+    def records(self) -> Tuple[VenueRecord, ...]:
+        """Records for every venue, built on first use."""
+        if self._records is None:
+            detected_at = self.fetched_at.isoformat()
+            self._records = tuple(VenueRecord(v, detected_at) for v in self.venues)
+        return self._records
+
+    def matching(self, sport: str) -> Tuple[VenueRecord, ...]:
+        """Records offering ``sport``, memoised per sport."""
+        sport = sport.lower()
+        matched = self._by_sport.get(sport)
+        if matched is None:
+            matched = self._by_sport[sport] = tuple(r for r in self.records if r.offers(sport))
+        return matched
+
+
 class CrawlResult(BaseModel):
     """Result from a crawling operation (minimal version for crawler compatibility)."""
     platform: str = Field(..., description="Platform/provider name")
@@ -56,9 +136,79 @@ class CrawlResult(BaseModel):
     
     # Metadata
     crawled_at: datetime = Field(default_factory=datetime.utcnow)
+    crawl_duration: Optional[float] = Field(None, description="Seconds spent scraping")
+    profile: Optional[str] = Field(None, description="Scrape profile used")
+    content_bytes: int = Field(default=0, description="Size of all returned content")
     error_message: Optional[str] = Field(None, description="Error message if failed")
 
 
+class ScrapeProfile(BaseModel):
+    """Named set of scrape options requesting only what a parser needs."""
+    formats: List[str] = Field(default_factory=lambda: ['rawHtml'], description="Content formats to request")
+    timeout: int = Field(default=30000, description="Scrape timeout in milliseconds")
+    wait_for_selector: Optional[str] = Field(None, description="CSS selector to wait for before scraping")
+    wait_ms: Optional[int] = Field(None, description="Fixed wait in milliseconds before scraping")
+    only_main_content: Optional[bool] = Field(None, description="Strip headers, navs and footers")
+
+    def to_scrape_options(self) -> Dict[str, Any]:
+        """Render as Firecrawl scrape options."""
+        options: Dict[str, Any] = {'formats': list(self.formats), 'timeout': self.timeout}
+        actions = []
+        if self.wait_for_selector:
+            actions.append({"type": "wait", "selector": self.wait_for_selector})
+        if self.wait_ms:
+            actions.append({"type": "wait", "milliseconds": self.wait_ms})
+        if actions:
+            actions.append({"type": "scrape"})
+            options['actions'] = actions
+        if self.only_main_content is not None:
+            options['only_main_content'] = self.only_main_content
+        return options
+
+
+class ProviderOutcome(BaseModel):
+    """Result of querying a single provider during a fan-out."""
+    provider: str = Field(..., description="Provider name")
+    status: Literal['ok', 'failed', 'timeout'] = Field(..., description="How the provider call ended")
+    venues: List[VenueInfo] = Field(default_factory=list, description="Venues returned by the provider")
+    error: Optional[str] = Field(None, description="Error message if the provider failed")
+    duration: float = Field(0.0, description="Seconds spent waiting for the provider")
+    listing: Optional[Any] = Field(None, exclude=True, description="VenueListing the venues came from")
+
+
+class AggregatedVenues(BaseModel):
+    """Venues merged from every provider queried for a location."""
+    location: str = Field(..., description="Location that was queried")
+    venues: List[VenueInfo] = Field(default_factory=list, description="Venues from all successful providers")
+    succeeded: List[str] = Field(default_factory=list, description="Providers that answered in time")
+    failed: Dict[str, str] = Field(default_factory=dict, description="Providers that errored, with the error")
+    timed_out: List[str] = Field(default_factory=list, description="Providers that exceeded their timeout")
+
+
+class VenueChange(BaseModel):
+    """A field of one venue that differs between two snapshots."""
+    venue_id: str = Field(..., description="Venue identifier")
+    name: str = Field(..., description="Venue name")
+    before: Any = Field(None, description="Value in the previous snapshot")
+    after: Any = Field(None, description="Value in the current snapshot")
+
+
+class VenueDelta(BaseModel):
+    """Differences between two consecutive snapshots of a listing."""
+    sequence: int = Field(..., description="Position of this delta in the provider's delta log")
+    provider: str = Field(..., description="Provider name")
+    location: str = Field(..., description="Listing location")
+    detected_at: datetime = Field(default_factory=datetime.utcnow, description="When the change was seen")
+    added: List[VenueInfo] = Field(default_factory=list, description="Venues new in this snapshot")
+    removed: List[str] = Field(default_factory=list, description="IDs of venues no longer listed")
+    bookability_changed: List[VenueChange] = Field(default_factory=list, description="Venues whose is_bookable flipped")
+    rating_changed: List[VenueChange] = Field(default_factory=list, description="Venues whose rating changed")
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.bookability_changed or self.rating_changed)
+
+
 class ProviderConfig(BaseModel):
     """Configuration for a specific provider."""
     name: str = Field(..., description="Provider name")
@@ -68,7 +218,22 @@ class ProviderConfig(BaseModel):
     # City mappings
     city_mapping: dict = Field(default_factory=dict)
     
+    # Scrape profiles
+    scrape_profiles: Dict[str, ScrapeProfile] = Field(default_factory=dict, description="Named scrape profiles")
+    default_scrape_profile: str = Field(default="listing", description="Profile used for listing scrapes")
+    
     # Rate limiting
     max_requests_per_minute: int = Field(default=30, description="Rate limit")
     request_delay: float = Field(default=1.0, description="Delay between requests in seconds")
+    burst_limit: int = Field(default=5, description="Requests allowed back to back before rate limiting applies")
+    max_concurrent_requests: int = Field(default=5, description="Maximum requests in flight at once")
+    
+    # Circuit breaker
+    circuit_failure_threshold: int = Field(default=5, description="Consecutive failures before the circuit opens")
+    circuit_cooldown: float = Field(default=30.0, description="Seconds the circuit stays open before probing")
+    serve_last_good_when_open: bool = Field(default=True, description="Serve the last good listing while open")
+    
+    # Page readiness
+    ready_max_wait: float = Field(default=10.0, description="Hard ceiling in seconds on waiting for a page to become ready")
+    ready_max_attempts: int = Field(default=2, ge=1, description="Requests made at most before accepting a page that is not ready")
 
@@ -3,17 +3,35 @@ Abstract base provider for sports venue scraping.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from .exceptions import CircuitOpenError, ProviderError
 from .models import ProviderConfig, VenueInfo
+from ..circuit_breaker import CircuitBreaker
+from ..rate_limiter import RateLimiter
+from ..snapshots import SnapshotStore
 
 
 class BaseProvider(ABC):
     """Abstract base class for sports venue scraping providers."""
     
-    def __init__(self, config: ProviderConfig):
-        """Initialize provider with configuration."""
+    def __init__(self, config: ProviderConfig, http_client: Optional[httpx.AsyncClient] = None):
+        """Initialize provider with configuration and the app's HTTP connection pool, if any."""
         self.config = config
+        self.http_client = http_client
         self.name = config.name
+        self.rate_limiter = RateLimiter.from_config(config)
+        self.circuit_breaker = CircuitBreaker(
+            config.name,
+            failure_threshold=config.circuit_failure_threshold,
+            cooldown=config.circuit_cooldown,
+            probe=self._probe,
+        )
+        self.snapshots = SnapshotStore(config.name)
+        self._last_good: Dict[str, List[VenueInfo]] = {}
+        self.fallbacks_served = 0
         
     @property
     @abstractmethod
@@ -26,6 +44,56 @@ class BaseProvider(ABC):
         """Get detailed venue information for the given location."""
         pass
     
+    def page_ready(self, html: str) -> bool:
+        """
+        Whether a scraped page already holds the data this provider parses.
+
+        Crawlers ask again with a longer wait (within ``config.ready_max_wait``
+        and ``config.ready_max_attempts``) until this holds; providers
+        override it with a check specific to their pages.
+        """
+        return bool(html)
+    
+    async def fetch_venue_details(self, location: str) -> List[VenueInfo]:
+        """
+        Get venue details through the provider's circuit breaker.
+
+        While the circuit is open this fails immediately, or returns the last
+        listing successfully fetched for the location when the provider is
+        configured to serve it.
+        """
+        try:
+            venues = await self.circuit_breaker.call(lambda: self.get_venue_details(location))
+        except CircuitOpenError:
+            last_good = self._last_good.get(location)
+            if last_good is None or not self.config.serve_last_good_when_open:
+                raise
+            self.fallbacks_served += 1
+            return list(last_good)
+
+        self._last_good[location] = venues
+        return venues
+    
+    async def health_check(self) -> Dict[str, Any]:
+        """Provider health check; providers override this with a real probe."""
+        return {'provider': self.name, 'status': 'healthy'}
+    
+    async def warmup(self) -> None:
+        """Pre-connect the provider's crawler to its site; called once at startup."""
+        crawler = getattr(self, 'crawler', None)
+        if crawler is not None:
+            await crawler.warmup(self.config.base_url)
+    
+    async def close(self) -> None:
+        """Release the crawler's connections; called once at shutdown."""
+        crawler = getattr(self, 'crawler', None)
+        if crawler is not None:
+            await crawler.close()
+    
+    async def _probe(self) -> bool:
+        result = await self.health_check()
+        return result.get('status') == 'healthy'
+    
     def map_city(self, city: str) -> str:
         """Map city name to provider-specific format."""
         return self.config.city_mapping.get(city.lower(), city.lower())
@@ -35,8 +103,4 @@ class BaseProvider(ABC):
     
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}', enabled={self.config.enabled})"
-
-
-class ProviderError(Exception):
-    """Base exception for provider-related errors."""
-    pass 
\ No newline at end of file
+ 
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+In-memory TTL cache with LRU eviction and stale-while-revalidate support.
+"""
+
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class CacheState(str, Enum):
+    """Freshness of a cache lookup."""
+    FRESH = "fresh"
+    STALE = "stale"
+    MISS = "miss"
+
+
+class _CacheEntry:
+    __slots__ = ("value", "stored_at", "size")
+
+    def __init__(self, value: Any, stored_at: float, size: int):
+        self.value = value
+        self.stored_at = stored_at
+        self.size = size
+
+
+# Rough per-object overhead of a VenueInfo instance and its field storage
+_VENUE_OVERHEAD_BYTES = 600
+
+
+def estimate_venues_size(venues) -> int:
+    """Cheap estimate of the memory held by a list of VenueInfo objects."""
+    total = 64
+    for venue in venues:
+        total += _VENUE_OVERHEAD_BYTES
+        for value in (venue.name, venue.city, venue.area, venue.address,
+                      venue.booking_url, venue.venue_url, venue.venue_id):
+            if value:
+                total += len(value)
+        for sport in venue.sports_offered:
+            total += 56 + len(sport)
+    return total
+
+
+# Rough size of a VenueRecord and its prepared slot dict
+_RECORD_OVERHEAD_BYTES = 1200
+
+
+def estimate_listing_size(listing) -> int:
+    """Estimate for a VenueListing, including the records built from it."""
+    return estimate_venues_size(listing.venues) + len(listing.venues) * _RECORD_OVERHEAD_BYTES
+
+
+class TTLCache:
+    """
+    LRU cache bounded by entry count and estimated bytes.
+
+    Entries younger than ``ttl`` are fresh. Entries older than ``ttl`` but
+    younger than ``ttl + stale_ttl`` are still returned, flagged as stale, so
+    callers can serve them while refreshing in the background. Anything older
+    is treated as a miss and dropped.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        stale_ttl: float = 0.0,
+        max_entries: int = 256,
+        max_bytes: Optional[int] = None,
+        sizeof: Callable[[Any], int] = lambda value: 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._bytes = 0
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Tuple[Any, CacheState]:
+        """Return ``(value, state)``; value is None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None, CacheState.MISS
+
+        age = self._clock() - entry.stored_at
+        if age <= self.ttl:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value, CacheState.FRESH
+
+        if age <= self.ttl + self.stale_ttl:
+            self._entries.move_to_end(key)
+            self.stale_hits += 1
+            return entry.value, CacheState.STALE
+
+        self._remove(key)
+        self.expirations += 1
+        self.misses += 1
+        return None, CacheState.MISS
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting least recently used entries if over budget."""
+        if key in self._entries:
+            self._remove(key)
+
+        size = self._sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Never cache something that alone blows the byte budget
+            return
+
+        self._entries[key] = _CacheEntry(value, self._clock(), size)
+        self._bytes += size
+
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """Seconds since the entry was stored, or None if absent."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        return self._clock() - entry.stored_at
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or everything when no key is given."""
+        if key is None:
+            self._entries.clear()
+            self._bytes = 0
+        elif key in self._entries:
+            self._remove(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, memory use and per-entry ages."""
+        now = self._clock()
+        ages = {key: now - entry.stored_at for key, entry in self._entries.items()}
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'hit_ratio': (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'oldest_age': max(ages.values()) if ages else 0.0,
+            'ages': ages,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+
+def create_venue_cache(
+    ttl: float,
+    stale_ttl: float,
+    max_entries: int,
+    max_bytes: Optional[int],
+) -> TTLCache:
+    """Build a TTLCache sized for VenueListing entries."""
+    return TTLCache(
+        ttl=ttl,
+        stale_ttl=stale_ttl,
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        sizeof=estimate_listing_size,
+    )
+
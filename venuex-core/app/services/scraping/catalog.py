@@ -0,0 +1,203 @@
+"""
+Persistent venue catalog backed by SQLAlchemy.
+
+Works against SQLite locally and Postgres in production; both dialects
+support ``INSERT ... ON CONFLICT DO UPDATE``, which is used to write a whole
+batch of venues in a single statement.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.db import Base, create_engine, create_sessionmaker
+from app.models import VenueCatalogEntry, VenueListingEntry
+
+from .base.models import VenueInfo
+
+_UPSERT_COLUMNS = (
+    'name', 'city', 'area', 'address', 'sports_offered', 'rating', 'rating_count',
+    'is_bookable', 'booking_url', 'venue_url', 'distance', 'last_updated',
+)
+
+
+# Insert construct and bind-parameter limit per statement for each supported
+# dialect. SQLite builds before 3.32 allow 999 parameters; asyncpg allows 32767.
+_DIALECTS = {
+    'postgresql': (postgresql.insert, 32767),
+    'sqlite': (sqlite.insert, 999),
+}
+
+
+def _dialect_support(engine: AsyncEngine):
+    dialect = engine.dialect.name
+    if dialect not in _DIALECTS:
+        raise NotImplementedError(f"Venue catalog upsert is not supported on '{dialect}'")
+    return _DIALECTS[dialect]
+
+
+def _venue_row(venue: VenueInfo) -> Dict[str, Any]:
+    return {
+        'platform': venue.platform,
+        'venue_id': venue.venue_id,
+        'name': venue.name,
+        'city': venue.city,
+        'area': venue.area,
+        'address': venue.address,
+        'sports_offered': list(venue.sports_offered),
+        'rating': venue.rating,
+        'rating_count': venue.rating_count,
+        'is_bookable': venue.is_bookable,
+        'booking_url': venue.booking_url,
+        'venue_url': venue.venue_url,
+        'distance': venue.distance,
+        'last_updated': venue.last_updated,
+    }
+
+
+def _to_venue_info(entry: VenueCatalogEntry) -> VenueInfo:
+    return VenueInfo(
+        platform=entry.platform,
+        venue_id=entry.venue_id,
+        name=entry.name,
+        city=entry.city,
+        area=entry.area,
+        address=entry.address,
+        sports_offered=entry.sports_offered or [],
+        rating=entry.rating,
+        rating_count=entry.rating_count,
+        is_bookable=entry.is_bookable,
+        booking_url=entry.booking_url,
+        venue_url=entry.venue_url,
+        distance=entry.distance,
+        last_updated=entry.last_updated,
+    )
+
+
+class VenueCatalog:
+    """Stores scraped venue listings so they survive process restarts."""
+
+    def __init__(self, engine: AsyncEngine, batch_size: int = 500):
+        self.engine = engine
+        self.batch_size = batch_size
+        self._insert, self.max_parameters = _dialect_support(engine)
+        self._sessionmaker: async_sessionmaker[AsyncSession] = create_sessionmaker(engine)
+
+    async def create_schema(self) -> None:
+        """Create the catalog tables (local development; use Alembic elsewhere)."""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def close(self) -> None:
+        await self.engine.dispose()
+
+    async def upsert_venues(self, venues: Sequence[VenueInfo]) -> int:
+        """Insert or update venues by (platform, venue_id); returns rows written."""
+        rows = [_venue_row(v) for v in venues if v.venue_id]
+        if not rows:
+            return 0
+
+        async with self._sessionmaker.begin() as session:
+            await self._upsert_rows(session, rows)
+        return len(rows)
+
+    async def save_listing(self, platform: str, location: str, venues: Sequence[VenueInfo]) -> int:
+        """
+        Upsert the venues of a listing and replace the listing's membership.
+
+        Everything happens in one transaction, so readers never see a
+        half-written listing.
+        """
+        rows = [_venue_row(v) for v in venues if v.venue_id]
+        seen_at = datetime.utcnow()
+        location = location.lower()
+
+        async with self._sessionmaker.begin() as session:
+            if rows:
+                await self._upsert_rows(session, rows)
+            await session.execute(
+                delete(VenueListingEntry).where(
+                    VenueListingEntry.platform == platform,
+                    VenueListingEntry.location == location,
+                )
+            )
+            listing_rows = [
+                {
+                    'platform': platform,
+                    'location': location,
+                    'venue_id': row['venue_id'],
+                    'position': position,
+                    'seen_at': seen_at,
+                }
+                for position, row in enumerate(_dedupe(rows))
+            ]
+            for chunk in self._chunks(listing_rows):
+                await session.execute(self._insert(VenueListingEntry).values(chunk))
+        return len(rows)
+
+    async def get_listing(
+        self,
+        platform: str,
+        location: str,
+        max_age: Optional[float] = None,
+    ) -> Optional[List[VenueInfo]]:
+        """
+        Return the stored listing for a location, or None if there is none
+        or it is older than ``max_age`` seconds.
+        """
+        location = location.lower()
+        async with self._sessionmaker() as session:
+            result = await session.execute(
+                select(VenueCatalogEntry, VenueListingEntry.seen_at)
+                .join(
+                    VenueListingEntry,
+                    (VenueListingEntry.platform == VenueCatalogEntry.platform)
+                    & (VenueListingEntry.venue_id == VenueCatalogEntry.venue_id),
+                )
+                .where(
+                    VenueListingEntry.platform == platform,
+                    VenueListingEntry.location == location,
+                )
+                .order_by(VenueListingEntry.position)
+            )
+            rows = result.all()
+
+        if not rows:
+            return None
+
+        seen_at = min(row.seen_at for row in rows)
+        if max_age is not None and datetime.utcnow() - seen_at > timedelta(seconds=max_age):
+            return None
+
+        return [_to_venue_info(row.VenueCatalogEntry) for row in rows]
+
+    async def _upsert_rows(self, session: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+        for chunk in self._chunks(_dedupe(rows)):
+            stmt = self._insert(VenueCatalogEntry).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['platform', 'venue_id'],
+                set_={column: stmt.excluded[column] for column in _UPSERT_COLUMNS},
+            )
+            await session.execute(stmt)
+
+    def _chunks(self, rows: List[Dict[str, Any]]):
+        """Split rows so no statement binds more parameters than the dialect allows."""
+        if not rows:
+            return
+        size = max(1, min(self.batch_size, self.max_parameters // len(rows[0])))
+        for start in range(0, len(rows), size):
+            yield rows[start:start + size]
+
+
+def _dedupe(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Keep the last row per (platform, venue_id); ON CONFLICT rejects duplicates within one statement."""
+    by_key = {(row['platform'], row['venue_id']): row for row in rows}
+    return list(by_key.values())
+
+
+def create_venue_catalog(url: Optional[str] = None) -> VenueCatalog:
+    """Build a catalog on its own async engine for ``url`` (defaults to DATABASE_URL)."""
+    return VenueCatalog(create_engine(url))
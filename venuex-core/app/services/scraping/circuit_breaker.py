@@ -0,0 +1,135 @@
+"""
+Circuit breaker for provider calls.
+"""
+
+import time
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from .base.exceptions import CircuitOpenError
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stops calling an upstream after repeated failures.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    calls fail immediately with :class:`CircuitOpenError`. Once ``cooldown``
+    seconds have passed the circuit goes half-open: a single trial runs,
+    either ``probe`` (when given) or the call itself. Success closes the
+    circuit; failure re-opens it for another cooldown. Other callers keep
+    failing fast while the trial is running.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        probe: Optional[Callable[[], Awaitable[bool]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._probe = probe
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_running = False
+
+        self.rejected = 0
+        self.opened = 0
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run ``fn`` through the breaker."""
+        if self._state is not CircuitState.CLOSED:
+            await self._enter_trial()
+
+        try:
+            result = await fn()
+        except Exception:
+            self._record_failure()
+            raise
+        except BaseException:
+            # Cancelled: neither a success nor an upstream failure
+            self._trial_running = False
+            raise
+        self._record_success()
+        return result
+
+    async def _enter_trial(self) -> None:
+        """Reject the call, or let it through as the half-open trial."""
+        if self._trial_running or self._clock() - self._opened_at < self.cooldown:
+            self.rejected += 1
+            raise CircuitOpenError(f"Circuit for '{self.name}' is open")
+
+        self._state = CircuitState.HALF_OPEN
+        self._trial_running = True
+        if self._probe is None:
+            # The caller's own request is the trial; its outcome settles the state
+            return
+
+        try:
+            healthy = await self._probe()
+        except Exception:
+            healthy = False
+        except BaseException:
+            self._trial_running = False
+            self._state = CircuitState.OPEN
+            raise
+        self._trial_running = False
+
+        if not healthy:
+            self._trip()
+            self.rejected += 1
+            raise CircuitOpenError(f"Circuit for '{self.name}' is open (health probe failed)")
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+
+    def _record_success(self) -> None:
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._trial_running = False
+
+    def _record_failure(self) -> None:
+        self._failures += 1
+        self._trial_running = False
+        if self._state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        if self._state is not CircuitState.OPEN:
+            self.opened += 1
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+
+    def reset(self) -> None:
+        """Force the circuit closed."""
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._trial_running = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Current state and counters."""
+        return {
+            'state': self.state.value,
+            'consecutive_failures': self._failures,
+            'opened': self.opened,
+            'rejected': self.rejected,
+        }
@@ -2,6 +2,26 @@
 Crawling components for sports venue scraping.
 """
 
+from .base import BaseCrawler
+from .cassettes import CassetteStore
+from .factory import CRAWLER_BACKENDS, create_crawler
 from .firecrawl_crawler import FirecrawlCrawler
+from .http_crawler import HttpCrawler, create_http_client
+from .readiness import ReadyCheck, ReadyTimeTracker
+from .replay import RecordingCrawler, ReplayCrawler
+from .stats import ScrapeStats
 
-__all__ = ['FirecrawlCrawler'] 
\ No newline at end of file
+__all__ = [
+    'BaseCrawler',
+    'CassetteStore',
+    'CRAWLER_BACKENDS',
+    'create_crawler',
+    'FirecrawlCrawler',
+    'HttpCrawler',
+    'create_http_client',
+    'ReadyCheck',
+    'ReadyTimeTracker',
+    'RecordingCrawler',
+    'ReplayCrawler',
+    'ScrapeStats',
+]
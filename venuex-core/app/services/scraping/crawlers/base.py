@@ -0,0 +1,138 @@
+"""
+Crawler interface shared by every fetch backend.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+from app.core.metrics import observe_stage
+
+from ..base.models import CrawlResult
+from ..rate_limiter import RateLimiter
+from .readiness import ReadyCheck, ReadyTimeTracker, with_extra_wait
+from .stats import ScrapeStats
+
+DEFAULT_READY_CEILING = 10.0
+DEFAULT_READY_ATTEMPTS = 2
+
+
+class BaseCrawler(ABC):
+    """
+    Fetches pages for providers.
+
+    ``scrape_single_url`` is the contract providers use: it applies the
+    provider's rate limiter, records stage metrics and per-profile stats, and
+    delegates the fetch itself to ``_scrape``, which backends implement.
+
+    ``fallback`` is the crawler providers retry with when this one returns
+    a page they cannot use. ``renders_pages`` marks backends that run a
+    browser, where asking again with a longer wait can produce a page that
+    was not ready the first time.
+    """
+
+    renders_pages = False
+
+    def __init__(self, rate_limiter: Optional[RateLimiter] = None, fallback: Optional["BaseCrawler"] = None):
+        self.rate_limiter = rate_limiter
+        self.fallback = fallback
+        self.stats = ScrapeStats()
+        self.ready_times: Dict[str, ReadyTimeTracker] = {}
+
+    async def scrape_single_url(
+        self,
+        url: str,
+        platform: str,
+        scrape_options: Optional[Dict[str, Any]] = None,
+        profile: Optional[str] = None,
+        city: str = ''
+    ) -> CrawlResult:
+        """
+        Scrape a single URL.
+
+        ``profile`` names the scrape profile the options came from; it is
+        only used to attribute bytes and timings in ``self.stats``. ``city``
+        labels the rate-limit wait and scrape stage metrics.
+        """
+        if self.rate_limiter is None:
+            with observe_stage('scrape', platform, city):
+                result = await self._scrape(url, platform, scrape_options)
+        else:
+            with observe_stage('rate_limit_wait', platform, city):
+                await self.rate_limiter.acquire()
+            try:
+                with observe_stage('scrape', platform, city):
+                    result = await self._scrape(url, platform, scrape_options)
+            finally:
+                self.rate_limiter.release()
+
+        result.profile = profile
+        self.stats.record_scrape(profile, result.content_bytes, result.crawl_duration or 0.0, result.success)
+        return result
+
+    async def scrape_until_ready(
+        self,
+        url: str,
+        platform: str,
+        ready: ReadyCheck,
+        scrape_options: Optional[Dict[str, Any]] = None,
+        profile: Optional[str] = None,
+        city: str = '',
+        max_wait: Optional[float] = None,
+        max_attempts: int = DEFAULT_READY_ATTEMPTS
+    ) -> CrawlResult:
+        """
+        Scrape until ``ready`` accepts the page.
+
+        The first request uses ``scrape_options`` as given (normally a
+        selector wait). Page-rendering backends are then asked again, at
+        most ``max_attempts`` requests in all, with an extra wait action
+        sized from the extra wait the platform's pages needed before. No
+        extra wait exceeds the tuned budget (at most ``max_wait`` seconds).
+        Other backends fetch once. The last page is returned either way.
+        """
+        tracker = self.ready_times.get(platform)
+        if tracker is None:
+            tracker = self.ready_times[platform] = ReadyTimeTracker(DEFAULT_READY_CEILING if max_wait is None else max_wait)
+        budget = tracker.budget()
+        options = scrape_options
+        extra_wait = 0.0
+
+        for attempt in range(1, max_attempts + 1):
+            result = await self.scrape_single_url(url, platform, options, profile=profile, city=city)
+            if not result.success:
+                return result
+            if ready(result.raw_html_content or result.html_content or ''):
+                # The wait the server was asked for, not the round trip
+                tracker.record(extra_wait)
+                return result
+            if not self.renders_pages or attempt >= max_attempts or extra_wait >= budget:
+                break
+            tracker.retries += 1
+            extra_wait = min(tracker.next_wait(extra_wait), budget)
+            options = with_extra_wait(scrape_options, extra_wait)
+
+        tracker.record_not_ready()
+        return result
+
+    @abstractmethod
+    async def _scrape(
+        self,
+        url: str,
+        platform: str,
+        scrape_options: Optional[Dict[str, Any]] = None
+    ) -> CrawlResult:
+        """Fetch ``url``; failures are returned as an unsuccessful CrawlResult, not raised."""
+
+    async def warmup(self, url: str) -> None:
+        """
+        Prepare the backend for its first scrape of ``url``'s site, e.g. by
+        opening a connection. Never raises; backends without anything to
+        prepare only warm their fallback.
+        """
+        if self.fallback is not None:
+            await self.fallback.warmup(url)
+
+    async def close(self) -> None:
+        """Release any connections held by the backend (and its fallback)."""
+        if self.fallback is not None:
+            await self.fallback.close()
@@ -0,0 +1,83 @@
+"""
+On-disk store of recorded crawl results ("cassettes").
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+from ..base.models import CrawlResult
+
+CASSETTE_VERSION = 1
+
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def cassette_key(url: str, scrape_options: Optional[Dict[str, Any]] = None) -> str:
+    """
+    File name for a request: a readable slug of the URL plus a hash of the
+    URL and options, so the same page scraped with another profile is kept
+    apart.
+    """
+    canonical = json.dumps([url, scrape_options or {}], sort_keys=True, separators=(',', ':'), default=str)
+    digest = hashlib.sha256(canonical.encode()).hexdigest()[:16]
+    parts = urlsplit(url)
+    slug = _SLUG_RE.sub('-', f"{parts.netloc}{parts.path}".lower()).strip('-')[:80]
+    return f"{slug}-{digest}"
+
+
+class CassetteStore:
+    """
+    Gzip-compressed JSON cassettes, one file per (URL, options) pair.
+
+    Files are written to a temporary name and renamed into place, so a
+    reader never sees a partial cassette.
+    """
+
+    def __init__(self, directory: Path, compresslevel: int = 6):
+        self.directory = Path(directory)
+        self.compresslevel = compresslevel
+
+    def path_for(self, url: str, scrape_options: Optional[Dict[str, Any]] = None) -> Path:
+        return self.directory / f"{cassette_key(url, scrape_options)}.json.gz"
+
+    def save(self, url: str, scrape_options: Optional[Dict[str, Any]], result: CrawlResult) -> Path:
+        path = self.path_for(url, scrape_options)
+        document = {
+            'version': CASSETTE_VERSION,
+            'url': url,
+            'scrape_options': scrape_options or {},
+            'recorded_at': datetime.utcnow().isoformat(),
+            'result': result.model_dump(mode='json'),
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(gzip.compress(json.dumps(document).encode('utf-8'), self.compresslevel))
+        os.replace(tmp, path)
+        return path
+
+    def load(self, url: str, scrape_options: Optional[Dict[str, Any]] = None) -> Optional[CrawlResult]:
+        """The recorded result for the request, or None if there is no cassette."""
+        path = self.path_for(url, scrape_options)
+        try:
+            raw = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        document = json.loads(gzip.decompress(raw))
+        if document.get('version') != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {path}")
+        return CrawlResult.model_validate(document['result'])
+
+    def list(self) -> List[Path]:
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob('*.json.gz'))
+
+    def __len__(self) -> int:
+        return len(self.list())
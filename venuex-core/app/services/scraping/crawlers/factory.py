@@ -0,0 +1,64 @@
+"""
+Crawler backend selection.
+"""
+
+from pathlib import Path
+from typing import Optional
+
+import httpx
+
+from app.core.config import settings
+
+from ..rate_limiter import RateLimiter
+from .base import BaseCrawler
+from .cassettes import CassetteStore
+from .firecrawl_crawler import FirecrawlCrawler
+from .http_crawler import HttpCrawler
+from .replay import RecordingCrawler, ReplayCrawler
+
+CRAWLER_BACKENDS = ('firecrawl', 'http', 'record', 'replay')
+
+
+def crawler_backend_for(provider_name: str) -> str:
+    """Backend configured for a provider: CRAWLER_BACKENDS entry, else CRAWLER_BACKEND."""
+    backend = settings.crawler_backends.get(provider_name, settings.crawler_backend)
+    if backend not in CRAWLER_BACKENDS:
+        raise ValueError(f"Unknown crawler backend '{backend}' for {provider_name}; expected one of {CRAWLER_BACKENDS}")
+    return backend
+
+
+def create_crawler(
+    provider_name: str,
+    rate_limiter: Optional[RateLimiter] = None,
+    backend: Optional[str] = None,
+    http_client: Optional[httpx.AsyncClient] = None,
+) -> BaseCrawler:
+    """
+    Crawler for a provider.
+
+    ``firecrawl`` scrapes live; ``http`` fetches pages directly over
+    ``http_client`` (the app's connection pool), with Firecrawl as the fallback for pages the
+    provider cannot use (unless CRAWLER_HTTP_FALLBACK is off); ``record``
+    scrapes live and saves each page under CRAWLER_CASSETTE_DIR/<provider>;
+    ``replay`` serves those pages offline with the CRAWLER_REPLAY_* latency,
+    jitter and failure rate. Replay skips the rate limiter since nothing
+    remote is being called.
+    """
+    backend = backend or crawler_backend_for(provider_name)
+    store = CassetteStore(Path(settings.crawler_cassette_dir) / provider_name)
+
+    if backend == 'replay':
+        return ReplayCrawler(
+            store,
+            latency=settings.crawler_replay_latency_seconds,
+            jitter=settings.crawler_replay_jitter_seconds,
+            failure_rate=settings.crawler_replay_failure_rate,
+            seed=settings.crawler_replay_seed,
+        )
+
+    if backend == 'http':
+        fallback = FirecrawlCrawler(rate_limiter=rate_limiter) if settings.crawler_http_fallback else None
+        return HttpCrawler(http_client, rate_limiter=rate_limiter, fallback=fallback)
+    if backend == 'record':
+        return RecordingCrawler(FirecrawlCrawler(), store, rate_limiter=rate_limiter)
+    return FirecrawlCrawler(rate_limiter=rate_limiter)
@@ -8,28 +8,31 @@ import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
-from firecrawl import FirecrawlApp, AsyncFirecrawlApp, ScrapeOptions
+from firecrawl import AsyncFirecrawlApp
 from app.core.config import settings
 
 from ..base.models import CrawlResult
+from ..rate_limiter import RateLimiter
+from .base import BaseCrawler
 
 
-class FirecrawlCrawler:
+class FirecrawlCrawler(BaseCrawler):
     """Firecrawl-based crawler with async support and best practices."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    renders_pages = True
+    
+    def __init__(self, api_key: Optional[str] = None, rate_limiter: Optional[RateLimiter] = None):
         """Initialize Firecrawl crawler."""
+        super().__init__(rate_limiter)
         self.api_key = api_key or settings.firecrawl_api_key
-        self.sync_app = FirecrawlApp(api_key=self.api_key)
         self.async_app = AsyncFirecrawlApp(api_key=self.api_key)
     
-    async def scrape_single_url(
-        self, 
-        url: str, 
+    async def _scrape(
+        self,
+        url: str,
         platform: str,
         scrape_options: Optional[Dict[str, Any]] = None
     ) -> CrawlResult:
-        """Scrape a single URL using async Firecrawl."""
         start_time = time.time()
         
         try:
@@ -51,6 +54,7 @@ class FirecrawlCrawler:
             raw_html = getattr(result, 'rawHtml', None)
             html_content = getattr(result, 'html', None)
             markdown_content = getattr(result, 'markdown', None)
+            content_bytes = sum(len(c) for c in (raw_html, html_content, markdown_content) if c)
                         
             return CrawlResult(
                 platform=platform,
@@ -61,7 +65,7 @@ class FirecrawlCrawler:
                 raw_html_content=raw_html,
                 crawled_at=datetime.utcnow(),
                 crawl_duration=crawl_duration,
-                pages_crawled=1
+                content_bytes=content_bytes
             )
             
         except Exception as e:
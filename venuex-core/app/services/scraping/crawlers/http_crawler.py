@@ -0,0 +1,143 @@
+"""
+Direct HTTP crawler for server-rendered pages.
+"""
+
+import importlib.util
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+from ..base.models import CrawlResult
+from ..rate_limiter import RateLimiter
+from .base import BaseCrawler
+
+logger = logging.getLogger(__name__)
+
+# Sent with every request; Accept-Encoding is filled in by httpx from the
+# decoders installed (gzip and deflate always, br with the brotli package)
+BROWSER_HEADERS = {
+    'User-Agent': (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+        '(KHTML, like Gecko) Chrome/124.0 Safari/537.36'
+    ),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-IN,en;q=0.9',
+}
+
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+
+def create_http_client(
+    max_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> httpx.AsyncClient:
+    """Pooled keep-alive client, HTTP/2 when ``h2`` is installed; defaults from CRAWLER_HTTP_*."""
+    max_connections = max_connections or settings.crawler_http_max_connections
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        headers=BROWSER_HEADERS,
+        follow_redirects=True,
+        timeout=timeout or settings.crawler_http_timeout_seconds,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry or settings.crawler_http_keepalive_seconds,
+        ),
+    )
+
+
+class HttpCrawler(BaseCrawler):
+    """
+    Fetches pages with a plain GET over a pooled connection.
+
+    For pages whose data is rendered on the server, such as Playo's
+    ``__NEXT_DATA__``, this skips the headless browser entirely. Firecrawl
+    scrape options are ignored apart from ``timeout``, which can only
+    shorten CRAWLER_HTTP_TIMEOUT_SECONDS. Pages a provider cannot use are
+    retried with ``fallback``.
+
+    ``client`` is normally the app's pool, owned and closed by the app.
+    Without one the crawler creates its own on first use and closes it in
+    ``close``.
+    """
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        fallback: Optional[BaseCrawler] = None,
+    ):
+        super().__init__(rate_limiter, fallback=fallback)
+        self._client = client
+        self._owns_client = client is None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or (self._owns_client and self._client.is_closed):
+            self._client = create_http_client()
+        return self._client
+
+    async def _scrape(
+        self,
+        url: str,
+        platform: str,
+        scrape_options: Optional[Dict[str, Any]] = None
+    ) -> CrawlResult:
+        start_time = time.monotonic()
+        request_options: Dict[str, Any] = {}
+        if scrape_options and scrape_options.get('timeout'):
+            # The profile timeout is Firecrawl's render budget; a direct fetch
+            # gives up sooner so the fallback starts quickly
+            request_options['timeout'] = min(settings.crawler_http_timeout_seconds, scrape_options['timeout'] / 1000)
+
+        try:
+            response = await self.client.get(url, **request_options)
+        except httpx.HTTPError as e:
+            return self._failure(url, platform, start_time, f"Failed to fetch {url}: {e!r}")
+
+        if response.status_code >= 400:
+            return self._failure(url, platform, start_time, f"HTTP {response.status_code} from {url}")
+
+        html = response.text
+        return CrawlResult(
+            platform=platform,
+            url=url,
+            success=True,
+            raw_html_content=html,
+            crawled_at=datetime.utcnow(),
+            crawl_duration=time.monotonic() - start_time,
+            # Bytes on the wire, i.e. after compression
+            content_bytes=response.num_bytes_downloaded,
+        )
+
+    async def warmup(self, url: str) -> None:
+        """Open a pooled connection to ``url``'s host (TLS and, where available, HTTP/2) ahead of the first scrape."""
+        try:
+            await self.client.head(url)
+        except httpx.HTTPError as e:
+            logger.warning("Could not pre-connect to %s: %r", url, e)
+        await super().warmup(url)
+
+    async def close(self) -> None:
+        """Close the client if this crawler created it, then the fallback."""
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await super().close()
+
+    @staticmethod
+    def _failure(url: str, platform: str, start_time: float, message: str) -> CrawlResult:
+        return CrawlResult(
+            platform=platform,
+            url=url,
+            success=False,
+            error_message=message,
+            crawled_at=datetime.utcnow(),
+            crawl_duration=time.monotonic() - start_time,
+        )
@@ -0,0 +1,86 @@
+"""
+Adaptive waiting for pages to become ready.
+"""
+
+import math
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# A provider's test that a scraped page holds the data it needs
+ReadyCheck = Callable[[str], bool]
+
+
+class ReadyTimeTracker:
+    """
+    Extra wait a provider's pages needed to be ready, and the waits tuned from it.
+
+    Samples are the wait actions requested on top of the scrape profile
+    (zero when the first request was ready), not round-trip times; a page
+    that never became ready counts as ``ceiling``. Keeps the last ``window``
+    samples. Once there are samples the wait budget shrinks to twice the
+    95th percentile (never below ``floor``), and it is never more than
+    ``ceiling``, so a run of pages that were not ready widens it again.
+    """
+
+    def __init__(self, ceiling: float, floor: float = 0.25, default_wait: float = 1.0, window: int = 50):
+        self.ceiling = ceiling
+        self.floor = floor
+        self.default_wait = default_wait
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.ready = 0
+        self.not_ready = 0
+        self.retries = 0
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self.ready += 1
+
+    def record_not_ready(self) -> None:
+        self._samples.append(self.ceiling)
+        self.not_ready += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered: List[float] = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+    def budget(self) -> float:
+        """Longest extra wait, in seconds, a scrape may ask for."""
+        p95 = self.quantile(0.95)
+        if p95 is None:
+            return self.ceiling
+        return min(self.ceiling, max(self.floor, 2 * p95))
+
+    def next_wait(self, waited: float) -> float:
+        """
+        Extra wait to ask for after a request with ``waited`` seconds of extra wait was not ready.
+
+        Aims for the 90th percentile wait needed first; past that, doubles
+        the previous wait.
+        """
+        target = self.quantile(0.9) or self.default_wait
+        if waited < target:
+            return max(self.floor, target)
+        return max(self.floor, 2 * waited)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'ready': self.ready,
+            'not_ready': self.not_ready,
+            'retries': self.retries,
+            'p50': self.quantile(0.5),
+            'p95': self.quantile(0.95),
+            'budget': self.budget(),
+            'ceiling': self.ceiling,
+        }
+
+
+def with_extra_wait(scrape_options: Optional[Dict[str, Any]], seconds: float) -> Dict[str, Any]:
+    """Scrape options with a fixed wait action added before the final scrape action."""
+    options = dict(scrape_options or {})
+    actions = [a for a in options.get('actions') or () if a.get('type') != 'scrape']
+    actions.append({"type": "wait", "milliseconds": int(seconds * 1000)})
+    actions.append({"type": "scrape"})
+    options['actions'] = actions
+    return options
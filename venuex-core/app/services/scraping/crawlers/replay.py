@@ -0,0 +1,159 @@
+"""
+Record and replay crawler backends.
+
+``RecordingCrawler`` wraps a live backend and saves successful results to a
+CassetteStore (for readiness-checked scrapes, only the ready page); ``ReplayCrawler`` serves those cassettes without any
+network access, with injectable latency, jitter and failures so perf runs
+and offline development see realistic, repeatable behaviour.
+"""
+
+import asyncio
+import logging
+import random
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from ..base.models import CrawlResult
+from ..rate_limiter import RateLimiter
+from .base import BaseCrawler
+from .cassettes import CassetteStore
+from .readiness import ReadyCheck
+
+logger = logging.getLogger(__name__)
+
+# Set while a readiness-checked scrape runs, so its attempts are not recorded one by one
+_recording_deferred: ContextVar[bool] = ContextVar('recording_deferred', default=False)
+
+
+class RecordingCrawler(BaseCrawler):
+    """
+    Fetches through ``inner`` and records successful results.
+
+    A ``scrape_until_ready`` call records only a page that passed the ready
+    check, under the options it was called with, so a replay of the first
+    request gets the ready page and pages that were still loading are never
+    saved.
+    """
+
+    def __init__(self, inner: BaseCrawler, store: CassetteStore, rate_limiter: Optional[RateLimiter] = None):
+        super().__init__(rate_limiter)
+        self.inner = inner
+        self.store = store
+        self.renders_pages = inner.renders_pages
+        self.recorded = 0
+
+    async def _scrape(
+        self,
+        url: str,
+        platform: str,
+        scrape_options: Optional[Dict[str, Any]] = None
+    ) -> CrawlResult:
+        result = await self.inner._scrape(url, platform, scrape_options)
+        if result.success and not _recording_deferred.get():
+            await self._record(url, scrape_options, result)
+        return result
+
+    async def scrape_until_ready(
+        self,
+        url: str,
+        platform: str,
+        ready: ReadyCheck,
+        scrape_options: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> CrawlResult:
+        token = _recording_deferred.set(True)
+        try:
+            result = await super().scrape_until_ready(url, platform, ready, scrape_options, **kwargs)
+        finally:
+            _recording_deferred.reset(token)
+        if result.success and ready(result.raw_html_content or result.html_content or ''):
+            await self._record(url, scrape_options, result)
+        return result
+
+    async def _record(self, url: str, scrape_options: Optional[Dict[str, Any]], result: CrawlResult) -> None:
+        try:
+            await asyncio.to_thread(self.store.save, url, scrape_options, result)
+            self.recorded += 1
+        except OSError as e:
+            logger.warning("Could not record cassette for %s: %s", url, e)
+
+    async def warmup(self, url: str) -> None:
+        await self.inner.warmup(url)
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+
+class ReplayCrawler(BaseCrawler):
+    """
+    Serves recorded results from a CassetteStore.
+
+    Each replay waits ``latency`` seconds plus or minus up to ``jitter``, and
+    a fraction ``failure_rate`` of replays fail the way a live scrape would
+    (an unsuccessful CrawlResult). Requests without a cassette fail too.
+    Pass ``seed`` for the same sequence of delays and failures on every run.
+    """
+
+    def __init__(
+        self,
+        store: CassetteStore,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
+        super().__init__(rate_limiter)
+        self.store = store
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self.replayed = 0
+        self.missing = 0
+        self.injected_failures = 0
+
+    def _delay(self) -> float:
+        if not self.jitter:
+            return self.latency
+        return max(0.0, self.latency + self._rng.uniform(-self.jitter, self.jitter))
+
+    async def _scrape(
+        self,
+        url: str,
+        platform: str,
+        scrape_options: Optional[Dict[str, Any]] = None
+    ) -> CrawlResult:
+        delay = self._delay()
+        fail = self.failure_rate > 0 and self._rng.random() < self.failure_rate
+        if delay:
+            await asyncio.sleep(delay)
+
+        if fail:
+            self.injected_failures += 1
+            return self._failure(url, platform, delay, f"Injected replay failure for {url}")
+
+        recorded = await asyncio.to_thread(self.store.load, url, scrape_options)
+        if recorded is None:
+            self.missing += 1
+            logger.warning("No cassette recorded for %s in %s", url, self.store.directory)
+            return self._failure(url, platform, delay, f"No cassette recorded for {url}")
+
+        self.replayed += 1
+        return recorded.model_copy(update={
+            'platform': platform,
+            'crawled_at': datetime.utcnow(),
+            'crawl_duration': delay,
+        })
+
+    @staticmethod
+    def _failure(url: str, platform: str, delay: float, message: str) -> CrawlResult:
+        return CrawlResult(
+            platform=platform,
+            url=url,
+            success=False,
+            error_message=message,
+            crawled_at=datetime.utcnow(),
+            crawl_duration=delay,
+        )
@@ -0,0 +1,66 @@
+"""
+Per-profile scrape statistics.
+"""
+
+from typing import Any, Dict, Optional
+
+
+class _ProfileCounters:
+    __slots__ = ("scrapes", "failures", "content_bytes", "scrape_seconds", "usable", "usable_seconds")
+
+    def __init__(self):
+        self.scrapes = 0
+        self.failures = 0
+        self.content_bytes = 0
+        self.scrape_seconds = 0.0
+        self.usable = 0
+        self.usable_seconds = 0.0
+
+
+class ScrapeStats:
+    """
+    Bytes transferred and timings for each scrape profile.
+
+    ``record_scrape`` is called by crawlers when a scrape returns;
+    ``record_usable`` by providers once the content has actually been parsed
+    into something usable, so the two together show how long each profile
+    takes to produce a result and how much it downloads to do so.
+    """
+
+    def __init__(self):
+        self._profiles: Dict[str, _ProfileCounters] = {}
+
+    def _counters(self, profile: Optional[str]) -> _ProfileCounters:
+        key = profile or "default"
+        counters = self._profiles.get(key)
+        if counters is None:
+            counters = self._profiles[key] = _ProfileCounters()
+        return counters
+
+    def record_scrape(self, profile: Optional[str], content_bytes: int, seconds: float, success: bool) -> None:
+        counters = self._counters(profile)
+        counters.scrapes += 1
+        counters.scrape_seconds += seconds
+        counters.content_bytes += content_bytes
+        if not success:
+            counters.failures += 1
+
+    def record_usable(self, profile: Optional[str], seconds: float) -> None:
+        counters = self._counters(profile)
+        counters.usable += 1
+        counters.usable_seconds += seconds
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Totals and averages per profile."""
+        result = {}
+        for name, c in self._profiles.items():
+            result[name] = {
+                'scrapes': c.scrapes,
+                'failures': c.failures,
+                'content_bytes': c.content_bytes,
+                'avg_content_bytes': c.content_bytes / c.scrapes if c.scrapes else 0,
+                'avg_scrape_seconds': c.scrape_seconds / c.scrapes if c.scrapes else 0.0,
+                'usable': c.usable,
+                'avg_time_to_usable': c.usable_seconds / c.usable if c.usable else 0.0,
+            }
+        return result
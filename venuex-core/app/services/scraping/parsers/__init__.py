@@ -0,0 +1,16 @@
+"""
+Parsers for content returned by crawlers.
+"""
+
+from .json_decode import BACKEND as JSON_BACKEND, loads, make_selective_decoder
+from .next_data import extract_next_data, find_next_data
+from .playo_schema import decode_playo_next_data
+
+__all__ = [
+    'JSON_BACKEND',
+    'loads',
+    'make_selective_decoder',
+    'extract_next_data',
+    'find_next_data',
+    'decode_playo_next_data'
+]
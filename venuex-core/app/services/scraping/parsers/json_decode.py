@@ -0,0 +1,72 @@
+"""
+JSON decoding with the fastest available backend.
+
+``msgspec`` is preferred: besides being fast it can decode into a typed
+schema and skip every key the schema does not mention, so unused parts of a
+large document are never materialised as Python objects. ``orjson`` is used
+for full decodes when msgspec is missing, and the stdlib ``json`` module is
+the last resort. Both optional packages are listed in requirements.txt but
+nothing here requires them.
+"""
+
+import json
+from typing import Any, Callable, Optional, Type
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+if msgspec is not None:
+    BACKEND = 'msgspec'
+    _decoder = msgspec.json.Decoder()
+
+    def _loads(payload):
+        try:
+            return _decoder.decode(payload)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+elif orjson is not None:
+    BACKEND = 'orjson'
+
+    def _loads(payload):
+        return orjson.loads(payload)
+else:
+    BACKEND = 'json'
+    _loads = json.loads
+
+
+def loads(payload) -> Any:
+    """Decode a complete JSON document; raises ValueError on malformed input."""
+    return _loads(payload)
+
+
+def make_selective_decoder(schema: Type) -> Callable[[Any], Any]:
+    """
+    Build a decoder that only materialises the parts of a document described
+    by ``schema`` (a TypedDict hierarchy), falling back to a full decode when
+    msgspec is unavailable or the document does not match the schema.
+
+    Either way the result is plain dicts and lists, so callers navigate it
+    the same way.
+    """
+    typed: Optional[Any] = msgspec.json.Decoder(schema) if msgspec is not None else None
+
+    def decode(payload):
+        if typed is not None:
+            try:
+                return typed.decode(payload)
+            except msgspec.ValidationError:
+                # Unexpected shape (e.g. a null list); decode everything instead
+                pass
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+        return _loads(payload)
+
+    return decode
@@ -0,0 +1,69 @@
+"""
+Locate and slice the Next.js ``__NEXT_DATA__`` payload out of a page.
+
+Pages can be several MB, so the payload is found with plain ``str.find``
+calls that walk the document once, and only the JSON text itself is
+copied out.
+"""
+
+import re
+from typing import Optional, Tuple
+
+_ID_MARKERS = ('id="__NEXT_DATA__"', "id='__NEXT_DATA__'", 'id=__NEXT_DATA__')
+_SCRIPT_CLOSE = '</script'
+
+_ENTITIES = {'&quot;': '"', '&amp;': '&', '&lt;': '<', '&gt;': '>'}
+_ENTITY_RE = re.compile('&(?:quot|amp|lt|gt);')
+
+
+def find_next_data(html: str) -> Optional[Tuple[int, int]]:
+    """
+    Return the ``(start, end)`` offsets of the ``__NEXT_DATA__`` script body,
+    or None if the page has no such script tag.
+    """
+    for marker in _ID_MARKERS:
+        marker_at = html.find(marker)
+        if marker_at != -1:
+            break
+    else:
+        return None
+
+    # The marker must sit inside a <script ...> opening tag
+    tag_start = html.rfind('<', 0, marker_at)
+    if tag_start == -1 or not html.startswith('<script', tag_start):
+        return None
+
+    body_start = html.find('>', marker_at + len(marker))
+    if body_start == -1:
+        return None
+    body_start += 1
+
+    body_end = html.find(_SCRIPT_CLOSE, body_start)
+    if body_end == -1:
+        return None
+    return body_start, body_end
+
+
+def extract_next_data(html: str) -> Optional[str]:
+    """
+    Return the JSON text of the ``__NEXT_DATA__`` script, or None.
+
+    Entity unescaping only runs when the payload was entity-encoded as a
+    whole (it then starts with ``{&quot;``); a normal JSON payload is
+    returned untouched, so ``&amp;`` inside its strings is preserved.
+    """
+    bounds = find_next_data(html)
+    if bounds is None:
+        return None
+
+    start, end = bounds
+    # Skip leading whitespace without copying the payload
+    while start < end and html[start].isspace():
+        start += 1
+    if start == end:
+        return None
+
+    payload = html[start:end]
+    if payload.startswith('{&quot;'):
+        payload = _ENTITY_RE.sub(lambda m: _ENTITIES[m.group(0)], payload)
+    return payload
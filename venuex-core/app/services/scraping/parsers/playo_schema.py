@@ -0,0 +1,60 @@
+"""
+The parts of Playo's ``__NEXT_DATA__`` payload that PlayoProvider reads.
+
+Only ``props.pageProps.listData.data.venueList`` and
+``props.pageProps.allSports.list`` are described; everything else on the
+page is skipped during decoding. Leaf values are typed ``Any`` so that odd
+values (nulls, ints for floats) still reach the parser, which already
+tolerates them.
+"""
+
+from typing import Any, List, TypedDict
+
+from .json_decode import make_selective_decoder
+
+
+class PlayoVenuePayload(TypedDict, total=False):
+    id: Any
+    name: Any
+    area: Any
+    city: Any
+    address: Any
+    isBookable: Any
+    avgRating: Any
+    ratingCount: Any
+    sports: Any
+    activeKey: Any
+    distance: Any
+
+
+class PlayoSportPayload(TypedDict, total=False):
+    sportId: Any
+    name: Any
+
+
+class _VenueListData(TypedDict, total=False):
+    venueList: List[PlayoVenuePayload]
+
+
+class _ListData(TypedDict, total=False):
+    data: _VenueListData
+
+
+class _AllSports(TypedDict, total=False):
+    list: List[PlayoSportPayload]
+
+
+class _PageProps(TypedDict, total=False):
+    listData: _ListData
+    allSports: _AllSports
+
+
+class _Props(TypedDict, total=False):
+    pageProps: _PageProps
+
+
+class PlayoNextData(TypedDict, total=False):
+    props: _Props
+
+
+decode_playo_next_data = make_selective_decoder(PlayoNextData)
@@ -0,0 +1,56 @@
+"""
+Exponentially decayed query counts per listing.
+"""
+
+import math
+import time
+from typing import Callable, Dict, Hashable, List, Tuple
+
+
+class PopularityTracker:
+    """
+    Counts queries per key, halving each count every ``half_life`` seconds.
+
+    Recent traffic therefore outweighs old traffic without keeping a history
+    of individual queries. At most ``max_keys`` keys are tracked; the least
+    popular is dropped when a new key would exceed that.
+    """
+
+    def __init__(
+        self,
+        half_life: float = 3600.0,
+        max_keys: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.half_life = half_life
+        self.max_keys = max_keys
+        self._clock = clock
+        self._decay = math.log(2) / half_life if half_life > 0 else 0.0
+        self._scores: Dict[Hashable, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def record(self, key: Hashable, weight: float = 1.0) -> None:
+        """Count one query for ``key``."""
+        now = self._clock()
+        if key not in self._scores and len(self._scores) >= self.max_keys:
+            coldest = min(self._scores, key=lambda k: self._score_at(k, now))
+            del self._scores[coldest]
+        self._scores[key] = (self._score_at(key, now) + weight, now)
+
+    def score(self, key: Hashable) -> float:
+        return self._score_at(key, self._clock())
+
+    def top(self, n: int) -> List[Tuple[Hashable, float]]:
+        """The ``n`` most popular keys with their current scores, highest first."""
+        now = self._clock()
+        ranked = sorted(((key, self._score_at(key, now)) for key in self._scores), key=lambda item: -item[1])
+        return ranked[:n]
+
+    def _score_at(self, key: Hashable, now: float) -> float:
+        entry = self._scores.get(key)
+        if entry is None:
+            return 0.0
+        score, updated_at = entry
+        return score * math.exp(-self._decay * (now - updated_at))
@@ -0,0 +1,190 @@
+"""
+Background scheduler that keeps popular listings warm.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ListingKey = Tuple[str, str]
+
+
+class PrewarmScheduler:
+    """
+    Refreshes the most queried listings before they expire.
+
+    Every ``interval`` seconds the ``top_n`` most popular (provider, city)
+    listings are checked; those missing from the cache or within
+    ``refresh_margin`` seconds of going stale are queued, hottest first,
+    and refreshed. At most ``max_per_cycle`` refreshes run per cycle and
+    ``max_per_hour`` per rolling hour, so pre-warming never spends more than
+    that scrape budget. On start the ``startup_locations`` are warmed first.
+    """
+
+    def __init__(
+        self,
+        service,
+        interval: float = 60.0,
+        refresh_margin: float = 60.0,
+        top_n: int = 10,
+        max_per_cycle: int = 3,
+        max_per_hour: int = 60,
+        startup_locations: Sequence[str] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.service = service
+        self.interval = interval
+        self.refresh_margin = refresh_margin
+        self.top_n = top_n
+        self.max_per_cycle = max_per_cycle
+        self.max_per_hour = max_per_hour
+        self.startup_locations = list(startup_locations)
+        self._clock = clock
+
+        self._task: Optional[asyncio.Task] = None
+        self._spent: Deque[float] = deque()
+        self.queue: List[Dict[str, Any]] = []
+
+        self.cycles = 0
+        self.refreshed = 0
+        self.failed = 0
+        self.over_budget = 0
+        self.last_cycle_at: Optional[float] = None
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the scheduler loop on the running event loop."""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the loop and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        if self.startup_locations:
+            await self.warm(self.startup_locations)
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_cycle()
+            except Exception as e:
+                logger.warning("Pre-warm cycle failed: %s", e)
+
+    async def warm(self, locations: Sequence[str], provider_name: Optional[str] = None) -> None:
+        """Load listings that are not cached yet, within the scrape budget."""
+        provider_name = provider_name or self.service.default_provider
+        keys = [
+            (provider_name, location.lower())
+            for location in locations
+            if (provider_name, location.lower()) not in self.service.cache
+        ]
+        await self._refresh_all(keys)
+
+    async def run_cycle(self) -> None:
+        """Queue due listings by popularity and refresh as many as the budget allows."""
+        self.cycles += 1
+        self.last_cycle_at = self._clock()
+        self.queue = self._due()
+        keys = [entry['key'] for entry in self.queue[:self.max_per_cycle]]
+        self.over_budget += max(len(self.queue) - self.max_per_cycle, 0)
+        await self._refresh_all(keys)
+
+    def _due(self) -> List[Dict[str, Any]]:
+        """Popular listings that are missing or about to go stale, hottest first."""
+        refresh_at = self.service.cache.ttl - self.refresh_margin
+        due = []
+        for key, score in self.service.popularity.top(self.top_n):
+            age = self.service.cache.age(key)
+            if age is None or age >= refresh_at:
+                lag = max(age - refresh_at, 0.0) if age is not None else 0.0
+                due.append({'key': key, 'score': score, 'age': age, 'lag': lag})
+        return due
+
+    async def _refresh_all(self, keys: List[ListingKey]) -> None:
+        allowed = []
+        for key in keys:
+            if not self._take_budget():
+                self.over_budget += 1
+                continue
+            allowed.append(key)
+        if not allowed:
+            return
+
+        lags = [entry['lag'] for entry in self.queue if entry['key'] in allowed]
+        if lags:
+            self.last_lag = max(lags)
+            self.max_lag = max(self.max_lag, self.last_lag)
+
+        results = await asyncio.gather(
+            *(self.service.refresh(location, provider_name) for provider_name, location in allowed),
+            return_exceptions=True,
+        )
+        for (provider_name, location), result in zip(allowed, results):
+            if isinstance(result, BaseException):
+                self.failed += 1
+                logger.warning("Pre-warming %s/%s failed: %s", provider_name, location, result)
+            else:
+                self.refreshed += 1
+        self.queue = [entry for entry in self.queue if entry['key'] not in allowed]
+
+    def _take_budget(self) -> bool:
+        now = self._clock()
+        while self._spent and now - self._spent[0] >= 3600:
+            self._spent.popleft()
+        if len(self._spent) >= self.max_per_hour:
+            return False
+        self._spent.append(now)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue contents, refresh lag and budget use."""
+        now = self._clock()
+        return {
+            'running': self.running,
+            'cycles': self.cycles,
+            'queue_depth': len(self.queue),
+            'queue': [
+                {'listing': ':'.join(entry['key']), 'score': entry['score'], 'age': entry['age'], 'lag': entry['lag']}
+                for entry in self.queue
+            ],
+            'refreshed': self.refreshed,
+            'failed': self.failed,
+            'over_budget': self.over_budget,
+            'budget_used_last_hour': sum(1 for t in self._spent if now - t < 3600),
+            'budget_per_hour': self.max_per_hour,
+            'last_lag': self.last_lag,
+            'max_lag': self.max_lag,
+            'seconds_since_last_cycle': now - self.last_cycle_at if self.last_cycle_at is not None else None,
+        }
+
+
+def create_prewarm_scheduler(service) -> PrewarmScheduler:
+    """Build a scheduler for ``service`` from the PREWARM_* settings."""
+    return PrewarmScheduler(
+        service,
+        interval=settings.prewarm_interval_seconds,
+        refresh_margin=settings.prewarm_refresh_margin_seconds,
+        top_n=settings.prewarm_top_n,
+        max_per_cycle=settings.prewarm_max_refreshes_per_cycle,
+        max_per_hour=settings.prewarm_max_refreshes_per_hour,
+        startup_locations=settings.prewarm_startup_cities,
+    )
@@ -2,24 +2,30 @@
 Sports venue scraping providers.
 """
 
-from .factory import ProviderFactory, provider_factory
+from typing import Optional
+
+import httpx
+
+from .factory import ProviderFactory
 from .playo_provider import PlayoProvider, create_playo_config
 
-# Register providers on import
-def register_default_providers():
-    """Register all default providers with the factory."""
+def register_default_providers(factory: ProviderFactory) -> None:
+    """Register all default providers with ``factory``."""
     
     # Register Playo provider
     playo_config = create_playo_config()
-    provider_factory.register_provider(PlayoProvider, playo_config)
+    factory.register_provider(PlayoProvider, playo_config)
 
-# Auto-register providers when module is imported
-register_default_providers()
+def create_provider_factory(http_client: Optional[httpx.AsyncClient] = None) -> ProviderFactory:
+    """A new factory with the default providers registered, sharing ``http_client``."""
+    factory = ProviderFactory(http_client)
+    register_default_providers(factory)
+    return factory
 
 __all__ = [
     'ProviderFactory', 
-    'provider_factory',
     'PlayoProvider',
     'create_playo_config',
+    'create_provider_factory',
     'register_default_providers'
 ] 
\ No newline at end of file
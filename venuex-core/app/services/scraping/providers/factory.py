@@ -2,23 +2,37 @@
 Factory for creating and managing sports venue scraping providers.
 """
 
+import asyncio
+import logging
 from typing import Dict, List, Optional, Type
+
+import httpx
+
 from ..base.provider import BaseProvider
 from ..base.models import ProviderConfig
 
+logger = logging.getLogger(__name__)
+
 
 class ProviderFactory:
-    """Factory for creating and managing scraping providers."""
+    """
+    Factory for creating and managing scraping providers.
+
+    Providers are created with ``http_client``, the connection pool their
+    direct-fetch crawlers share; the factory does not close it.
+    """
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[httpx.AsyncClient] = None):
+        self.http_client = http_client
         self._providers: Dict[str, Type[BaseProvider]] = {}
         self._configs: Dict[str, ProviderConfig] = {}
         self._instances: Dict[str, BaseProvider] = {}
     
     def register_provider(self, provider_class: Type[BaseProvider], config: ProviderConfig):
-        """Register a new provider with its configuration."""
+        """Register a new provider with its configuration, replacing any provider of the same name."""
         self._providers[config.name] = provider_class
         self._configs[config.name] = config
+        self._instances.pop(config.name, None)
     
     def get_provider(self, name: str) -> Optional[BaseProvider]:
         """Get a provider instance by name."""
@@ -26,7 +40,7 @@ class ProviderFactory:
             if name in self._providers and name in self._configs:
                 config = self._configs[name]
                 if config.enabled:
-                    self._instances[name] = self._providers[name](config)
+                    self._instances[name] = self._providers[name](config, http_client=self.http_client)
                 else:
                     return None
             else:
@@ -43,10 +57,34 @@ class ProviderFactory:
                 providers.append(provider)
         return providers
     
+    async def warmup(self, timeout: Optional[float] = None) -> None:
+        """
+        Create every enabled provider and pre-connect its crawler.
+
+        Providers warm concurrently; a provider that fails or is still
+        warming after ``timeout`` seconds is logged and left to connect on
+        its first scrape.
+        """
+        providers = self.get_all_providers()
+        results = await asyncio.gather(
+            *(asyncio.wait_for(p.warmup(), timeout) for p in providers),
+            return_exceptions=True
+        )
+        for provider, result in zip(providers, results):
+            if isinstance(result, asyncio.TimeoutError):
+                logger.warning("Warming up %s timed out after %.1fs", provider.name, timeout)
+            elif isinstance(result, Exception):
+                logger.warning("Warming up %s failed: %s", provider.name, result)
+    
+    async def close(self) -> None:
+        """Close every provider instance; later lookups create fresh ones."""
+        instances, self._instances = list(self._instances.values()), {}
+        for provider in instances:
+            try:
+                await provider.close()
+            except Exception as e:
+                logger.warning("Closing %s failed: %s", provider.name, e)
+    
     def get_available_provider_names(self) -> List[str]:
         """Get list of available provider names."""
         return [name for name, config in self._configs.items() if config.enabled]
-
-
-# Global provider factory instance
-provider_factory = ProviderFactory() 
\ No newline at end of file
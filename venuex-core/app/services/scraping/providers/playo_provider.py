@@ -2,15 +2,24 @@
 Playo.co provider for sports venue scraping.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import logging
 import re
-import json
+import time
 from datetime import datetime
+
+import httpx
 from pydantic import BaseModel, Field
 
+from app.core.metrics import observe_stage
+
 from ..base.provider import BaseProvider, ProviderError
-from ..base.models import ProviderConfig, VenueInfo
-from ..crawlers.firecrawl_crawler import FirecrawlCrawler
+from ..base.models import CrawlResult, ProviderConfig, ScrapeProfile, VenueInfo
+from ..crawlers import create_crawler
+from ..parsers import decode_playo_next_data, extract_next_data
+from ..snapshots import content_hash
+
+logger = logging.getLogger(__name__)
 
 
 class PlayoVenueInfo(BaseModel):
@@ -29,12 +38,22 @@ class PlayoVenueInfo(BaseModel):
     distance: Optional[float] = Field(description="Distance from search location")
 
 
+# Start of a non-empty venue list, plain or entity-escaped
+_VENUE_LIST_RE = re.compile(r'venueList(?:"|&quot;)\s*:\s*\[\s*\{')
+
+
+def _as_str(value: Any) -> str:
+    if value is None:
+        return ''
+    return value if isinstance(value, str) else str(value)
+
+
 class PlayoProvider(BaseProvider):
     """Provider for scraping Playo.co sports venue booking URLs."""
     
-    def __init__(self, config: ProviderConfig):
-        super().__init__(config)
-        self.crawler = FirecrawlCrawler()
+    def __init__(self, config: ProviderConfig, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(config, http_client)
+        self.crawler = create_crawler(self.name, rate_limiter=self.rate_limiter, http_client=http_client)
     
     @property
     def supported_cities(self) -> List[str]:
@@ -49,31 +68,35 @@ class PlayoProvider(BaseProvider):
         # Playo's URL structure: https://playo.co/venues/{locality}/sports/all
         return f"{self.config.base_url}/venues/{mapped_locality}/sports/all"
     
-    def get_crawl_config(self) -> Dict[str, Any]:
-        """Get Playo-specific scrape configuration."""
-        return {
-            'formats': ['rawHtml', 'html'],  # Use rawHtml to get unmodified content
-            'timeout': 30000,  # 30 second timeout
-            'actions': [
-                {"type": "wait", "milliseconds": 3000},  # Wait for page to load
-                {"type": "scrape"}  # Then scrape the content
-            ]
-        }
+    def page_ready(self, html: str) -> bool:
+        """Ready once the __NEXT_DATA__ script holds a non-empty venue list."""
+        start = html.find('__NEXT_DATA__')
+        return start >= 0 and _VENUE_LIST_RE.search(html, start) is not None
+    
+    def get_crawl_config(self, profile: Optional[str] = None) -> Dict[str, Any]:
+        """Get Playo-specific scrape configuration for a named scrape profile."""
+        profile = profile or self.config.default_scrape_profile
+        scrape_profile = self.config.scrape_profiles.get(profile)
+        if scrape_profile is None:
+            raise ProviderError(f"Unknown scrape profile '{profile}' for {self.name}")
+        return scrape_profile.to_scrape_options()
     
     async def get_booking_urls(self, locality: str) -> List[str]:
         """Get booking URLs for all bookable venues in the locality."""
         try:
             # Build the URL for the locality
             url = self.build_url(locality)
-            scrape_config = self.get_crawl_config()
+            profile = self.config.default_scrape_profile
+            scrape_config = self.get_crawl_config(profile)
             
-            print(f"DEBUG: Crawling URL: {url}")
+            logger.debug("Crawling URL: %s", url)
             
             # Scrape the main venue listing page
             result = await self.crawler.scrape_single_url(
                 url, 
                 self.name,
-                scrape_config
+                scrape_config,
+                profile=profile
             )
             
             if not result.success:
@@ -85,16 +108,16 @@ class PlayoProvider(BaseProvider):
             if not html_content:
                 raise ProviderError("No HTML content received from Playo")
             
-            print(f"DEBUG: HTML content length: {len(html_content)}")
+            logger.debug("HTML content length: %d", len(html_content))
             
             # Extract JSON data from HTML
             json_data = self._extract_json_from_html(html_content)
             if not json_data:
                 # Try fallback HTML parsing approach
-                print("Trying fallback HTML parsing approach...")
+                logger.debug("No __NEXT_DATA__ for %s; trying fallback HTML parsing", locality)
                 venues = self._parse_html_content_fallback(html_content, locality)
                 if venues:
-                    print(f"Fallback parsing found {len(venues)} venues")
+                    logger.debug("Fallback parsing found %d venues", len(venues))
                     booking_urls = [venue.booking_url for venue in venues if venue.is_bookable]
                     return booking_urls
                 else:
@@ -115,7 +138,7 @@ class PlayoProvider(BaseProvider):
             # Filter for bookable venues and return URLs
             booking_urls = [venue.booking_url for venue in venues if venue.is_bookable]
             
-            print(f"DEBUG: Found {len(booking_urls)} bookable venues")
+            logger.debug("Found %d bookable venues", len(booking_urls))
             
             return booking_urls
             
@@ -126,107 +149,152 @@ class PlayoProvider(BaseProvider):
         """Get detailed venue information for the given location."""
         try:
             url = self.build_url(location)
-            scrape_config = self.get_crawl_config()
-            
-            result = await self.crawler.scrape_single_url(url, self.name, scrape_config)
-            
-            if not result.success:
-                raise ProviderError(f"Failed to scrape Playo venue listing: {result.error_message}")
-            
-            html_content = result.raw_html_content or result.html_content or ""
-            
-            if not html_content:
-                raise ProviderError("No HTML content received from Playo")
-            
-            json_data = self._extract_json_from_html(html_content)
+            profile = self.config.default_scrape_profile
+            scrape_config = self.get_crawl_config(profile)
+            start_time = time.monotonic()
+            
+            # Crawlers with a fallback (e.g. direct HTTP before Firecrawl) get
+            # retried down the chain until one returns a usable page
+            crawler = self.crawler
+            while True:
+                result = await crawler.scrape_until_ready(
+                    url, self.name, self.page_ready, scrape_config,
+                    profile=profile, city=location, max_wait=self.config.ready_max_wait,
+                    max_attempts=self.config.ready_max_attempts
+                )
+                json_content, error = self._next_data_from(result, location)
+                if json_content is not None:
+                    break
+                if crawler.fallback is None:
+                    raise ProviderError(error)
+                logger.info("%s; retrying with %s", error, type(crawler.fallback).__name__)
+                crawler = crawler.fallback
+            crawler.stats.record_usable(profile, time.monotonic() - start_time)
+            
+            # An identical payload parses to identical venues; reuse the last ones
+            digest = content_hash(json_content)
+            unchanged = self.snapshots.unchanged(location, digest)
+            if unchanged is not None:
+                return unchanged
+            
+            with observe_stage('decode', self.name, location):
+                json_data = self._decode_next_data(json_content)
+            del json_content
             if not json_data:
                 raise ProviderError("Could not extract JSON data from Playo page")
             
-            playo_venues = self._parse_venue_data(json_data)
-            sport_mapping = self._get_sport_names(json_data)
-            
-            # Convert PlayoVenueInfo to VenueInfo
-            venues = []
-            for playo_venue in playo_venues:
-                # Map sport IDs to sport names
-                sport_names = []
-                for sport_id in playo_venue.sports:
-                    sport_name = sport_mapping.get(sport_id, sport_id)
-                    sport_names.append(sport_name)
-                
-                venue = VenueInfo(
-                    platform=self.name,
-                    venue_id=playo_venue.id,
-                    name=playo_venue.name,
-                    city=playo_venue.city,
-                    area=playo_venue.area,
-                    address=playo_venue.address,
-                    sports_offered=sport_names,
-                    rating=playo_venue.avg_rating,
-                    rating_count=playo_venue.rating_count,
-                    is_bookable=playo_venue.is_bookable,
-                    booking_url=playo_venue.booking_url,
-                    venue_url=f"https://playo.co/venue/{playo_venue.active_key}" if playo_venue.active_key else None,
-                    distance=playo_venue.distance
-                )
-                venues.append(venue)
+            with observe_stage('convert', self.name, location):
+                venues = self._build_venues(json_data)
+            self.snapshots.record(location, digest, venues)
             
             return venues
             
         except Exception as e:
             raise ProviderError(f"Failed to get venue details from Playo: {str(e)}")
     
+    def _next_data_from(self, result: CrawlResult, location: str) -> Tuple[Optional[str], str]:
+        """The __NEXT_DATA__ payload of a scraped page, or None and the reason it is unusable."""
+        if not result.success:
+            return None, f"Failed to scrape Playo venue listing: {result.error_message}"
+        
+        html_content = result.raw_html_content or result.html_content or ""
+        # The page is only needed until the JSON has been extracted; drop
+        # every rendering now so multi-MB strings are not kept alive
+        result.raw_html_content = result.html_content = result.markdown_content = None
+        
+        if not html_content:
+            return None, "No HTML content received from Playo"
+        # A page still loading has no venues yet; parsing it would cache and
+        # snapshot an empty listing as if every venue had gone
+        if not self.page_ready(html_content):
+            return None, "Playo page was not ready (no venues in __NEXT_DATA__)"
+        
+        with observe_stage('extract', self.name, location):
+            json_content = self._extract_next_data_payload(html_content)
+        if json_content is None:
+            return None, "Could not extract JSON data from Playo page"
+        return json_content, ""
+    
     def _extract_json_from_html(self, html_content: str) -> Optional[Dict[str, Any]]:
         """
         Extract the __NEXT_DATA__ JSON from the HTML content.
         """
+        json_content = self._extract_next_data_payload(html_content)
+        if json_content is None:
+            return None
+        return self._decode_next_data(json_content)
+    
+    def _extract_next_data_payload(self, html_content: str) -> Optional[str]:
+        """The raw __NEXT_DATA__ JSON text, or None if the page has none."""
+        json_content = extract_next_data(html_content)
+        if json_content is None:
+            logger.warning("Could not find __NEXT_DATA__ script tag")
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_missing_next_data(html_content)
+        return json_content
+    
+    def _decode_next_data(self, json_content: str) -> Optional[Dict[str, Any]]:
         try:
-            # Debug: Check if __NEXT_DATA__ exists in the content
-            if '__NEXT_DATA__' in html_content:
-                print("✅ Found __NEXT_DATA__ in HTML content")
-            else:
-                print("❌ __NEXT_DATA__ not found in HTML content")
-                # Let's check what script tags are available
-                script_matches = re.findall(r'<script[^>]*id="([^"]*)"[^>]*>', html_content)
-                print(f"Available script IDs: {script_matches[:10]}")  # Show first 10
-                
-                # Check for any Next.js related patterns
-                next_patterns = re.findall(r'<script[^>]*>(.*?Next.*?)</script>', html_content, re.DOTALL | re.IGNORECASE)
-                if next_patterns:
-                    print(f"Found {len(next_patterns)} Next.js related scripts")
-                
-                return None
-            
-            # Try multiple patterns for the __NEXT_DATA__ script tag
-            patterns = [
-                r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
-                r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>',
-                r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, html_content, re.DOTALL)
-                if match:
-                    print(f"✅ Found __NEXT_DATA__ with pattern: {pattern}")
-                    json_content = match.group(1).strip()
-                    
-                    # Clean up any HTML entities
-                    json_content = json_content.replace('&quot;', '"').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-                    
-                    return json.loads(json_content)
-            
-            print("❌ Could not find __NEXT_DATA__ script tag with any pattern")
+            # Decodes only the venue list and sport catalogue when msgspec is available
+            return decode_playo_next_data(json_content)
+        except ValueError as e:
+            logger.warning("Failed to parse __NEXT_DATA__ JSON: %s", e)
+            logger.debug("JSON preview: %s", json_content[:500])
             return None
+    
+    def _log_missing_next_data(self, html_content: str) -> None:
+        """Debug-only diagnostics for pages without __NEXT_DATA__; scans the whole page."""
+        script_ids = re.findall(r'<script[^>]*id="([^"]*)"[^>]*>', html_content)
+        logger.debug("Available script IDs: %s", script_ids[:10])
+        next_scripts = re.findall(r'<script[^>]*>(.*?Next.*?)</script>', html_content, re.DOTALL | re.IGNORECASE)
+        if next_scripts:
+            logger.debug("Found %d Next.js related scripts", len(next_scripts))
+    
+    def _build_venues(self, json_data: Dict[str, Any]) -> List[VenueInfo]:
+        """
+        Build VenueInfo objects straight from the raw venue list in one pass.
+        
+        Each venue is validated once, as a VenueInfo, rather than first as a
+        PlayoVenueInfo and again on conversion. Venues without an id or name,
+        or that fail validation, are skipped.
+        """
+        venue_list = json_data.get('props', {}).get('pageProps', {}).get('listData', {}).get('data', {}).get('venueList') or []
+        sport_mapping = self._get_sport_names(json_data)
+        
+        platform = self.name
+        last_updated = datetime.utcnow()
+        venues = []
+        
+        for venue_data in venue_list:
+            try:
+                venue_id = venue_data.get('id')
+                name = venue_data.get('name')
+                if not venue_id or not name:
+                    continue
+                venue_id = str(venue_id)
+                active_key = venue_data.get('activeKey')
                 
-        except json.JSONDecodeError as e:
-            print(f"❌ Failed to parse JSON: {e}")
-            # Print first 500 chars of the content that failed to parse
-            json_preview = json_content[:500] if 'json_content' in locals() else "No content"
-            print(f"JSON preview: {json_preview}")
-            return None
-        except Exception as e:
-            print(f"❌ Error extracting JSON: {e}")
-            return None
+                venues.append(VenueInfo(
+                    platform=platform,
+                    venue_id=venue_id,
+                    name=str(name),
+                    city=_as_str(venue_data.get('city')),
+                    area=_as_str(venue_data.get('area')),
+                    address=_as_str(venue_data.get('address')),
+                    sports_offered=[sport_mapping.get(sport_id, sport_id) for sport_id in venue_data.get('sports') or ()],
+                    rating=venue_data.get('avgRating') or 0.0,
+                    rating_count=venue_data.get('ratingCount') or 0,
+                    is_bookable=venue_data.get('isBookable') or False,
+                    booking_url=f"https://playo.co/booking?venueId={venue_id}",
+                    venue_url=f"https://playo.co/venue/{active_key}" if active_key else None,
+                    distance=venue_data.get('distance'),
+                    last_updated=last_updated,
+                ))
+            except (AttributeError, TypeError, ValueError) as e:
+                logger.debug("Skipping unparseable venue %r: %s", venue_data.get('id') if isinstance(venue_data, dict) else None, e)
+                continue
+        
+        return venues
     
     def _parse_venue_data(self, json_data: Dict[str, Any]) -> List[PlayoVenueInfo]:
         """Parse venue information from the extracted JSON data."""
@@ -237,10 +305,10 @@ class PlayoProvider(BaseProvider):
             venue_list = json_data.get('props', {}).get('pageProps', {}).get('listData', {}).get('data', {}).get('venueList', [])
             
             if not venue_list:
-                print("❌ No venue list found in JSON data")
+                logger.warning("No venue list found in JSON data")
                 return venues
                 
-            print(f"📊 Found {len(venue_list)} venues in JSON data")
+            logger.debug("Found %d venues in JSON data", len(venue_list))
             
             for venue_data in venue_list:
                 try:
@@ -261,11 +329,11 @@ class PlayoProvider(BaseProvider):
                     venues.append(venue)
                     
                 except Exception as e:
-                    print(f"⚠️ Error parsing venue data: {e}")
+                    logger.debug("Skipping unparseable venue: %s", e)
                     continue
                     
         except Exception as e:
-            print(f"❌ Error parsing venue data: {e}")
+            logger.warning("Error parsing venue data: %s", e)
             
         return venues
     
@@ -283,7 +351,7 @@ class PlayoProvider(BaseProvider):
                     sport_mapping[sport_id] = sport_name
                     
         except Exception as e:
-            print(f"⚠️ Error extracting sport names: {e}")
+            logger.warning("Error extracting sport names: %s", e)
             
         return sport_mapping
     
@@ -333,11 +401,11 @@ class PlayoProvider(BaseProvider):
                         )
                         venues.append(venue)
             
-            print(f"Fallback parsing extracted {len(venues)} venue IDs")
+            logger.debug("Fallback parsing extracted %d venue IDs", len(venues))
             return venues
             
         except Exception as e:
-            print(f"Error in fallback HTML parsing: {e}")
+            logger.warning("Error in fallback HTML parsing: %s", e)
             return []
     
     async def health_check(self) -> Dict[str, Any]:
@@ -347,22 +415,23 @@ class PlayoProvider(BaseProvider):
             test_locality = 'mumbai'
             test_url = self.build_url(test_locality)
             
-            result = await self.crawler.scrape_single_url(
+            result = await self.crawler.scrape_until_ready(
                 test_url,
                 self.name,
-                {
-                    'timeout': 15000, 
-                    'formats': ['html'],
-                    'actions': [{"type": "wait", "milliseconds": 3000}]
-                }
+                self.page_ready,
+                self.get_crawl_config('health'),
+                profile='health',
+                max_wait=self.config.ready_max_wait,
+                max_attempts=self.config.ready_max_attempts
             )
             
             return {
                 'provider': self.name,
                 'status': 'healthy' if result.success else 'unhealthy',
+                'ready': result.success and self.page_ready(result.raw_html_content or result.html_content or ''),
                 'test_url': test_url,
                 'response_time': result.crawl_duration,
-                'content_length': len(result.html_content or ''),
+                'content_length': result.content_bytes,
                 'error': result.error_message if not result.success else None,
             }
             
@@ -376,9 +445,10 @@ class PlayoProvider(BaseProvider):
     def get_rate_limit_config(self) -> Dict[str, Any]:
         """Get Playo-specific rate limiting."""
         return {
-            'max_requests_per_minute': 20,  # Conservative for Playo
-            'request_delay': 3.0,  # 3 seconds between requests
-            'burst_limit': 5,  # Max 5 concurrent requests
+            'max_requests_per_minute': self.config.max_requests_per_minute,
+            'request_delay': self.config.request_delay,
+            'burst_limit': self.config.burst_limit,
+            'max_concurrent_requests': self.config.max_concurrent_requests,
         }
 
 
@@ -399,14 +469,28 @@ def create_playo_config() -> ProviderConfig:
             'kochi': 'kochi',
             'kakkanad': 'kakkanad'
         },
-        crawl_config={
-            'formats': ['rawHtml', 'html'],  # Use rawHtml for unmodified content
-            'timeout': 30000,  # 30 second timeout
-            'actions': [
-                {"type": "wait", "milliseconds": 3000},  # Wait for page to load
-                {"type": "scrape"}  # Then scrape the content
-            ]
+        scrape_profiles={
+            # Only rawHtml is parsed; wait for the Next.js payload instead of a fixed sleep
+            'listing': ScrapeProfile(
+                formats=['rawHtml'],
+                timeout=30000,
+                wait_for_selector='#__NEXT_DATA__',
+            ),
+            # Previous behaviour, kept for pages where the selector wait misfires
+            'listing_fixed_wait': ScrapeProfile(
+                formats=['rawHtml'],
+                timeout=30000,
+                wait_ms=3000,
+            ),
+            'health': ScrapeProfile(
+                formats=['rawHtml'],
+                timeout=15000,
+                wait_for_selector='#__NEXT_DATA__',
+            ),
         },
-        max_requests_per_minute=20,
-        request_delay=3.0,
+        default_scrape_profile='listing',
+        max_requests_per_minute=20,  # Conservative for Playo
+        request_delay=3.0,  # 3 seconds between requests
+        burst_limit=5,
+        max_concurrent_requests=5,  # Max 5 concurrent requests
     ) 
\ No newline at end of file
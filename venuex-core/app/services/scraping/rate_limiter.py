@@ -0,0 +1,130 @@
+"""
+Async token-bucket and concurrency-cap limiter for provider requests.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from .base.models import ProviderConfig
+
+
+class RateLimiter:
+    """
+    Limits the request rate and concurrency towards one upstream.
+
+    A token bucket holding up to ``burst`` tokens refills one token every
+    ``interval`` seconds; each request takes one token, waiting for it if the
+    bucket is empty. Independently, at most ``max_concurrency`` requests may
+    be in flight at once. Waiters are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        burst: int = 1,
+        max_concurrency: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ):
+        if interval < 0 or burst < 1 or max_concurrency < 1:
+            raise ValueError("interval must be >= 0 and burst/max_concurrency >= 1")
+        self.interval = interval
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self._clock = clock
+        self._sleep = sleep
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tokens = float(burst)
+        self._updated_at = clock()
+
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.acquired = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @classmethod
+    def from_config(cls, config: ProviderConfig) -> "RateLimiter":
+        """
+        Build a limiter from a provider's rate-limit fields.
+
+        Tokens refill at the slower of ``max_requests_per_minute`` and one per
+        ``request_delay`` seconds; ``burst_limit`` sets the bucket size and
+        ``max_concurrent_requests`` the concurrency cap.
+        """
+        per_minute_interval = 60.0 / config.max_requests_per_minute if config.max_requests_per_minute > 0 else 0.0
+        return cls(
+            interval=max(per_minute_interval, config.request_delay),
+            burst=config.burst_limit,
+            max_concurrency=config.max_concurrent_requests,
+        )
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot and a token."""
+        start = self._clock()
+        self.queue_depth += 1
+        try:
+            await self._semaphore.acquire()
+            try:
+                delay = self._reserve()
+                if delay > 0:
+                    try:
+                        await self._sleep(delay)
+                    except BaseException:
+                        # Hand the reserved token back to the next waiter
+                        self._tokens += 1
+                        raise
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self.queue_depth -= 1
+
+        waited = self._clock() - start
+        self.in_flight += 1
+        self.acquired += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+    def release(self) -> None:
+        """Free the concurrency slot taken by :meth:`acquire`."""
+        self.in_flight -= 1
+        self._semaphore.release()
+
+    async def __aenter__(self) -> "RateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth, in-flight count and wait-time counters."""
+        self._refill()
+        return {
+            'queue_depth': self.queue_depth,
+            'in_flight': self.in_flight,
+            'acquired': self.acquired,
+            'tokens': max(self._tokens, 0.0),
+            'total_wait': self.total_wait,
+            'avg_wait': self.total_wait / self.acquired if self.acquired else 0.0,
+            'max_wait': self.max_wait,
+        }
+
+    def _refill(self) -> None:
+        now = self._clock()
+        if self.interval == 0:
+            self._tokens = float(self.burst)
+        else:
+            self._tokens = min(float(self.burst), self._tokens + (now - self._updated_at) / self.interval)
+        self._updated_at = now
+
+    def _reserve(self) -> float:
+        """Take a token, returning how long to wait until it is actually available."""
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        # The bucket went negative: this caller owns a future token
+        return -self._tokens * self.interval
@@ -0,0 +1,81 @@
+"""
+Single-flight coalescing of concurrent identical calls.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class _KeyStats:
+    __slots__ = ("calls", "executions", "coalesced", "errors")
+
+    def __init__(self):
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            'calls': self.calls,
+            'executions': self.executions,
+            'coalesced': self.coalesced,
+            'errors': self.errors,
+        }
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time.
+
+    Callers that arrive while a call for the same key is in flight await
+    that call instead of starting their own, and receive its result or its
+    exception. The underlying call runs in its own task, so a cancelled
+    caller does not cancel the work the others are waiting on.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._stats: Dict[Hashable, _KeyStats] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` for ``key``, sharing an in-flight call if there is one."""
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _KeyStats()
+        stats.calls += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            stats.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        else:
+            stats.coalesced += 1
+
+        return await asyncio.shield(task)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Whether a call for ``key`` is currently running."""
+        return key in self._inflight
+
+    async def cancel_all(self) -> None:
+        """Cancel every in-flight call and wait for them to finish."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict[Hashable, Dict[str, int]]:
+        """Per-key call, execution and coalescing counters."""
+        return {key: stats.as_dict() for key, stats in self._stats.items()}
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved even if every waiter was cancelled
+        if not task.cancelled() and task.exception() is not None:
+            self._stats[key].errors += 1
@@ -0,0 +1,115 @@
+"""
+Content hashes and venue diffs between consecutive scrapes of a listing.
+"""
+
+import hashlib
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Sequence
+
+from .base.models import VenueChange, VenueDelta, VenueInfo
+
+
+def content_hash(payload: str) -> str:
+    """Digest of an extracted page payload."""
+    return hashlib.blake2b(payload.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+
+def diff_venues(
+    previous: Sequence[VenueInfo],
+    current: Sequence[VenueInfo],
+    sequence: int,
+    provider: str,
+    location: str,
+) -> VenueDelta:
+    """Venues added, removed, or with changed bookability or rating, keyed by venue_id."""
+    before = {venue.venue_id: venue for venue in previous}
+    after = {venue.venue_id: venue for venue in current}
+
+    delta = VenueDelta(sequence=sequence, provider=provider, location=location)
+    delta.added = [venue for venue_id, venue in after.items() if venue_id not in before]
+    delta.removed = [venue_id for venue_id in before if venue_id not in after]
+    for venue_id, new in after.items():
+        old = before.get(venue_id)
+        if old is None:
+            continue
+        if old.is_bookable != new.is_bookable:
+            delta.bookability_changed.append(
+                VenueChange(venue_id=venue_id, name=new.name, before=old.is_bookable, after=new.is_bookable)
+            )
+        if old.rating != new.rating:
+            delta.rating_changed.append(
+                VenueChange(venue_id=venue_id, name=new.name, before=old.rating, after=new.rating)
+            )
+    return delta
+
+
+class _Snapshot:
+    __slots__ = ('digest', 'venues')
+
+    def __init__(self, digest: str, venues: List[VenueInfo]):
+        self.digest = digest
+        self.venues = venues
+
+
+class SnapshotStore:
+    """
+    Last snapshot per location of one provider, plus a log of deltas.
+
+    ``unchanged`` lets a provider skip parsing when the extracted payload
+    hashes the same as last time. ``record`` stores a newly parsed snapshot
+    and appends a delta when the venues differ from the previous one. Deltas
+    carry increasing sequence numbers, so consumers poll ``deltas_since``
+    with the last sequence they saw.
+    """
+
+    def __init__(self, provider: str, max_deltas: int = 1000):
+        self.provider = provider
+        self._snapshots: Dict[str, _Snapshot] = {}
+        self._deltas: Deque[VenueDelta] = deque(maxlen=max_deltas)
+        self._sequence = 0
+
+        self.unchanged_hits = 0
+        self.changed = 0
+
+    def unchanged(self, location: str, digest: str) -> Optional[List[VenueInfo]]:
+        """The previous venues if ``digest`` matches the last snapshot, else None."""
+        snapshot = self._snapshots.get(location)
+        if snapshot is None or snapshot.digest != digest:
+            return None
+        self.unchanged_hits += 1
+        return list(snapshot.venues)
+
+    def record(self, location: str, digest: str, venues: List[VenueInfo]) -> Optional[VenueDelta]:
+        """Store a parsed snapshot; returns the delta against the previous one, if any."""
+        previous = self._snapshots.get(location)
+        self._snapshots[location] = _Snapshot(digest, list(venues))
+        if previous is None:
+            return None
+
+        delta = diff_venues(previous.venues, venues, self._sequence + 1, self.provider, location)
+        if delta.is_empty:
+            return None
+        self.changed += 1
+        self._sequence = delta.sequence
+        self._deltas.append(delta)
+        return delta
+
+    def deltas_since(self, sequence: int = 0, location: Optional[str] = None) -> List[VenueDelta]:
+        """Deltas newer than ``sequence``, oldest first, optionally for one location."""
+        return [
+            delta for delta in self._deltas
+            if delta.sequence > sequence and (location is None or delta.location == location)
+        ]
+
+    @property
+    def last_sequence(self) -> int:
+        return self._sequence
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'snapshots': len(self._snapshots),
+            'unchanged_hits': self.unchanged_hits,
+            'changed': self.changed,
+            'deltas': len(self._deltas),
+            'last_sequence': self._sequence,
+        }
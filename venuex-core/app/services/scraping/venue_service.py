@@ -2,63 +2,357 @@
 Venue service abstraction for getting venue details from providers.
 """
 
-from typing import List, Optional
-from .base import VenueInfo, ProviderError
-from .providers import provider_factory
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.core.metrics import observe_stage
+
+from .base import AggregatedVenues, ProviderError, ProviderOutcome, VenueDelta, VenueInfo, VenueListing
+from .base.provider import BaseProvider
+from .cache import CacheState, TTLCache, create_venue_cache
+from .catalog import VenueCatalog, create_venue_catalog
+from .popularity import PopularityTracker
+from .providers import ProviderFactory
+from .singleflight import SingleFlight
+
+logger = logging.getLogger(__name__)
 
 
 class VenueService:
     """Service for getting venue details from providers."""
-    
-    def __init__(self, default_provider: str = "playo"):
-        """Initialize venue service with default provider."""
+
+    def __init__(
+        self,
+        provider_factory: ProviderFactory,
+        default_provider: str = "playo",
+        cache: Optional[TTLCache] = None,
+        catalog: Optional[VenueCatalog] = None,
+        catalog_max_age: Optional[float] = None,
+    ):
+        """Initialize venue service with the providers of ``provider_factory``."""
+        self.provider_factory = provider_factory
         self.default_provider = default_provider
-    
+        self.catalog = catalog
+        self.catalog_max_age = (
+            catalog_max_age if catalog_max_age is not None else settings.venue_catalog_max_age_seconds
+        )
+        self.cache = cache if cache is not None else create_venue_cache(
+            ttl=settings.venue_cache_ttl_seconds,
+            stale_ttl=settings.venue_cache_stale_seconds,
+            max_entries=settings.venue_cache_max_entries,
+            max_bytes=settings.venue_cache_max_bytes,
+        )
+        self.single_flight = SingleFlight()
+        self.popularity = PopularityTracker(half_life=settings.prewarm_popularity_half_life_seconds)
+        self._refresh_tasks: Dict[Tuple[str, str], asyncio.Task] = {}
+
     async def get_venue_details(self, location: str, provider_name: Optional[str] = None) -> List[VenueInfo]:
         """
         Get venue details for a location.
-        
+
+        Fresh cached listings are returned directly. Stale listings are
+        returned immediately while a single background refresh runs. On a
+        cache miss a recent enough listing from the catalog is used before
+        falling back to a scrape.
+
         Args:
             location: City or location name (e.g., 'mumbai', 'delhi')
             provider_name: Specific provider to use (defaults to self.default_provider)
-            
+
         Returns:
             List of VenueInfo objects
-            
+
         Raises:
             ProviderError: If provider fails or is not available
         """
+        listing = await self.get_venue_listing(location, provider_name)
+        return list(listing.venues)
+
+    async def get_venue_listing(self, location: str, provider_name: Optional[str] = None) -> VenueListing:
+        """
+        Get the cached VenueListing for a location, loading it if needed.
+
+        The listing is shared between requests; its records and per-sport
+        matches are built once per scrape.
+        """
         provider_name = provider_name or self.default_provider
-        
-        provider = provider_factory.get_provider(provider_name)
+        with observe_stage('venue_listing', provider_name, location.lower()):
+            return await self._get_venue_listing(location, provider_name)
+
+    async def _get_venue_listing(self, location: str, provider_name: str) -> VenueListing:
+
+        provider = self.provider_factory.get_provider(provider_name)
         if not provider:
             raise ProviderError(f"Provider '{provider_name}' not available or disabled")
-        
+
+        location = location.lower()
+
         # Check if provider supports the location
-        if location.lower() not in provider.supported_cities:
+        if location not in provider.supported_cities:
             raise ProviderError(f"Provider '{provider_name}' does not support location '{location}'")
-        
+
+        key = (provider_name, location)
+        self.popularity.record(key)
+        cached, state = self.cache.get(key)
+        if state is CacheState.FRESH:
+            return cached
+        if state is CacheState.STALE:
+            self._schedule_refresh(key, provider)
+            return cached
+
+        return await self._fetch(provider, location, use_catalog=True)
+
+    def get_providers_for_location(self, location: str) -> List[BaseProvider]:
+        """All enabled providers that support the location."""
+        location = location.lower()
+        return [p for p in self.provider_factory.get_all_providers() if location in p.supported_cities]
+
+    async def iter_venue_details(
+        self,
+        location: str,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[ProviderOutcome]:
+        """
+        Query every provider supporting the location concurrently.
+
+        Outcomes are yielded as each provider finishes, fastest first. Each
+        provider gets its own timeout, so a slow provider only delays its
+        own outcome. A timed-out scrape keeps running in the background and
+        still fills the cache for later requests.
+        """
+        location = location.lower()
+        timeout = timeout if timeout is not None else settings.provider_timeout_seconds
+        providers = self.get_providers_for_location(location)
+        if not providers:
+            raise ProviderError(f"No provider supports location '{location}'")
+
+        tasks = [
+            asyncio.ensure_future(self._query_provider(provider.name, location, timeout))
+            for provider in providers
+        ]
         try:
-            venues = await provider.get_venue_details(location.lower())
-            return venues
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def get_aggregated_venue_details(
+        self,
+        location: str,
+        timeout: Optional[float] = None,
+    ) -> AggregatedVenues:
+        """Fan out to every provider for the location and merge what comes back in time."""
+        aggregated = AggregatedVenues(location=location.lower())
+        async for outcome in self.iter_venue_details(location, timeout):
+            if outcome.status == 'ok':
+                aggregated.succeeded.append(outcome.provider)
+                aggregated.venues.extend(outcome.venues)
+            elif outcome.status == 'timeout':
+                aggregated.timed_out.append(outcome.provider)
+            else:
+                aggregated.failed[outcome.provider] = outcome.error
+        return aggregated
+
+    async def _query_provider(self, provider_name: str, location: str, timeout: float) -> ProviderOutcome:
+        start = time.monotonic()
+        try:
+            listing = await asyncio.wait_for(self.get_venue_listing(location, provider_name), timeout)
+        except asyncio.TimeoutError:
+            return ProviderOutcome(
+                provider=provider_name,
+                status='timeout',
+                error=f"No response within {timeout:.1f}s",
+                duration=time.monotonic() - start,
+            )
         except Exception as e:
-            raise ProviderError(f"Failed to get venues from {provider_name}: {str(e)}")
-    
+            return ProviderOutcome(
+                provider=provider_name,
+                status='failed',
+                error=str(e),
+                duration=time.monotonic() - start,
+            )
+        return ProviderOutcome(
+            provider=provider_name,
+            status='ok',
+            venues=list(listing.venues),
+            listing=listing,
+            duration=time.monotonic() - start,
+        )
+
+    async def _fetch(self, provider: BaseProvider, location: str, use_catalog: bool = False) -> VenueListing:
+        """Load a listing, coalescing concurrent loads of the same listing."""
+        return await self.single_flight.do(
+            (provider.name, location),
+            lambda: self._load(provider, location, use_catalog),
+        )
+
+    async def _load(self, provider: BaseProvider, location: str, use_catalog: bool) -> VenueListing:
+        """Load a listing from the catalog or the provider and store it in the cache."""
+        if use_catalog and self.catalog is not None:
+            stored = await self._read_catalog(provider.name, location)
+            if stored:
+                listing = VenueListing(stored)
+                self.cache.set((provider.name, location), listing)
+                return listing
+
+        try:
+            listing = VenueListing(await provider.fetch_venue_details(location))
+        except Exception as e:
+            raise ProviderError(f"Failed to get venues from {provider.name}: {str(e)}")
+
+        self.cache.set((provider.name, location), listing)
+        if self.catalog is not None:
+            await self._write_catalog(provider.name, location, listing.venues)
+        return listing
+
+    async def _read_catalog(self, provider_name: str, location: str) -> Optional[List[VenueInfo]]:
+        try:
+            return await self.catalog.get_listing(provider_name, location, max_age=self.catalog_max_age)
+        except Exception as e:
+            logger.warning("Reading %s/%s from venue catalog failed: %s", provider_name, location, e)
+            return None
+
+    async def _write_catalog(self, provider_name: str, location: str, venues: Tuple[VenueInfo, ...]) -> None:
+        try:
+            await self.catalog.save_listing(provider_name, location, venues)
+        except Exception as e:
+            # The scrape itself succeeded; a catalog outage must not fail the request
+            logger.warning("Writing %s/%s to venue catalog failed: %s", provider_name, location, e)
+
+    def _schedule_refresh(self, key: Tuple[str, str], provider: BaseProvider) -> None:
+        """Start a background refresh for a stale entry unless one is running."""
+        if key in self._refresh_tasks:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._refresh(provider, key[1]))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda _: self._refresh_tasks.pop(key, None))
+
+    async def _refresh(self, provider: BaseProvider, location: str) -> None:
+        try:
+            await self._fetch(provider, location)
+        except ProviderError as e:
+            # Keep serving the stale entry; the next stale hit retries
+            logger.warning("Background refresh of %s/%s failed: %s", provider.name, location, e)
+
+    async def close(self) -> None:
+        """
+        Cancel background refreshes and in-flight scrapes, then close the catalog.
+
+        Call before closing the providers, so no scrape is left running on a
+        closed connection pool.
+        """
+        tasks = list(self._refresh_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.single_flight.cancel_all()
+        if self.catalog is not None:
+            await self.catalog.close()
+
+    async def refresh(self, location: str, provider_name: Optional[str] = None) -> VenueListing:
+        """
+        Scrape a listing now and replace the cached copy, whatever its age.
+
+        Does not count as a query for popularity. Joins a scrape of the same
+        listing that is already running instead of starting a second one.
+        """
+        provider_name = provider_name or self.default_provider
+        provider = self.provider_factory.get_provider(provider_name)
+        if not provider:
+            raise ProviderError(f"Provider '{provider_name}' not available or disabled")
+        return await self._fetch(provider, location.lower())
+
+    def get_venue_deltas(
+        self,
+        since: int = 0,
+        location: Optional[str] = None,
+        provider_name: Optional[str] = None,
+    ) -> List[VenueDelta]:
+        """
+        Changes seen between consecutive scrapes, newer than ``since``.
+
+        Pass the ``sequence`` of the last delta already processed to get
+        only what changed after it, without re-reading full listings.
+        """
+        provider_name = provider_name or self.default_provider
+        provider = self.provider_factory.get_provider(provider_name)
+        if not provider:
+            raise ProviderError(f"Provider '{provider_name}' not available or disabled")
+        return provider.snapshots.deltas_since(since, location.lower() if location else None)
+
+    def invalidate(self, location: Optional[str] = None, provider_name: Optional[str] = None) -> None:
+        """Drop cached listings for one location, or the whole cache."""
+        if location is None:
+            self.cache.invalidate()
+            return
+        provider_name = provider_name or self.default_provider
+        self.cache.invalidate((provider_name, location.lower()))
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Cache hit/miss counters and the age of each cached listing."""
+        stats = self.cache.stats()
+        stats['ages'] = {f"{provider}:{location}": age for (provider, location), age in stats['ages'].items()}
+        stats['refreshing'] = len(self._refresh_tasks)
+        return stats
+
+    def popularity_stats(self, n: int = 10) -> Dict[str, float]:
+        """Decayed query counts of the ``n`` most requested listings."""
+        return {f"{provider}:{location}": score for (provider, location), score in self.popularity.top(n)}
+
+    def single_flight_stats(self) -> Dict[str, Dict[str, int]]:
+        """Per-listing counts of scrapes run and calls coalesced onto them."""
+        return {
+            f"{provider}:{location}": stats
+            for (provider, location), stats in self.single_flight.stats().items()
+        }
+
+    def circuit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Circuit breaker state of each provider."""
+        return {
+            p.name: {**p.circuit_breaker.stats(), 'fallbacks_served': p.fallbacks_served}
+            for p in self.provider_factory.get_all_providers()
+        }
+
+    def rate_limiter_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Queue depth and wait-time counters of each provider's rate limiter."""
+        return {p.name: p.rate_limiter.stats() for p in self.provider_factory.get_all_providers()}
+
+    def scrape_profile_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Bytes transferred and time to usable content per provider and scrape profile."""
+        return {
+            p.name: p.crawler.stats.snapshot()
+            for p in self.provider_factory.get_all_providers()
+            if getattr(p, 'crawler', None) is not None
+        }
+
+    def snapshot_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Unchanged-page skips and delta counts per provider."""
+        return {p.name: p.snapshots.stats() for p in self.provider_factory.get_all_providers()}
+
     def get_supported_cities(self, provider_name: Optional[str] = None) -> List[str]:
         """Get list of supported cities for a provider."""
         provider_name = provider_name or self.default_provider
-        
-        provider = provider_factory.get_provider(provider_name)
+
+        provider = self.provider_factory.get_provider(provider_name)
         if not provider:
             return []
-        
+
         return provider.supported_cities
-    
+
     def get_available_providers(self) -> List[str]:
         """Get list of available provider names."""
-        providers = provider_factory.get_all_providers()
+        providers = self.provider_factory.get_all_providers()
         return [p.name for p in providers]
 
 
-# Global venue service instance
-venue_service = VenueService() 
\ No newline at end of file
+def create_venue_service(provider_factory: ProviderFactory) -> VenueService:
+    """Venue service over ``provider_factory``, configured from the VENUE_* settings."""
+    return VenueService(
+        provider_factory,
+        catalog=create_venue_catalog() if settings.venue_catalog_enabled else None,
+    )
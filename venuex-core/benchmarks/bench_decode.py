@@ -0,0 +1,57 @@
+"""
+Benchmark: decoding the Playo __NEXT_DATA__ payload.
+
+Compares the previous path (stdlib ``json.loads`` of the whole document)
+with a full orjson decode and the selective schema decode used by
+PlayoProvider, reporting time and peak allocated memory per decode.
+
+Usage: python -m benchmarks.bench_decode
+"""
+
+import json
+import timeit
+import tracemalloc
+
+from app.services.scraping.parsers import JSON_BACKEND, decode_playo_next_data, extract_next_data
+
+from .fixtures import benchmark_pages
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def _venue_list(data):
+    return data.get('props', {}).get('pageProps', {}).get('listData', {}).get('data', {}).get('venueList', [])
+
+
+def _peak_kb(fn) -> float:
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak / 1024
+
+
+def main() -> None:
+    decoders = [("json (previous)", json.loads)]
+    if orjson is not None:
+        decoders.append(("orjson full", orjson.loads))
+    decoders.append((f"selective [{JSON_BACKEND}]", decode_playo_next_data))
+
+    print(f"{'page':<20}{'decoder':<22}{'payload KB':>12}{'ms':>10}{'peak KB':>12}")
+    for name, html in benchmark_pages():
+        payload = extract_next_data(html)
+        expected = len(_venue_list(json.loads(payload)))
+        for label, decode in decoders:
+            assert len(_venue_list(decode(payload))) == expected, (name, label)
+            number = max(1, 1_000_000 // len(payload))
+            seconds = min(timeit.repeat(lambda: decode(payload), number=number, repeat=5)) / number
+            peak = _peak_kb(lambda: decode(payload))
+            print(f"{name:<20}{label:<22}{len(payload) / 1024:>12.0f}{seconds * 1e3:>10.3f}{peak:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Microbenchmark: __NEXT_DATA__ extraction, legacy regex path vs single-pass extractor.
+
+Usage: python -m benchmarks.bench_extract
+"""
+
+import re
+import timeit
+
+from app.services.scraping.parsers import extract_next_data
+
+from .fixtures import benchmark_pages
+
+_LEGACY_PATTERNS = [
+    r'<script id="__NEXT_DATA__" type="application/json">(.*?)</script>',
+    r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>',
+    r'<script[^>]*id="__NEXT_DATA__"[^>]*>(.*?)</script>',
+]
+
+
+def legacy_extract(html_content: str):
+    """The extraction steps PlayoProvider used before the dedicated extractor."""
+    if '__NEXT_DATA__' not in html_content:
+        re.findall(r'<script[^>]*id="([^"]*)"[^>]*>', html_content)
+        re.findall(r'<script[^>]*>(.*?Next.*?)</script>', html_content, re.DOTALL | re.IGNORECASE)
+        return None
+    for pattern in _LEGACY_PATTERNS:
+        match = re.search(pattern, html_content, re.DOTALL)
+        if match:
+            json_content = match.group(1).strip()
+            return json_content.replace('&quot;', '"').replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
+    return None
+
+
+def _best(fn, number: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    print(f"{'page':<24}{'size KB':>10}{'legacy ms':>12}{'new ms':>10}{'speedup':>10}")
+    for name, html in benchmark_pages():
+        assert legacy_extract(html) == extract_next_data(html), name
+        number = max(1, 2_000_000 // len(html))
+        legacy = _best(lambda: legacy_extract(html), number)
+        new = _best(lambda: extract_next_data(html), number)
+        print(f"{name:<24}{len(html) / 1024:>10.0f}{legacy * 1e3:>12.3f}{new * 1e3:>10.3f}{legacy / new:>9.1f}x")
+
+    missing = "<html><body>" + "<div>no data</div>" * 100_000 + "</body></html>"
+    legacy = _best(lambda: legacy_extract(missing), 3)
+    new = _best(lambda: extract_next_data(missing), 3)
+    print(f"{'miss (no __NEXT_DATA__)':<24}{len(missing) / 1024:>10.0f}{legacy * 1e3:>12.3f}{new * 1e3:>10.3f}{legacy / new:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
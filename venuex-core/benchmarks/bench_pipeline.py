@@ -0,0 +1,263 @@
+"""
+Benchmark: the scrape-parse-respond pipeline, stage by stage.
+
+Times each PlayoProvider parsing stage on recorded and synthetic listing
+pages, intent extraction on a set of chat messages, and complete
+``AgentRouter.process_message`` calls served by a fake crawler, then writes
+the results as JSON so runs from different commits can be compared.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--output results.json] [--sizes 50,500,5000]
+    python -m benchmarks.bench_pipeline --compare baseline.json [--threshold 1.15]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.services.intent import Gazetteer
+from app.services.scraping.base import CrawlResult
+from app.services.scraping.cache import TTLCache
+from app.services.scraping.crawlers import BaseCrawler
+from app.services.scraping.parsers import JSON_BACKEND, extract_next_data
+from app.services.scraping.providers import ProviderFactory, create_provider_factory
+from app.services.scraping.snapshots import SnapshotStore
+from app.services.scraping.venue_service import VenueService
+
+from .fixtures import SIZES, benchmark_pages
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+MESSAGES = [
+    "Find cricket venues in Mumbai",
+    "show me badminton courts in bangalore hsr layout",
+    "any football turfs near andheri tomorrow evening?",
+    "criket grounds in dehli",
+    "badmintn in bengaluru koramangala please",
+    "I want to play football this weekend in pune",
+    "hello there",
+    "what sports can you help me with",
+]
+
+E2E_MESSAGES = [
+    "Find cricket venues in Mumbai",
+    "show me badminton courts in mumbai",
+]
+
+
+class FakeCrawler(BaseCrawler):
+    """Serves one recorded page for every URL, without network or rate limiting."""
+
+    def __init__(self, html: str):
+        super().__init__()
+        self.html = html
+
+    async def _scrape(self, url: str, platform: str, scrape_options=None) -> CrawlResult:
+        return CrawlResult(
+            platform=platform,
+            url=url,
+            success=True,
+            raw_html_content=self.html,
+            content_bytes=len(self.html),
+            crawl_duration=0.0,
+        )
+
+
+def _summary(samples: List[float], runs: int) -> Dict[str, float]:
+    """Per-call timings in milliseconds from per-repeat totals over ``runs`` calls."""
+    per_call = sorted(s / runs * 1e3 for s in samples)
+    return {
+        'min_ms': round(per_call[0], 4),
+        'median_ms': round(statistics.median(per_call), 4),
+        'max_ms': round(per_call[-1], 4),
+        'runs': runs,
+        'repeats': len(per_call),
+    }
+
+
+def time_sync(fn: Callable[[], Any], budget: float = 0.2, repeat: int = 5) -> Dict[str, float]:
+    """Time ``fn`` with enough calls per repeat to fill roughly ``budget`` seconds."""
+    start = time.perf_counter()
+    fn()
+    once = max(time.perf_counter() - start, 1e-7)
+    runs = max(1, int(budget / once))
+    return _summary(timeit.repeat(fn, number=runs, repeat=repeat), runs)
+
+
+async def time_async(fn: Callable[[], Any], runs: int, repeat: int = 5) -> Dict[str, float]:
+    await fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(runs):
+            await fn()
+        samples.append(time.perf_counter() - start)
+    return _summary(samples, runs)
+
+
+def bench_page_stages(provider, name: str, html: str) -> List[Dict[str, Any]]:
+    """Time each parsing stage of ``get_venue_details`` on one page."""
+    payload = extract_next_data(html)
+    json_data = provider._extract_json_from_html(html)
+    venue_count = len(provider._build_venues(json_data))
+    stages = [
+        ('extract_json_from_html', lambda: provider._extract_json_from_html(html)),
+        ('parse_venue_data', lambda: provider._parse_venue_data(json_data)),
+        ('get_sport_names', lambda: provider._get_sport_names(json_data)),
+        ('build_venues', lambda: provider._build_venues(json_data)),
+    ]
+    results = []
+    for benchmark, fn in stages:
+        results.append({
+            'benchmark': benchmark,
+            'case': name,
+            'venues': venue_count,
+            'page_kb': round(len(html) / 1024, 1),
+            'payload_kb': round(len(payload) / 1024, 1),
+            **time_sync(fn),
+        })
+    return results
+
+
+def bench_intent(router) -> List[Dict[str, Any]]:
+    """``_extract_search_args`` per message, with a warm memo and with a cold gazetteer."""
+    warm = router.gazetteer
+    cold = Gazetteer.from_file(memo_size=0)
+    results = []
+    for label, gazetteer in (('warm', warm), ('cold', cold)):
+        router.gazetteer = gazetteer
+        timing = time_sync(lambda: [router._extract_search_args(m) for m in MESSAGES])
+        for key in ('min_ms', 'median_ms', 'max_ms'):
+            timing[key] = round(timing[key] / len(MESSAGES), 4)
+        results.append({'benchmark': 'extract_search_args', 'case': f'{label}-memo', 'messages': len(MESSAGES), **timing})
+    router.gazetteer = warm
+    return results
+
+
+async def bench_end_to_end(router, factory: ProviderFactory, provider, name: str, html: str) -> List[Dict[str, Any]]:
+    """
+    ``process_message`` through VenueService with the fake crawler.
+
+    ``cold`` gives every call an empty cache and snapshot store, so each one
+    scrapes, extracts, decodes and converts; ``cached`` serves the listing
+    from the venue cache as repeat searches do. Timings are per message.
+    """
+    provider.crawler = FakeCrawler(html)
+
+    async def cold():
+        router.venue_service = VenueService(factory, cache=TTLCache(ttl=60))
+        provider.snapshots = SnapshotStore(provider.name)
+        await router.process_message(E2E_MESSAGES[0], "bench")
+
+    async def cached():
+        for message in E2E_MESSAGES:
+            await router.process_message(message, "bench")
+
+    results = []
+    runs = max(1, 2000 // max(1, len(html) // 10_000))
+    cold_timing = await time_async(cold, runs=max(1, runs // 20))
+    router.venue_service = VenueService(factory, cache=TTLCache(ttl=3600))
+    cached_timing = await time_async(cached, runs=runs)
+
+    for key in ('min_ms', 'median_ms', 'max_ms'):
+        cached_timing[key] = round(cached_timing[key] / len(E2E_MESSAGES), 4)
+    for case, timing in (('cold', cold_timing), ('cached', cached_timing)):
+        results.append({'benchmark': f'process_message_{case}', 'case': name, 'page_kb': round(len(html) / 1024, 1), **timing})
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(sizes: Tuple[int, ...] = SIZES) -> Dict[str, Any]:
+    from app.services.agents import AgentRouter
+
+    factory = create_provider_factory()
+    provider = factory.get_provider("playo")
+    router = AgentRouter(VenueService(factory, cache=TTLCache(ttl=3600)))
+    results: List[Dict[str, Any]] = []
+    for name, html in benchmark_pages(sizes):
+        results.extend(bench_page_stages(provider, name, html))
+        results.extend(asyncio.run(bench_end_to_end(router, factory, provider, name, html)))
+    results.extend(bench_intent(router))
+
+    return {
+        'meta': {
+            'commit': _git_commit(),
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'json_backend': JSON_BACKEND,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Print ratios of best-of-repeat times against ``baseline``.
+
+    The minimum is compared rather than the median because it is the least
+    sensitive to noise from other processes. Returns the regressions above
+    ``threshold``.
+    """
+    before = {(r['benchmark'], r['case']): r for r in baseline['results']}
+    regressions = []
+    print(f"{'benchmark':<28}{'case':<22}{'before min':>12}{'after min':>12}{'ratio':>9}")
+    for result in current['results']:
+        key = (result['benchmark'], result['case'])
+        if key not in before:
+            continue
+        old, new = before[key]['min_ms'], result['min_ms']
+        ratio = new / old if old else float('inf')
+        flag = ''
+        if ratio > threshold:
+            flag = '  REGRESSION'
+            regressions.append(f"{key[0]}[{key[1]}] {ratio:.2f}x")
+        print(f"{key[0]:<28}{key[1]:<22}{old:>12.4f}{new:>12.4f}{ratio:>8.2f}x{flag}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--output', type=Path, help="where to write the JSON results (default: benchmarks/results/pipeline-<commit>.json)")
+    parser.add_argument('--sizes', default=','.join(map(str, SIZES)), help="synthetic page sizes in venues, comma separated")
+    parser.add_argument('--compare', type=Path, help="baseline results file to compare against")
+    parser.add_argument('--threshold', type=float, default=1.15, help="best-of-repeat (min) slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    report = run(tuple(int(s) for s in args.sizes.split(',') if s))
+    output = args.output or RESULTS_DIR / f"pipeline-{report['meta']['commit'] or 'local'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + '\n', encoding='utf-8')
+
+    for result in report['results']:
+        print(f"{result['benchmark']:<28}{result['case']:<22}{result['median_ms']:>12.4f} ms")
+    print(f"Wrote {len(report['results'])} results to {output}")
+
+    if args.compare:
+        regressions = compare(json.loads(args.compare.read_text(encoding='utf-8')), report, args.threshold)
+        if regressions:
+            print("Regressions: " + ', '.join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Playo listing pages for benchmarks.
+
+Recorded pages can be dropped into ``benchmarks/pages`` as ``*.html`` or
+``*.html.gz`` files. Synthetic pages mimic the shape of a real Playo listing:
+a large HTML shell, a ``__NEXT_DATA__`` script whose ``pageProps`` holds the
+venue list and sport catalogue, and plenty of unrelated page state.
+"""
+
+import gzip
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+PAGES_DIR = Path(__file__).parent / "pages"
+
+SPORTS = [
+    ("SP2", "Cricket"), ("SP5", "Football"), ("SP1", "Badminton"),
+    ("SP3", "Tennis"), ("SP4", "Table Tennis"), ("SP6", "Swimming"),
+    ("SP7", "Basketball"), ("SP8", "Squash"),
+]
+AREAS = ["Andheri", "Bandra", "Powai", "Kakkanad", "Koramangala", "Indiranagar", "Whitefield", "Dwarka"]
+SIZES = (50, 500, 2000, 5000)
+
+
+def build_venue(index: int, rng: random.Random) -> Dict[str, Any]:
+    area = rng.choice(AREAS)
+    return {
+        "id": f"venue-{index:06d}-{rng.randrange(16**8):08x}",
+        "name": f"{area} Sports Arena {index}",
+        "area": area,
+        "city": "Mumbai",
+        "address": f"{index} Main Road, {area}, Mumbai 4000{index % 100:02d}",
+        "isBookable": rng.random() < 0.7,
+        "avgRating": round(rng.uniform(3.0, 5.0), 2),
+        "ratingCount": rng.randrange(0, 2000),
+        "sports": [sport_id for sport_id, _ in rng.sample(SPORTS, rng.randrange(1, 4))],
+        "activeKey": f"{area.lower()}-sports-arena-{index}",
+        "distance": round(rng.uniform(0.1, 25.0), 2),
+        # Fields present on real listings that the parser ignores
+        "images": [f"https://playo-website.gumlet.io/playo-website-v2/{index}/{n}.jpg" for n in range(4)],
+        "timings": {"open": "06:00", "close": "23:00"},
+        "amenities": ["Parking", "Drinking Water", "Changing Room", "Flood Lights"],
+    }
+
+
+def build_next_data(n_venues: int, seed: int = 42) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    return {
+        "props": {
+            "pageProps": {
+                "listData": {"data": {"venueList": [build_venue(i, rng) for i in range(n_venues)]}},
+                "allSports": {"list": [{"sportId": sid, "name": name} for sid, name in SPORTS]},
+                # Unrelated page state that a selective decoder can skip
+                "seo": {"title": "Sports venues", "description": "x" * 2000},
+                "footer": [{"label": f"Link {i}", "href": f"/page/{i}"} for i in range(500)],
+            },
+            "__N_SSP": True,
+        },
+        "page": "/venues/[city]/sports/[sport]",
+        "query": {"city": "mumbai", "sport": "all"},
+        "buildId": "abc123",
+    }
+
+
+def build_playo_page(n_venues: int, filler_kb: int = 256, entity_escaped: bool = False, seed: int = 42) -> str:
+    """Render a full HTML page with the given number of venues."""
+    payload = json.dumps(build_next_data(n_venues, seed), separators=(",", ":"))
+    if entity_escaped:
+        payload = payload.replace("&", "&amp;").replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
+    filler = "".join(
+        f'<div class="venue-card"><a href="/venue/{i}">Card {i}</a><span>{"lorem ipsum " * 8}</span></div>'
+        for i in range(filler_kb * 1024 // 150)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>Playo</title>"
+        '<script src="/_next/static/chunks/main.js" defer=""></script>'
+        '<script id="gtm">window.dataLayer=window.dataLayer||[];</script>'
+        f"</head><body><div id=\"__next\">{filler}</div>"
+        f'<script id="__NEXT_DATA__" type="application/json">{payload}</script>'
+        "</body></html>"
+    )
+
+
+def load_recorded_pages() -> List[Tuple[str, str]]:
+    """Recorded pages from benchmarks/pages, as (name, html) pairs."""
+    pages = []
+    if not PAGES_DIR.is_dir():
+        return pages
+    for path in sorted(PAGES_DIR.iterdir()):
+        if path.name.endswith(".html.gz"):
+            pages.append((path.name, gzip.decompress(path.read_bytes()).decode("utf-8")))
+        elif path.suffix == ".html":
+            pages.append((path.name, path.read_text(encoding="utf-8")))
+    return pages
+
+
+def benchmark_pages(sizes=SIZES) -> List[Tuple[str, str]]:
+    """Recorded pages followed by synthetic pages of increasing size."""
+    pages = load_recorded_pages()
+    pages.extend((f"synthetic-{n}", build_playo_page(n)) for n in sizes)
+    return pages
@@ -0,0 +1,433 @@
+"""
+Load test: throughput and tail latency of ``/api/v1/agents/chat``.
+
+Drives the FastAPI app with a mix of sport and city messages while a fake
+provider stands in for Playo and Firecrawl, with a log-normal scrape latency
+and a configurable error rate. Each concurrency level (and worker count) is
+a separate run; the report gives p50/p95/p99 latency, requests per second,
+event-loop lag and scrape amplification (scrapes per request).
+
+``--workers 0`` (the default) runs the app in this process through an ASGI
+transport, so the client shares the event loop being measured. Any other
+worker count starts ``uvicorn --workers N`` with the fake provider installed
+in every worker and drives it over HTTP.
+
+Usage:
+    python -m benchmarks.loadtest --concurrency 1,16,64 --duration 10
+    python -m benchmarks.loadtest --workers 1,2,4 --concurrency 64 --scrape-p50 0.8 --scrape-p99 4 --error-rate 0.05
+"""
+
+import argparse
+import asyncio
+import bisect
+import functools
+import importlib
+import json
+import logging
+import math
+import os
+import random
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import httpx
+
+from app.services.scraping.base import ProviderError, VenueInfo
+from app.services.scraping.base.provider import BaseProvider
+from app.services.scraping.providers import ProviderFactory, create_playo_config, create_provider_factory
+
+CHAT_PATH = "/api/v1/agents/chat"
+ROOT = Path(__file__).resolve().parent.parent
+
+SPORTS = ("cricket", "football", "badminton")
+CITIES = ("mumbai", "bangalore", "delhi", "pune", "hyderabad", "chennai", "kochi", "kakkanad")
+TEMPLATES = (
+    "Find {sport} venues in {city}",
+    "show me {sport} courts in {city}",
+    "any {sport} grounds near {city} tomorrow?",
+    "I want to play {sport} in {city} this weekend",
+)
+
+
+@dataclass
+class FakeProviderConfig:
+    """Behaviour of the stand-in provider; passed to uvicorn workers as JSON."""
+    scrape_p50: float = 0.5
+    scrape_p99: float = 2.0
+    error_rate: float = 0.0
+    venues_per_city: int = 200
+    seed: int = 7
+
+
+class FakeProvider(BaseProvider):
+    """
+    Serves synthetic venues after a log-normal delay, failing at ``error_rate``.
+
+    Runs through the real circuit breaker and VenueService cache, so only the
+    crawl itself is simulated. ``scrapes`` counts every simulated fetch.
+    """
+
+    def __init__(self, config, fake: FakeProviderConfig, http_client=None):
+        super().__init__(config, http_client)
+        self.fake = fake
+        self._rng = random.Random(fake.seed)
+        # p99 of a log-normal is exp(mu + 2.326 sigma)
+        self._mu = math.log(fake.scrape_p50)
+        self._sigma = max(0.0, math.log(fake.scrape_p99 / fake.scrape_p50) / 2.326)
+        self._venues: Dict[str, List[VenueInfo]] = {}
+        self.scrapes = 0
+        self.failures = 0
+
+    @property
+    def supported_cities(self) -> List[str]:
+        return list(self.config.city_mapping)
+
+    async def get_venue_details(self, location: str) -> List[VenueInfo]:
+        self.scrapes += 1
+        await asyncio.sleep(self._rng.lognormvariate(self._mu, self._sigma))
+        if self._rng.random() < self.fake.error_rate:
+            self.failures += 1
+            raise ProviderError(f"Simulated scrape failure for {location}")
+        if location not in self._venues:
+            self._venues[location] = [self._venue(location, i) for i in range(self.fake.venues_per_city)]
+        return self._venues[location]
+
+    def _venue(self, location: str, index: int) -> VenueInfo:
+        return VenueInfo(
+            platform=self.name,
+            venue_id=f"{location}-{index}",
+            name=f"{location.title()} Arena {index}",
+            city=location.title(),
+            sports_offered=[SPORTS[index % len(SPORTS)].title(), SPORTS[(index + 1) % len(SPORTS)].title()],
+            rating=round(3.0 + (index % 20) / 10, 1),
+            is_bookable=index % 3 != 0,
+            booking_url=f"https://playo.co/booking?venueId={location}-{index}",
+        )
+
+
+def install_fake_provider(fake: FakeProviderConfig) -> None:
+    """
+    Make the app's lifespan build FakeProvider under Playo's name, so the
+    default search path uses it.
+    """
+    import main
+
+    def create_fake_provider_factory(http_client=None) -> ProviderFactory:
+        factory = create_provider_factory(http_client)
+        factory.register_provider(functools.partial(FakeProvider, fake=fake), create_playo_config())
+        return factory
+
+    main.create_provider_factory = create_fake_provider_factory
+
+
+def fake_provider(app) -> FakeProvider:
+    """The FakeProvider of a started app."""
+    return app.state.provider_factory.get_provider(create_playo_config().name)
+
+
+class LagHistogram:
+    """Event-loop lag in geometric buckets (25% apart) so workers can be merged."""
+
+    BOUNDS = tuple(0.00005 * 1.25 ** i for i in range(56))  # 50us .. ~10s
+
+    def __init__(self, counts: Optional[List[int]] = None, maximum: float = 0.0):
+        self.counts = counts or [0] * (len(self.BOUNDS) + 1)
+        self.maximum = maximum
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.maximum = max(self.maximum, seconds)
+
+    def merge(self, other: "LagHistogram") -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.maximum = max(self.maximum, other.maximum)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile (0 when empty)."""
+        total = sum(self.counts)
+        if not total:
+            return 0.0
+        rank = math.ceil(q / 100 * total)
+        seen = 0
+        for bound, count in zip(self.BOUNDS + (self.maximum,), self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.maximum)
+        return self.maximum
+
+
+class LoopLagMonitor:
+    """Measures how late ``asyncio.sleep(interval)`` wakes up on the running loop."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.histogram = LagHistogram()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.interval)
+            self.histogram.observe(max(0.0, loop.time() - start - self.interval))
+
+
+def message_mix(seed: int, cities: Sequence[str], sports: Sequence[str], skew: float) -> Iterator[str]:
+    """Endless chat messages; city popularity follows a Zipf law with exponent ``skew``."""
+    rng = random.Random(seed)
+    weights = [1 / (rank ** skew) for rank in range(1, len(cities) + 1)]
+    while True:
+        city = rng.choices(cities, weights)[0]
+        yield rng.choice(TEMPLATES).format(sport=rng.choice(sports), city=city)
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, math.ceil(q / 100 * len(sorted_values)) - 1)]
+
+
+async def drive(
+    client: httpx.AsyncClient,
+    messages: Iterator[str],
+    concurrency: int,
+    duration: float,
+    max_requests: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Closed-loop load: ``concurrency`` users each send the next message as soon as the last one returns."""
+    latencies: List[float] = []
+    errors = 0
+    empty = 0
+    sent = 0
+    deadline = time.perf_counter() + duration
+
+    async def user(user_index: int) -> None:
+        nonlocal errors, empty, sent
+        while time.perf_counter() < deadline and (max_requests is None or sent < max_requests):
+            sent += 1
+            body = {"message": next(messages), "user_id": f"load-{user_index}", "page_size": 20}
+            start = time.perf_counter()
+            try:
+                response = await client.post(CHAT_PATH, json=body)
+            except httpx.HTTPError:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                errors += 1
+            elif not response.json().get("total_found"):
+                empty += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'completed': len(latencies),
+        'errors': errors,
+        'empty_results': empty,
+        'elapsed_s': round(elapsed, 3),
+        'rps': round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        'p50_ms': round(_percentile(latencies, 50) * 1e3, 2),
+        'p95_ms': round(_percentile(latencies, 95) * 1e3, 2),
+        'p99_ms': round(_percentile(latencies, 99) * 1e3, 2),
+        'max_ms': round(latencies[-1] * 1e3, 2) if latencies else 0.0,
+    }
+
+
+async def run_in_process(fake: FakeProviderConfig, concurrency: int, args) -> Dict[str, Any]:
+    from main import app
+
+    # ASGITransport does not send lifespan events; run startup and shutdown
+    # here so each run gets the app state (and cold venue cache) a freshly
+    # started server would
+    install_fake_provider(fake)
+    async with app.router.lifespan_context(app):
+        provider = fake_provider(app)
+        monitor = LoopLagMonitor()
+        monitor.start()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=args.timeout) as client:
+            result = await drive(client, _messages(args), concurrency, args.duration, args.requests)
+        await monitor.stop()
+    return _with_server_stats(result, provider.scrapes, monitor.histogram)
+
+
+def _messages(args) -> Iterator[str]:
+    return message_mix(args.seed, args.cities.split(','), args.sports.split(','), args.skew)
+
+
+def _with_server_stats(result: Dict[str, Any], scrapes: int, lag: LagHistogram) -> Dict[str, Any]:
+    result.update({
+        'scrapes': scrapes,
+        'scrape_amplification': round(scrapes / result['completed'], 4) if result['completed'] else 0.0,
+        'loop_lag_p50_ms': round(lag.percentile(50) * 1e3, 2),
+        'loop_lag_p99_ms': round(lag.percentile(99) * 1e3, 2),
+        'loop_lag_max_ms': round(lag.maximum * 1e3, 2),
+    })
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Multi-worker mode: uvicorn workers built by create_app()
+
+
+def create_app():
+    """
+    uvicorn factory for load-test workers.
+
+    Reads FakeProviderConfig from LOADTEST_FAKE and periodically writes the
+    worker's scrape count and loop-lag histogram to LOADTEST_STATS_DIR.
+    """
+    from main import app
+
+    fake = FakeProviderConfig(**json.loads(os.environ.get("LOADTEST_FAKE", "{}")))
+    install_fake_provider(fake)
+    stats_path = Path(os.environ["LOADTEST_STATS_DIR"]) / f"{os.getpid()}.json"
+    monitor = LoopLagMonitor()
+
+    async def write_stats() -> None:
+        while True:
+            await asyncio.sleep(0.25)
+            stats_path.write_text(json.dumps({
+                'scrapes': fake_provider(app).scrapes,
+                'lag_counts': monitor.histogram.counts,
+                'lag_max': monitor.histogram.maximum,
+            }))
+
+    @app.middleware("http")
+    async def start_monitor(request, call_next):
+        if monitor._task is None:
+            monitor.start()
+            asyncio.get_running_loop().create_task(write_stats())
+        return await call_next(request)
+
+    return app
+
+
+async def _wait_until_up(url: str, process: subprocess.Popen, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=url) as client:
+        while time.monotonic() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError("uvicorn exited during startup")
+            try:
+                if (await client.get("/health")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"Server at {url} did not become healthy within {timeout:.0f}s")
+
+
+async def run_with_workers(fake: FakeProviderConfig, workers: int, concurrency: int, args) -> Dict[str, Any]:
+    url = f"http://127.0.0.1:{args.port}"
+    with tempfile.TemporaryDirectory() as stats_dir:
+        env = {
+            **os.environ,
+            "LOADTEST_FAKE": json.dumps(asdict(fake)),
+            "LOADTEST_STATS_DIR": stats_dir,
+            "LOG_LEVEL": "ERROR",
+        }
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "benchmarks.loadtest:create_app", "--factory",
+             "--workers", str(workers), "--port", str(args.port), "--log-level", "warning", "--no-access-log"],
+            cwd=ROOT, env=env,
+        )
+        try:
+            await _wait_until_up(url, process)
+            limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+            async with httpx.AsyncClient(base_url=url, limits=limits, timeout=args.timeout) as client:
+                result = await drive(client, _messages(args), concurrency, args.duration, args.requests)
+            # Let every worker write its final stats
+            await asyncio.sleep(0.5)
+        finally:
+            process.send_signal(signal.SIGINT)
+            try:
+                process.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+        scrapes = 0
+        lag = LagHistogram()
+        for path in Path(stats_dir).glob("*.json"):
+            stats = json.loads(path.read_text())
+            scrapes += stats['scrapes']
+            lag.merge(LagHistogram(stats['lag_counts'], stats['lag_max']))
+    return _with_server_stats(result, scrapes, lag)
+
+
+def _levels(value: str) -> List[int]:
+    return [int(v) for v in value.split(',') if v]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--concurrency', type=_levels, default=[1, 8, 32, 128], help="comma-separated concurrent users per run")
+    parser.add_argument('--workers', type=_levels, default=[0], help="comma-separated uvicorn worker counts; 0 runs in-process")
+    parser.add_argument('--duration', type=float, default=10.0, help="seconds per run")
+    parser.add_argument('--requests', type=int, help="stop each run after this many requests")
+    parser.add_argument('--timeout', type=float, default=60.0, help="client timeout per request")
+    parser.add_argument('--cities', default=','.join(CITIES))
+    parser.add_argument('--sports', default=','.join(SPORTS))
+    parser.add_argument('--skew', type=float, default=1.1, help="Zipf exponent of city popularity (0 = uniform)")
+    parser.add_argument('--scrape-p50', type=float, default=0.5, help="median fake scrape latency in seconds")
+    parser.add_argument('--scrape-p99', type=float, default=2.0, help="p99 fake scrape latency in seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="fraction of fake scrapes that fail")
+    parser.add_argument('--venues', type=int, default=200, help="venues per city served by the fake provider")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--output', type=Path, help="write the report as JSON")
+    args = parser.parse_args(argv)
+
+    # Importing the app configures logging; quieten the expected scrape failures afterwards
+    importlib.import_module("main")
+    logging.getLogger("app").setLevel(logging.ERROR)
+    fake = FakeProviderConfig(args.scrape_p50, args.scrape_p99, args.error_rate, args.venues, args.seed)
+
+    columns = ['workers', 'concurrency', 'completed', 'errors', 'rps', 'p50_ms', 'p95_ms', 'p99_ms',
+               'loop_lag_p99_ms', 'scrape_amplification']
+    print(''.join(f"{c:>{max(9, len(c) + 2)}}" for c in columns))
+    rows = []
+
+    async def run_all() -> None:
+        # One event loop for every run: the app's module-level objects outlive a run
+        for workers in args.workers:
+            for concurrency in args.concurrency:
+                if workers:
+                    result = await run_with_workers(fake, workers, concurrency, args)
+                else:
+                    result = await run_in_process(fake, concurrency, args)
+                row = {'workers': workers, 'concurrency': concurrency, **result}
+                rows.append(row)
+                print(''.join(f"{row[c]:>{max(9, len(c) + 2)}}" for c in columns), flush=True)
+
+    asyncio.run(run_all())
+
+    if args.output:
+        report = {'config': {**asdict(fake), **{k: v for k, v in vars(args).items() if k != 'output'}}, 'runs': rows}
+        args.output.write_text(json.dumps(report, indent=2, default=str) + '\n', encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()
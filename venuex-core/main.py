@@ -1,7 +1,54 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
+from app.api.dependencies import get_prewarm_scheduler
 from app.api.routes import agents
 from app.core.config import settings
+from app.core.logging import configure_logging
+from app.core.metrics import GaugeFamily, registry
+from app.services.agents import AgentRouter
+from app.services.notifications import create_notification_dispatcher
+from app.services.pagination import create_result_pager
+from app.services.scraping.crawlers import create_http_client
+from app.services.scraping.prewarm import PrewarmScheduler, create_prewarm_scheduler
+from app.services.scraping.providers import create_provider_factory
+from app.services.scraping.venue_service import create_venue_service
+
+configure_logging(settings.log_level, settings.log_levels, settings.log_debug_sample_rate)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Created once per process; routes resolve them through app.api.dependencies
+    http_client = create_http_client()
+    provider_factory = create_provider_factory(http_client)
+    venue_service = create_venue_service(provider_factory)
+    prewarm_scheduler = create_prewarm_scheduler(venue_service)
+    app.state.http_client = http_client
+    app.state.provider_factory = provider_factory
+    app.state.venue_service = venue_service
+    app.state.prewarm_scheduler = prewarm_scheduler
+    app.state.agent_router = AgentRouter(venue_service)
+    app.state.result_pager = create_result_pager()
+    # Providers and their crawlers are built before the first request either
+    # way; the setting only controls pre-connecting to the provider sites
+    provider_factory.get_all_providers()
+    if settings.crawler_warmup_enabled:
+        await provider_factory.warmup(settings.crawler_warmup_timeout_seconds)
+    if settings.prewarm_enabled:
+        prewarm_scheduler.start()
+    app.state.notification_dispatcher = None
+    if settings.notifications_enabled:
+        app.state.notification_dispatcher = create_notification_dispatcher()
+        app.state.notification_dispatcher.start()
+    yield
+    if app.state.notification_dispatcher is not None:
+        await app.state.notification_dispatcher.stop()
+    await prewarm_scheduler.stop()
+    # Background scrapes first, so none runs on a closed crawler or pool
+    await venue_service.close()
+    await provider_factory.close()
+    await http_client.aclose()
 
 app = FastAPI(
     title="VenueX Core API",
@@ -23,7 +70,8 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -36,6 +84,32 @@ app.add_middleware(
 
 app.include_router(agents.router, prefix="/api/v1/agents", tags=["agents"])
 
+def _per_provider(stats, field):
+    return lambda: [({'provider': name}, values[field]) for name, values in getattr(app.state.venue_service, stats)().items()]
+
+# Read from the services on app.state, so they report nothing until startup
+for name, documentation, read in [
+    ('venuex_venue_cache_entries', 'Venue listings in the cache.',
+     lambda: [({}, app.state.venue_service.cache_stats()['entries'])]),
+    ('venuex_venue_cache_bytes', 'Estimated bytes held by the venue cache.',
+     lambda: [({}, app.state.venue_service.cache_stats()['bytes'])]),
+    ('venuex_venue_cache_hit_ratio', 'Share of venue cache lookups served from the cache.',
+     lambda: [({}, app.state.venue_service.cache_stats()['hit_ratio'])]),
+    ('venuex_venue_cache_oldest_age_seconds', 'Age of the oldest cached venue listing.',
+     lambda: [({}, app.state.venue_service.cache_stats()['oldest_age'])]),
+    ('venuex_rate_limiter_queue_depth', 'Requests waiting for the provider rate limiter.',
+     _per_provider('rate_limiter_stats', 'queue_depth')),
+    ('venuex_rate_limiter_in_flight', 'Provider requests currently in flight.',
+     _per_provider('rate_limiter_stats', 'in_flight')),
+    ('venuex_rate_limiter_tokens', 'Tokens left in the provider rate limiter bucket.',
+     _per_provider('rate_limiter_stats', 'tokens')),
+    ('venuex_circuit_open', 'Whether the provider circuit breaker is not closed (1) or closed (0).',
+     lambda: [({'provider': name}, int(values['state'] != 'closed')) for name, values in app.state.venue_service.circuit_stats().items()]),
+    ('venuex_prewarm_queue_depth', 'Listings due for pre-warming but not yet refreshed.',
+     lambda: [({}, app.state.prewarm_scheduler.stats()['queue_depth'])]),
+]:
+    registry.register(GaugeFamily(name, documentation, read))
+
 @app.get("/")
 async def root():
     return {"message": "venuex Core API is running", "status": "healthy"}
@@ -44,6 +118,14 @@ async def root():
 async def health():
     return {"status": "healthy"}
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+@app.get("/health/prewarm")
+async def prewarm_health(prewarm_scheduler: PrewarmScheduler = Depends(get_prewarm_scheduler)):
+    return prewarm_scheduler.stats()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
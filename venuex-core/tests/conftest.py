@@ -7,6 +7,19 @@ import asyncio
 from typing import Dict, Any, List
 from datetime import datetime
 
+from app.services.scraping.cache import TTLCache
+from app.services.scraping.venue_service import VenueService
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -22,6 +35,10 @@ def mock_settings():
     settings = Mock()
     settings.openai_api_key = "test-api-key"
     settings.environment = "test"
+    settings.llm_intent_timeout_seconds = 1.0
+    settings.llm_intent_max_concurrent = 4
+    settings.llm_intent_cache_ttl_seconds = 60.0
+    settings.llm_intent_cache_max_entries = 128
     return settings
 
 
@@ -41,6 +58,34 @@ def mock_venue_service():
     return mock_service
 
 
+@pytest.fixture
+def clock():
+    """Fake clock shared by the caches, breakers and schedulers under test."""
+    return FakeClock()
+
+
+@pytest.fixture
+def make_provider():
+    """Factory for mock providers whose scrape is an AsyncMock."""
+    def make(name: str = "playo", supported_cities=("mumbai", "delhi"), **scrape):
+        provider = Mock()
+        provider.name = name
+        provider.supported_cities = list(supported_cities)
+        provider.fetch_venue_details = AsyncMock(**scrape)
+        return provider
+    return make
+
+
+@pytest.fixture
+def make_venue_service(clock):
+    """Factory for a VenueService over one provider, cached on the fake clock."""
+    def make(provider, **cache_options):
+        factory = Mock()
+        factory.get_provider.return_value = provider
+        return VenueService(factory, cache=TTLCache(clock=clock, **cache_options))
+    return make
+
+
 @pytest.fixture
 def sample_venue_data():
     """Sample venue data for testing."""
@@ -0,0 +1,216 @@
+"""
+Unit tests for the app lifespan and the services it provides to routes
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from fastapi.testclient import TestClient
+
+from app.api.dependencies import get_agent_router
+from app.services.agents import AgentRouter
+from app.services.pagination import ResultPager
+from app.services.scraping.base import VenueInfo, VenueListing
+from app.services.scraping.providers import ProviderFactory
+
+
+def fake_provider_class(warmup=None):
+    """Provider class whose instances are Mocks with async warmup and close."""
+    def create(config, http_client=None):
+        provider = Mock()
+        provider.name = config.name
+        provider.warmup = AsyncMock(side_effect=warmup)
+        provider.close = AsyncMock()
+        return provider
+    return create
+
+
+def provider_config(name: str) -> Mock:
+    config = Mock(enabled=True)
+    config.name = name
+    return config
+
+
+class TestProviderFactoryLifecycle:
+    """Test warming and closing every provider instance."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_creates_and_warms_every_provider(self):
+        factory = ProviderFactory()
+        factory.register_provider(fake_provider_class(), provider_config("a"))
+        factory.register_provider(fake_provider_class(), provider_config("b"))
+
+        await factory.warmup(timeout=1.0)
+
+        for provider in factory.get_all_providers():
+            provider.warmup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_or_slow_warmup_does_not_block_others(self, caplog):
+        async def hang():
+            await asyncio.sleep(10)
+
+        factory = ProviderFactory()
+        factory.register_provider(fake_provider_class(warmup=RuntimeError("boom")), provider_config("broken"))
+        factory.register_provider(fake_provider_class(warmup=hang), provider_config("slow"))
+        factory.register_provider(fake_provider_class(), provider_config("ok"))
+
+        await factory.warmup(timeout=0.05)
+
+        assert factory.get_provider("ok").warmup.await_count == 1
+        assert "Warming up broken failed: boom" in caplog.text
+        assert "Warming up slow timed out" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_close_closes_instances_and_later_lookups_recreate(self):
+        factory = ProviderFactory()
+        factory.register_provider(fake_provider_class(), provider_config("a"))
+        provider = factory.get_provider("a")
+
+        await factory.close()
+
+        provider.close.assert_awaited_once()
+        assert factory.get_provider("a") is not provider
+
+
+@pytest.fixture
+def app():
+    from main import app
+    yield app
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def lifecycle():
+    """Provider warmup and client shutdown, mocked so no connections are made."""
+    with patch.object(ProviderFactory, 'warmup', AsyncMock()) as warmup, \
+            patch.object(ProviderFactory, 'close', AsyncMock()) as close, \
+            patch('main.create_http_client', return_value=Mock(aclose=AsyncMock())) as create_client:
+        yield Mock(warmup=warmup, close=close, close_client=create_client.return_value.aclose)
+
+
+class TestLifespan:
+    """Test services created at startup, injected into routes and closed at shutdown."""
+
+    def test_startup_stores_services_and_shutdown_closes_clients(self, app, lifecycle):
+        with TestClient(app):
+            assert isinstance(app.state.agent_router, AgentRouter)
+            assert isinstance(app.state.result_pager, ResultPager)
+            assert app.state.agent_router.venue_service is app.state.venue_service
+            assert app.state.provider_factory.http_client is app.state.http_client
+            lifecycle.warmup.assert_awaited_once()
+            lifecycle.close.assert_not_awaited()
+
+        lifecycle.close.assert_awaited_once()
+        lifecycle.close_client.assert_awaited_once()
+
+    def test_each_startup_builds_its_own_services(self, app, lifecycle):
+        with TestClient(app):
+            first = app.state.venue_service
+            assert first.provider_factory is app.state.provider_factory
+        with TestClient(app):
+            assert app.state.venue_service is not first
+
+    def test_providers_built_without_network_warmup(self, app, lifecycle):
+        with patch('main.settings.crawler_warmup_enabled', False):
+            with TestClient(app):
+                assert app.state.provider_factory._instances
+                lifecycle.warmup.assert_not_awaited()
+
+    def test_routes_use_overridden_agent_router(self, app, lifecycle):
+        agents = Mock()
+        agents.process_message = AsyncMock(return_value={"response": "stubbed", "records": ()})
+        app.dependency_overrides[get_agent_router] = lambda: agents
+
+        with TestClient(app) as client:
+            response = client.post("/api/v1/agents/chat", json={"message": "hello", "user_id": "u1"})
+
+        assert response.status_code == 200
+        assert response.json()["response"] == "stubbed"
+        agents.process_message.assert_awaited_once_with("hello", "u1")
+
+
+class TestChatPagination:
+    """Test following next_cursor through the chat route."""
+
+    @pytest.fixture
+    def client(self, app, lifecycle):
+        venues = [VenueInfo(platform="playo", venue_id=str(i), name=f"Venue {i}", city="Mumbai") for i in range(5)]
+        records = VenueListing(venues).records
+        agents = Mock()
+        agents.process_message = AsyncMock(return_value={
+            "response": "found", "records": records, "sport": "cricket", "location": "mumbai",
+        })
+        app.dependency_overrides[get_agent_router] = lambda: agents
+        with TestClient(app) as client:
+            yield client
+
+    def test_cursor_walks_the_result_set(self, client):
+        body = {"message": "cricket in mumbai", "user_id": "u1", "page_size": 2}
+        page = client.post("/api/v1/agents/chat", json=body).json()
+        ids = [v["venue_id"] for v in page["slots_found"]]
+        while page["next_cursor"]:
+            page = client.post("/api/v1/agents/chat", json={**body, "cursor": page["next_cursor"]}).json()
+            ids.extend(v["venue_id"] for v in page["slots_found"])
+
+        assert ids == ["0", "1", "2", "3", "4"]
+        assert page["total_found"] == 5
+        assert page["slots_found"][0]["sport"] == "cricket"
+
+    def test_cursor_of_another_user_rejected(self, client):
+        first = client.post("/api/v1/agents/chat", json={"message": "cricket", "user_id": "u1", "page_size": 2}).json()
+
+        response = client.post(
+            "/api/v1/agents/chat",
+            json={"message": "cricket", "user_id": "u2", "cursor": first["next_cursor"]},
+        )
+
+        assert response.status_code == 400
+
+
+class TestChatStream:
+    """Test the wire encoding of streamed chat events."""
+
+    EVENTS = [
+        {"event": "ack", "sport": "cricket", "location": "mumbai", "response": "🔍 Searching..."},
+        {"event": "venues", "provider": "playo", "venues": [{"venue_name": "Nets", "rating": 4.5, "city": "Mumbai"}]},
+        {"event": "summary", "response": "Found 1", "total_found": 1},
+    ]
+
+    @pytest.fixture
+    def client(self, app, lifecycle):
+        async def stream_message(message, user_id):
+            for event in self.EVENTS:
+                yield dict(event)
+
+        agents = Mock(stream_message=stream_message)
+        app.dependency_overrides[get_agent_router] = lambda: agents
+        with TestClient(app) as client:
+            yield client
+
+    def test_ndjson_one_event_per_line_with_projected_fields(self, client):
+        response = client.post(
+            "/api/v1/agents/chat/stream",
+            json={"message": "cricket in mumbai", "user_id": "u1", "fields": ["venue_name"]},
+        )
+
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        events = [json.loads(line) for line in response.text.splitlines()]
+        assert [e["event"] for e in events] == ["ack", "venues", "summary"]
+        assert events[0]["response"] == "🔍 Searching..."
+        assert events[1]["venues"] == [{"venue_name": "Nets"}]
+
+    def test_sse_framing_when_requested(self, client):
+        response = client.post(
+            "/api/v1/agents/chat/stream",
+            json={"message": "cricket in mumbai", "user_id": "u1"},
+            headers={"Accept": "text/event-stream"},
+        )
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        frames = response.text.split("\n\n")
+        assert frames[-1] == ""
+        assert frames[0].splitlines()[0] == "event: ack"
+        assert json.loads(frames[1].splitlines()[1].removeprefix("data: "))["venues"][0]["rating"] == 4.5
+        assert [f.splitlines()[0] for f in frames[:-1]] == ["event: ack", "event: venues", "event: summary"]
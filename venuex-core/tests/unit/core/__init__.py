@@ -0,0 +1 @@
+# Unit tests package 
\ No newline at end of file
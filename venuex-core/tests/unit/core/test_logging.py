@@ -0,0 +1,84 @@
+"""
+Unit tests for app.core.logging
+"""
+import io
+import logging
+
+from app.core.logging import DebugSampler, StructuredFormatter, configure_logging
+
+
+def make_record(level: int = logging.INFO, msg: str = "hello", **extra) -> logging.LogRecord:
+    record = logging.LogRecord("app.test", level, __file__, 1, msg, (), None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestStructuredFormatter:
+    """Test key=value formatting."""
+
+    def test_formats_message_and_extra_fields(self):
+        line = StructuredFormatter().format(make_record(msg="scraped page", city="mumbai", venues=40))
+
+        assert "level=INFO" in line
+        assert "logger=app.test" in line
+        assert 'msg="scraped page"' in line
+        assert "city=mumbai" in line
+        assert "venues=40" in line
+
+    def test_quotes_values_with_spaces_and_quotes(self):
+        line = StructuredFormatter().format(make_record(msg='say "hi"\nbye'))
+
+        assert r'msg="say \"hi\"\nbye"' in line
+
+
+class TestDebugSampler:
+    """Test debug record sampling."""
+
+    def test_keeps_fraction_of_debug_records(self):
+        sampler = DebugSampler(rate=0.25)
+
+        kept = sum(sampler.filter(make_record(logging.DEBUG)) for _ in range(100))
+
+        assert kept == 25
+        assert sampler.suppressed == 75
+
+    def test_other_levels_always_pass(self):
+        sampler = DebugSampler(rate=0.0)
+
+        assert sampler.filter(make_record(logging.WARNING))
+        assert not sampler.filter(make_record(logging.DEBUG))
+
+
+class TestConfigureLogging:
+    """Test handler installation and per-module levels."""
+
+    def test_module_level_enables_debug_for_one_logger(self):
+        stream = io.StringIO()
+        provider_logger = logging.getLogger("app.services.scraping.providers.playo_provider")
+        other_logger = logging.getLogger("app.services.agents")
+        try:
+            handler = configure_logging("INFO", {provider_logger.name: "debug"}, stream=stream)
+
+            provider_logger.debug("provider detail")
+            other_logger.debug("agent detail")
+
+            assert provider_logger.isEnabledFor(logging.DEBUG)
+            assert not other_logger.isEnabledFor(logging.DEBUG)
+            assert "provider detail" in stream.getvalue()
+            assert "agent detail" not in stream.getvalue()
+        finally:
+            logging.getLogger("app").removeHandler(handler)
+            logging.getLogger("app").setLevel(logging.NOTSET)
+            provider_logger.setLevel(logging.NOTSET)
+
+    def test_reconfiguring_replaces_handler(self):
+        root = logging.getLogger("app")
+        try:
+            first = configure_logging(stream=io.StringIO())
+            second = configure_logging(stream=io.StringIO())
+
+            assert first not in root.handlers
+            assert second in root.handlers
+        finally:
+            root.removeHandler(second)
+            root.setLevel(logging.NOTSET)
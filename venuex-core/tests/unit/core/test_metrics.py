@@ -0,0 +1,97 @@
+"""
+Unit tests for app.core.metrics
+"""
+import pytest
+from functools import partial
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.core.metrics import STAGE_SECONDS, Counter, GaugeFamily, Histogram, MetricsRegistry
+
+
+class TestHistogram:
+    """Test bucketing and exposition."""
+
+    def test_cumulative_buckets_sum_and_count(self):
+        histogram = Histogram("req_seconds", "Request time.", ("stage",), buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 3.0):
+            histogram.observe(value, stage="scrape")
+
+        lines = histogram.render()
+
+        assert 'req_seconds_bucket{stage="scrape",le="0.1"} 1' in lines
+        assert 'req_seconds_bucket{stage="scrape",le="1"} 3' in lines
+        assert 'req_seconds_bucket{stage="scrape",le="+Inf"} 4' in lines
+        assert 'req_seconds_sum{stage="scrape"} 4.05' in lines
+        assert 'req_seconds_count{stage="scrape"} 4' in lines
+
+    def test_time_observes_even_when_block_raises(self):
+        histogram = Histogram("op_seconds", "Op time.", ("stage",))
+
+        with pytest.raises(RuntimeError):
+            with histogram.time(stage="decode"):
+                raise RuntimeError("bad payload")
+
+        assert histogram.count(stage="decode") == 1
+
+    def test_wrong_labels_rejected(self):
+        histogram = Histogram("op_seconds", "Op time.", ("stage",))
+
+        with pytest.raises(ValueError):
+            histogram.observe(1.0, city="mumbai")
+
+
+class TestRegistry:
+    """Test rendering of a whole registry."""
+
+    def test_render_counters_gauges_and_escaping(self):
+        registry = MetricsRegistry()
+        counter = registry.register(Counter("scrapes", "Scrapes run.", ("provider",)))
+        counter.inc(provider='pla"yo')
+        registry.register(GaugeFamily("queue_depth", "Queue depth.", lambda: [({"provider": "playo"}, 3)]))
+
+        text = registry.render()
+
+        assert '# TYPE scrapes counter' in text
+        assert 'scrapes_total{provider="pla\\"yo"} 1' in text
+        assert 'queue_depth{provider="playo"} 3' in text
+
+    def test_failing_gauge_skipped(self):
+        registry = MetricsRegistry()
+        registry.register(GaugeFamily("broken", "Broken.", lambda: 1 / 0))
+        registry.register(GaugeFamily("ok", "Fine.", lambda: [({}, 1)]))
+
+        assert registry.render().splitlines()[-1] == "ok 1"
+
+    def test_duplicate_name_rejected(self):
+        registry = MetricsRegistry()
+        registry.register(Counter("x", "X."))
+
+        with pytest.raises(ValueError):
+            registry.register(Counter("x", "X."))
+
+
+class TestStageInstrumentation:
+    """Test that pipeline stages are recorded."""
+
+    @pytest.mark.asyncio
+    async def test_playo_parse_stages_labelled_by_provider_and_city(self):
+        from app.services.scraping.base import CrawlResult
+        from app.services.scraping.crawlers import BaseCrawler
+        from app.services.scraping.providers.playo_provider import PlayoProvider, create_playo_config
+
+        crawler = Mock(fallback=None, renders_pages=False, ready_times={})
+        crawler.scrape_until_ready = partial(BaseCrawler.scrape_until_ready, crawler)
+        with patch('app.services.scraping.providers.playo_provider.create_crawler', return_value=crawler):
+            provider = PlayoProvider(create_playo_config())
+        payload = '{"props": {"pageProps": {"listData": {"data": {"venueList": [{"id": "v1", "name": "Court", "city": "Pune"}]}}}}}'
+        html = f'<script id="__NEXT_DATA__" type="application/json">{payload}</script>'
+        provider.crawler.scrape_single_url = AsyncMock(
+            return_value=CrawlResult(platform="playo", url="u", success=True, raw_html_content=html)
+        )
+        before = {stage: STAGE_SECONDS.count(stage=stage, provider="playo", city="pune")
+                  for stage in ("extract", "decode", "convert")}
+
+        await provider.get_venue_details("pune")
+
+        for stage, count in before.items():
+            assert STAGE_SECONDS.count(stage=stage, provider="playo", city="pune") == count + 1
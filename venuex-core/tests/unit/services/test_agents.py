@@ -7,37 +7,60 @@ from datetime import datetime
 from typing import Dict, Any, List
 
 from app.services.agents import AgentRouter
+from app.services.scraping.base import ProviderOutcome, VenueInfo, VenueListing, VenueRecord
 
 
+def make_records(slots: List[Dict[str, Any]]):
+    """Listing records for slot-like dicts of platform, venue_name, rating and is_bookable."""
+    venues = [
+        VenueInfo(
+            platform=slot['platform'],
+            name=slot['venue_name'],
+            city="Mumbai",
+            rating=slot['rating'],
+            is_bookable=slot['is_bookable'],
+        )
+        for slot in slots
+    ]
+    return VenueListing(venues).records
+
+
+def outcomes_of(*listings: VenueListing):
+    """Stand-in for VenueService.iter_venue_details yielding one ok outcome per listing."""
+    async def outcomes(location):
+        for index, listing in enumerate(listings):
+            yield ProviderOutcome(provider=f"provider{index}", status="ok", listing=listing)
+    return outcomes
+
 class TestAgentRouter:
     """Test suite for AgentRouter class."""
     
     @pytest.fixture
-    def agent_router(self, mock_settings):
+    def agent_router(self, mock_settings, mock_venue_service):
         """Create an AgentRouter instance for testing."""
         with patch('app.services.agents.settings', mock_settings):
             with patch('app.services.agents.ChatOpenAI') as mock_chat_openai:
                 mock_chat_openai.return_value = Mock()
-                return AgentRouter()
+                return AgentRouter(mock_venue_service)
     
     @pytest.fixture
-    def agent_router_no_openai(self):
+    def agent_router_no_openai(self, mock_venue_service):
         """Create an AgentRouter instance without OpenAI for testing fallback."""
         with patch('app.services.agents.settings') as mock_settings:
             mock_settings.openai_api_key = None
-            return AgentRouter()
+            return AgentRouter(mock_venue_service)
 
     class TestInit:
         """Test AgentRouter initialization."""
         
-        def test_init_with_openai_api_key(self, mock_settings):
+        def test_init_with_openai_api_key(self, mock_settings, mock_venue_service):
             """Test initialization when OpenAI API key is available."""
             with patch('app.services.agents.settings', mock_settings):
                 with patch('app.services.agents.ChatOpenAI') as mock_chat_openai:
                     mock_llm = Mock()
                     mock_chat_openai.return_value = mock_llm
                     
-                    router = AgentRouter()
+                    router = AgentRouter(mock_venue_service)
                     
                     assert router.llm == mock_llm
                     mock_chat_openai.assert_called_once_with(
@@ -46,26 +69,25 @@ class TestAgentRouter:
                         openai_api_key="test-api-key"
                     )
         
-        def test_init_without_openai_api_key(self):
+        def test_init_without_openai_api_key(self, mock_venue_service):
             """Test initialization when OpenAI API key is not available."""
             with patch('app.services.agents.settings') as mock_settings:
                 mock_settings.openai_api_key = None
                 
-                router = AgentRouter()
+                router = AgentRouter(mock_venue_service)
                 
                 assert router.llm is None
         
-        def test_init_with_openai_exception(self, mock_settings, capsys):
+        def test_init_with_openai_exception(self, mock_settings, mock_venue_service, caplog):
             """Test initialization when OpenAI initialization raises an exception."""
             with patch('app.services.agents.settings', mock_settings):
                 with patch('app.services.agents.ChatOpenAI') as mock_chat_openai:
                     mock_chat_openai.side_effect = Exception("OpenAI connection failed")
                     
-                    router = AgentRouter()
+                    router = AgentRouter(mock_venue_service)
                     
                     assert router.llm is None
-                    captured = capsys.readouterr()
-                    assert "Warning: Could not initialize OpenAI" in captured.out
+                    assert "Could not initialize OpenAI" in caplog.text
 
     class TestExtractSearchArgs:
         """Test _extract_search_args method."""
@@ -126,6 +148,20 @@ class TestAgentRouter:
             
             assert result is None
         
+        def test_extract_locality_resolves_to_city(self, agent_router):
+            """Test that a locality maps to its city and is kept in the args."""
+            message = "football turfs in Andheri West"
+            result = agent_router._extract_search_args(message)
+            
+            assert result == {"sport": "football", "location": "mumbai", "locality": "andheri west"}
+        
+        def test_extract_tolerates_typos(self, agent_router):
+            """Test that misspelt sports and cities are still recognised."""
+            message = "criket grounds in banglore"
+            result = agent_router._extract_search_args(message)
+            
+            assert result == {"sport": "cricket", "location": "bangalore"}
+        
         def test_case_insensitive(self, agent_router):
             """Test that extraction is case insensitive."""
             message = "CRICKET VENUES IN MUMBAI"
@@ -137,44 +173,56 @@ class TestAgentRouter:
         """Test _search_venues_immediately method."""
         
         @pytest.mark.asyncio
-        async def test_search_venues_success(self, agent_router, sample_venue_data):
+        async def test_search_venues_success(self, agent_router, sample_venue_data, mock_venue_service):
             """Test successful venue search."""
-            with patch('app.services.scraping.venue_service.venue_service') as mock_venue_service:
-                mock_venue_service.get_venue_details = AsyncMock(return_value=sample_venue_data)
+            mock_venue_service.iter_venue_details = Mock(side_effect=outcomes_of(VenueListing(sample_venue_data)))
                 
-                result = await agent_router._search_venues_immediately("cricket", "mumbai")
+            result = await agent_router._search_venues_immediately("cricket", "mumbai")
                 
-                assert len(result) == 1  # Only cricket venue should be returned
-                assert result[0]['venue_name'] == 'Test Cricket Ground'
-                assert result[0]['sport'] == 'cricket'
-                assert result[0]['platform'] == 'Playo'
-                mock_venue_service.get_venue_details.assert_called_once_with("mumbai")
+            assert len(result) == 1  # Only cricket venue should be returned
+            assert result[0]['venue_name'] == 'Test Cricket Ground'
+            assert result[0]['sport'] == 'cricket'
+            assert result[0]['platform'] == 'Playo'
+            mock_venue_service.iter_venue_details.assert_called_once_with("mumbai")
         
         
         @pytest.mark.asyncio
-        async def test_search_venues_service_exception(self, agent_router, capsys):
+        async def test_search_venues_service_exception(self, agent_router, caplog, mock_venue_service):
             """Test venue search when service raises an exception."""
-            with patch('app.services.scraping.venue_service.venue_service') as mock_venue_service:
-                mock_venue_service.get_venue_details = AsyncMock(side_effect=Exception("Service error"))
+            mock_venue_service.iter_venue_details = Mock(side_effect=Exception("Service error"))
                 
-                result = await agent_router._search_venues_immediately("cricket", "mumbai")
+            result = await agent_router._search_venues_immediately("cricket", "mumbai")
                 
-                assert result == []
-                captured = capsys.readouterr()
-                assert "Error using venue service" in captured.out
+            assert result == []
+            assert "Error using venue service" in caplog.text
         
         @pytest.mark.asyncio
-        async def test_search_venues_filters_by_sport(self, agent_router, sample_venue_data):
+        async def test_search_venues_filters_by_sport(self, agent_router, sample_venue_data, mock_venue_service):
             """Test that venues are filtered by sport."""
-            with patch('app.services.scraping.venue_service.venue_service') as mock_venue_service:
-                mock_venue_service.get_venue_details = AsyncMock(return_value=sample_venue_data)
+            mock_venue_service.iter_venue_details = Mock(side_effect=outcomes_of(VenueListing(sample_venue_data)))
+                
+            # Search for football, should only return football venue
+            result = await agent_router._search_venues_immediately("football", "mumbai")
+                
+            assert len(result) == 1
+            assert result[0]['venue_name'] == 'Elite Football Club'
+            assert result[0]['sport'] == 'football'
+        
+        @pytest.mark.asyncio
+        async def test_search_venues_reuses_records_across_requests(self, agent_router, sample_venue_data, mock_venue_service):
+            """Test that records are built once per listing, not once per request."""
+            listing = VenueListing(sample_venue_data)
+            mock_venue_service.iter_venue_details = Mock(side_effect=outcomes_of(listing))
                 
-                # Search for football, should only return football venue
-                result = await agent_router._search_venues_immediately("football", "mumbai")
+            first = await agent_router._search_venues_immediately("cricket", "mumbai")
+            second = await agent_router._search_venues_immediately("cricket", "mumbai")
                 
-                assert len(result) == 1
-                assert result[0]['venue_name'] == 'Elite Football Club'
-                assert result[0]['sport'] == 'football'
+            assert first == second
+            assert first[0] is not second[0]  # each response gets its own dicts
+            first[0]['sports_offered'].append('Tennis')
+            assert 'Tennis' not in listing.venues[0].sports_offered
+            assert listing.matching("cricket") is listing.matching("Cricket")
+            assert first[0]['detected_at'] == listing.fetched_at.isoformat()
 
     class TestProcessMessage:
         """Test process_message method."""
@@ -183,23 +231,23 @@ class TestAgentRouter:
         async def test_process_message_venue_search_success(self, agent_router, sample_venue_data):
             """Test processing message with successful venue search."""
             with patch.object(agent_router, '_extract_search_args') as mock_extract:
-                with patch.object(agent_router, '_search_venues_immediately') as mock_search:
+                with patch.object(agent_router, '_find_venue_records') as mock_search:
                     mock_extract.return_value = {"sport": "cricket", "location": "mumbai"}
-                    mock_search.return_value = [
+                    mock_search.return_value = make_records([
                         {
                             'platform': 'Playo',
                             'venue_name': 'Test Cricket Ground',
                             'rating': 4.5,
                             'is_bookable': True
                         }
-                    ]
+                    ])
                     
                     result = await agent_router.process_message("Find cricket venues in Mumbai", "user123")
                     
                     assert "Found 1 venues for cricket in mumbai" in result['response']
                     assert "Test Cricket Ground" in result['response']
                     assert "✅ Available" in result['response']
-                    assert len(result['slots_found']) == 1
+                    assert len(result['records']) == 1
                     mock_extract.assert_called_once_with("Find cricket venues in Mumbai")
                     mock_search.assert_called_once_with("cricket", "mumbai")
         
@@ -207,15 +255,15 @@ class TestAgentRouter:
         async def test_process_message_no_venues_found(self, agent_router):
             """Test processing message when no venues are found."""
             with patch.object(agent_router, '_extract_search_args') as mock_extract:
-                with patch.object(agent_router, '_search_venues_immediately') as mock_search:
+                with patch.object(agent_router, '_find_venue_records') as mock_search:
                     mock_extract.return_value = {"sport": "cricket", "location": "mumbai"}
-                    mock_search.return_value = []
+                    mock_search.return_value = ()
                     
                     result = await agent_router.process_message("Find cricket venues in Mumbai", "user123")
                     
                     assert "❌ No venues found for cricket in mumbai" in result['response']
                     assert "This could be due to:" in result['response']
-                    assert result['slots_found'] == []
+                    assert result['records'] == ()
         
         @pytest.mark.asyncio
         async def test_process_message_no_search_args(self, agent_router):
@@ -227,7 +275,7 @@ class TestAgentRouter:
                 
                 assert "Hello! I'm your sports booking assistant" in result['response']
                 assert "cricket, football, and badminton" in result['response']
-                assert result['slots_found'] == []
+                assert result['records'] == ()
         
         @pytest.mark.asyncio
         async def test_process_message_sports_mentioned_no_location(self, agent_router):
@@ -239,15 +287,15 @@ class TestAgentRouter:
                 
                 assert "I can help you find sports venues!" in result['response']
                 assert "Please specify both the sport and location" in result['response']
-                assert result['slots_found'] == []
+                assert result['records'] == ()
         
         @pytest.mark.asyncio
         async def test_process_message_multiple_venues_display(self, agent_router):
             """Test processing message with multiple venues for display formatting."""
             with patch.object(agent_router, '_extract_search_args') as mock_extract:
-                with patch.object(agent_router, '_search_venues_immediately') as mock_search:
+                with patch.object(agent_router, '_find_venue_records') as mock_search:
                     mock_extract.return_value = {"sport": "cricket", "location": "mumbai"}
-                    mock_search.return_value = [
+                    mock_search.return_value = make_records([
                         {
                             'platform': 'Playo',
                             'venue_name': 'Ground 1',
@@ -272,7 +320,7 @@ class TestAgentRouter:
                             'rating': 4.0,
                             'is_bookable': True
                         }
-                    ]
+                    ])
                     
                     result = await agent_router.process_message("Find cricket venues in Mumbai", "user123")
                     
@@ -283,25 +331,106 @@ class TestAgentRouter:
                     assert "... and 1 more venues" in result['response']
                     assert "✅ Available" in result['response']
                     assert "❌ Not Available" in result['response']
-                    assert len(result['slots_found']) == 4
+                    assert len(result['records']) == 4
+        
+        @pytest.mark.asyncio
+        async def test_process_message_projects_only_the_venues_it_names(self, agent_router):
+            """Test that a large result only builds slot dicts for the top three venues."""
+            records = make_records([
+                {'platform': 'Playo', 'venue_name': f'Ground {i}', 'rating': 4.0, 'is_bookable': True}
+                for i in range(50)
+            ])
+            with patch.object(agent_router, '_extract_search_args', return_value={"sport": "cricket", "location": "mumbai"}), \
+                    patch.object(agent_router, '_find_venue_records', AsyncMock(return_value=records)), \
+                    patch.object(VenueRecord, 'to_slot', autospec=True, side_effect=VenueRecord.to_slot) as to_slot:
+                result = await agent_router.process_message("Find cricket venues in Mumbai", "user123")
+            
+            assert to_slot.call_count == 3
+            assert result['records'] is records
+            assert "... and 47 more venues" in result['response']
         
         @pytest.mark.asyncio
         async def test_process_message_venue_without_rating(self, agent_router):
             """Test processing message with venue that has no rating."""
             with patch.object(agent_router, '_extract_search_args') as mock_extract:
-                with patch.object(agent_router, '_search_venues_immediately') as mock_search:
+                with patch.object(agent_router, '_find_venue_records') as mock_search:
                     mock_extract.return_value = {"sport": "cricket", "location": "mumbai"}
-                    mock_search.return_value = [
+                    mock_search.return_value = make_records([
                         {
                             'platform': 'Playo',
                             'venue_name': 'Test Ground',
                             'rating': 0, 
                             'is_bookable': True
                         }
-                    ]
+                    ])
                     
                     result = await agent_router.process_message("Find cricket venues in Mumbai", "user123")
                     
                     # Should not include rating in response when rating is 0
                     assert "⭐" not in result['response']
-                    assert "Test Ground" in result['response'] 
\ No newline at end of file
+                    assert "Test Ground" in result['response'] 
+
+    class TestStreamMessage:
+        """Test streamed chat events."""
+        
+        @staticmethod
+        async def collect(agent_router, message):
+            return [event async for event in agent_router.stream_message(message, "user123")]
+        
+        @pytest.mark.asyncio
+        async def test_stream_ack_venues_then_summary(self, agent_router, sample_venue_data, mock_venue_service):
+            """Test that venues arrive per provider between the ack and the summary."""
+            listing = VenueListing(sample_venue_data)
+            
+            async def outcomes(location):
+                yield ProviderOutcome(provider="playo", status="ok", listing=listing)
+                yield ProviderOutcome(provider="hudle", status="timeout", error="No response within 20.0s")
+            
+            mock_venue_service.iter_venue_details = outcomes
+            events = await self.collect(agent_router, "Find cricket venues in Mumbai")
+            
+            assert [e["event"] for e in events] == ["ack", "venues", "provider_error", "summary"]
+            assert events[0]["sport"] == "cricket" and events[0]["location"] == "mumbai"
+            assert [v["venue_name"] for v in events[1]["venues"]] == [r.venue.name for r in listing.matching("cricket")]
+            assert events[2]["provider"] == "hudle"
+            assert events[3]["total_found"] == len(events[1]["venues"])
+        
+        @pytest.mark.asyncio
+        async def test_stream_and_chat_cover_the_same_providers(self, agent_router, sample_venue_data, mock_venue_service):
+            """Test that the streamed and the one-shot response list the same venues."""
+            other = VenueListing([VenueInfo(platform="Hudle", name="Hudle Nets", city="Mumbai", sports_offered=["Cricket"])])
+            mock_venue_service.iter_venue_details = Mock(side_effect=outcomes_of(VenueListing(sample_venue_data), other))
+            events = await self.collect(agent_router, "Find cricket venues in Mumbai")
+            result = await agent_router.process_message("Find cricket venues in Mumbai", "user123")
+            
+            streamed = [v["venue_name"] for e in events if e["event"] == "venues" for v in e["venues"]]
+            assert streamed == [r.venue.name for r in result["records"]]
+            assert "Hudle Nets" in streamed
+            assert events[-1]["total_found"] == len(result["records"])
+        
+        @pytest.mark.asyncio
+        async def test_stream_without_search_args(self, agent_router):
+            """Test that a message without intent yields only the fallback summary."""
+            events = await self.collect(agent_router, "Hello there")
+            
+            assert len(events) == 1
+            assert events[0]["event"] == "summary"
+            assert events[0]["total_found"] == 0
+        
+        @pytest.mark.asyncio
+        async def test_stream_without_search_args_resolves_once(self, agent_router):
+            """Test that the fallback summary reuses the failed resolution instead of retrying it."""
+            with patch.object(agent_router, '_resolve_search_args', AsyncMock(return_value=None)) as resolve:
+                events = await self.collect(agent_router, "Find cricket venues")
+            
+            resolve.assert_awaited_once()
+            assert "specify both the sport and location" in events[0]["response"]
+        
+        @pytest.mark.asyncio
+        async def test_stream_service_error_still_summarises(self, agent_router, mock_venue_service):
+            """Test that a failing fan-out ends with a no-venues summary."""
+            mock_venue_service.iter_venue_details = Mock(side_effect=Exception("No provider"))
+            events = await self.collect(agent_router, "Find cricket venues in Mumbai")
+            
+            assert [e["event"] for e in events] == ["ack", "summary"]
+            assert "No venues found" in events[-1]["response"]
@@ -0,0 +1,148 @@
+"""
+Unit tests for app.services.scraping.circuit_breaker.CircuitBreaker
+"""
+import pytest
+from unittest.mock import AsyncMock
+
+from app.services.scraping.base import BaseProvider, CircuitOpenError, ProviderConfig, VenueInfo
+from app.services.scraping.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class StubProvider(BaseProvider):
+    """Provider whose scrape and health check are controlled by the test."""
+
+    def __init__(self, config: ProviderConfig):
+        super().__init__(config)
+        self.scrape = AsyncMock(return_value=[])
+        self.healthy = True
+
+    @property
+    def supported_cities(self):
+        return ["mumbai"]
+
+    async def get_venue_details(self, location):
+        return await self.scrape(location)
+
+    async def health_check(self):
+        return {'provider': self.name, 'status': 'healthy' if self.healthy else 'unhealthy'}
+
+
+async def failing():
+    raise RuntimeError("upstream down")
+
+
+async def succeeding():
+    return "ok"
+
+
+class TestCircuitBreaker:
+    """Test state transitions."""
+
+    @pytest.mark.asyncio
+    async def test_opens_after_threshold_and_fails_fast(self, clock):
+        breaker = CircuitBreaker("playo", failure_threshold=2, cooldown=10, clock=clock)
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await breaker.call(failing)
+
+        fn = AsyncMock()
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(fn)
+
+        assert breaker.state is CircuitState.OPEN
+        fn.assert_not_called()
+        assert breaker.stats()['rejected'] == 1
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failure_count(self, clock):
+        breaker = CircuitBreaker("playo", failure_threshold=2, cooldown=10, clock=clock)
+        with pytest.raises(RuntimeError):
+            await breaker.call(failing)
+        await breaker.call(succeeding)
+        with pytest.raises(RuntimeError):
+            await breaker.call(failing)
+
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_without_probe(self, clock):
+        breaker = CircuitBreaker("playo", failure_threshold=1, cooldown=10, clock=clock)
+        with pytest.raises(RuntimeError):
+            await breaker.call(failing)
+
+        clock.now += 10
+        with pytest.raises(RuntimeError):
+            await breaker.call(failing)
+        assert breaker.state is CircuitState.OPEN
+
+        clock.now += 10
+        assert await breaker.call(succeeding) == "ok"
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_probe_decides_half_open(self, clock):
+        probe = AsyncMock(return_value=False)
+        breaker = CircuitBreaker("playo", failure_threshold=1, cooldown=10, probe=probe, clock=clock)
+        with pytest.raises(RuntimeError):
+            await breaker.call(failing)
+
+        clock.now += 10
+        fn = AsyncMock(return_value="ok")
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(fn)
+        fn.assert_not_called()
+
+        clock.now += 10
+        probe.return_value = True
+        assert await breaker.call(fn) == "ok"
+        assert breaker.state is CircuitState.CLOSED
+        assert probe.call_count == 2
+
+
+class TestProviderCircuit:
+    """Test BaseProvider.fetch_venue_details fallback behaviour."""
+
+    @pytest.fixture
+    def provider(self, clock):
+        config = ProviderConfig(name="stub", base_url="https://example.com",
+                                circuit_failure_threshold=1, circuit_cooldown=30)
+        provider = StubProvider(config)
+        provider.circuit_breaker._clock = clock
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_last_good_listing(self, provider):
+        venue = VenueInfo(platform="stub", venue_id="1", name="Ground", city="Mumbai")
+        provider.scrape.return_value = [venue]
+        await provider.fetch_venue_details("mumbai")
+
+        provider.scrape.side_effect = RuntimeError("down")
+        with pytest.raises(RuntimeError):
+            await provider.fetch_venue_details("mumbai")
+
+        venues = await provider.fetch_venue_details("mumbai")
+        assert venues == [venue]
+        assert provider.fallbacks_served == 1
+        assert provider.scrape.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_without_fallback_raises(self, provider):
+        provider.scrape.side_effect = RuntimeError("down")
+        with pytest.raises(RuntimeError):
+            await provider.fetch_venue_details("mumbai")
+
+        with pytest.raises(CircuitOpenError):
+            await provider.fetch_venue_details("mumbai")
+
+    @pytest.mark.asyncio
+    async def test_health_check_probe_closes_circuit(self, provider, clock):
+        provider.scrape.side_effect = RuntimeError("down")
+        with pytest.raises(RuntimeError):
+            await provider.fetch_venue_details("mumbai")
+
+        clock.now += 30
+        provider.scrape.side_effect = None
+        provider.scrape.return_value = []
+        await provider.fetch_venue_details("mumbai")
+
+        assert provider.circuit_breaker.state is CircuitState.CLOSED
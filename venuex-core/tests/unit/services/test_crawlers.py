@@ -0,0 +1,384 @@
+"""
+Unit tests for the crawler backends in app.services.scraping.crawlers
+"""
+import gzip
+import json
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.services.scraping.base import CrawlResult
+from app.services.scraping.crawlers import (
+    BaseCrawler,
+    CassetteStore,
+    FirecrawlCrawler,
+    HttpCrawler,
+    ReadyTimeTracker,
+    RecordingCrawler,
+    ReplayCrawler,
+    create_crawler,
+)
+
+URL = "https://playo.co/venues/mumbai/sports/all"
+OPTIONS = {"formats": ["rawHtml"], "timeout": 30000}
+
+
+class StubCrawler(BaseCrawler):
+    """Returns canned results instead of scraping."""
+
+    def __init__(self, *results: CrawlResult):
+        super().__init__()
+        self.results = list(results)
+        self.options = []
+
+    async def _scrape(self, url, platform, scrape_options=None):
+        self.options.append(scrape_options)
+        return self.results.pop(0)
+
+
+class RenderingStubCrawler(StubCrawler):
+    renders_pages = True
+
+
+def page(html: str = "<html>venues</html>", success: bool = True) -> CrawlResult:
+    return CrawlResult(
+        platform="playo",
+        url=URL,
+        success=success,
+        raw_html_content=html if success else None,
+        content_bytes=len(html) if success else 0,
+        error_message=None if success else "boom",
+    )
+
+
+class TestCassetteStore:
+    """Test saving and loading cassettes."""
+
+    def test_round_trip_is_gzip_compressed(self, tmp_path):
+        store = CassetteStore(tmp_path)
+
+        path = store.save(URL, OPTIONS, page("<html>" + "x" * 10_000 + "</html>"))
+        loaded = store.load(URL, OPTIONS)
+
+        assert loaded.raw_html_content == "<html>" + "x" * 10_000 + "</html>"
+        assert path.stat().st_size < 1000
+        assert json.loads(gzip.decompress(path.read_bytes()))["url"] == URL
+        assert len(store) == 1
+
+    def test_options_are_part_of_the_key(self, tmp_path):
+        store = CassetteStore(tmp_path)
+        store.save(URL, OPTIONS, page())
+
+        assert store.load(URL, {**OPTIONS, "waitFor": 3000}) is None
+        assert store.load(URL, dict(reversed(list(OPTIONS.items())))) is not None
+
+
+class TestRecordingCrawler:
+    """Test recording live results."""
+
+    @pytest.mark.asyncio
+    async def test_records_only_successful_results(self, tmp_path):
+        store = CassetteStore(tmp_path)
+        crawler = RecordingCrawler(StubCrawler(page(success=False), page()), store)
+
+        first = await crawler.scrape_single_url(URL, "playo", OPTIONS)
+        assert not first.success
+        assert store.load(URL, OPTIONS) is None
+
+        second = await crawler.scrape_single_url(URL, "playo", OPTIONS, profile="listing")
+        assert second.success
+        assert store.load(URL, OPTIONS).raw_html_content == "<html>venues</html>"
+        assert crawler.recorded == 1
+        assert crawler.stats.snapshot()["listing"]["scrapes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_records_only_the_ready_page_under_the_first_request(self, tmp_path):
+        store = CassetteStore(tmp_path)
+        inner = RenderingStubCrawler(page("<html>loading</html>"), page())
+        crawler = RecordingCrawler(inner, store)
+
+        result = await crawler.scrape_until_ready(URL, "playo", lambda html: "venues" in html, OPTIONS)
+
+        assert result.raw_html_content == "<html>venues</html>"
+        assert store.load(URL, OPTIONS).raw_html_content == "<html>venues</html>"
+        assert store.load(URL, inner.options[1]) is None
+        assert crawler.recorded == 1
+
+    @pytest.mark.asyncio
+    async def test_page_that_never_became_ready_is_not_recorded(self, tmp_path):
+        store = CassetteStore(tmp_path)
+        crawler = RecordingCrawler(RenderingStubCrawler(page("<html>loading</html>")), store)
+
+        await crawler.scrape_until_ready(URL, "playo", lambda html: "venues" in html, OPTIONS, max_attempts=1)
+
+        assert store.load(URL, OPTIONS) is None
+        assert crawler.recorded == 0
+
+
+class TestReplayCrawler:
+    """Test offline replay with injected latency and failures."""
+
+    @pytest.mark.asyncio
+    async def test_replays_recorded_page(self, tmp_path):
+        store = CassetteStore(tmp_path)
+        store.save(URL, OPTIONS, page())
+        crawler = ReplayCrawler(store, latency=0.2, jitter=0.1, seed=1)
+
+        with patch('app.services.scraping.crawlers.replay.asyncio.sleep', new=AsyncMock()) as sleep:
+            result = await crawler.scrape_single_url(URL, "playo", OPTIONS)
+
+        assert result.success
+        assert result.raw_html_content == "<html>venues</html>"
+        delay = sleep.await_args.args[0]
+        assert 0.1 <= delay <= 0.3
+        assert result.crawl_duration == delay
+
+    @pytest.mark.asyncio
+    async def test_same_seed_gives_same_failures(self, tmp_path):
+        store = CassetteStore(tmp_path)
+        store.save(URL, OPTIONS, page())
+
+        async def outcomes(seed):
+            crawler = ReplayCrawler(store, failure_rate=0.5, seed=seed)
+            return [(await crawler.scrape_single_url(URL, "playo", OPTIONS)).success for _ in range(20)]
+
+        first = await outcomes(3)
+
+        assert first == await outcomes(3)
+        assert True in first and False in first
+
+    @pytest.mark.asyncio
+    async def test_missing_cassette_fails(self, tmp_path):
+        crawler = ReplayCrawler(CassetteStore(tmp_path))
+
+        result = await crawler.scrape_single_url(URL, "playo", OPTIONS)
+
+        assert not result.success
+        assert "No cassette" in result.error_message
+        assert crawler.missing == 1
+
+
+class TestHttpCrawler:
+    """Test direct fetches over an injected client."""
+
+    @staticmethod
+    def crawler(handler) -> HttpCrawler:
+        return HttpCrawler(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    @pytest.mark.asyncio
+    async def test_successful_fetch_returns_raw_html(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="<html>venues</html>")
+
+        result = await self.crawler(handler).scrape_single_url(URL, "playo", OPTIONS, profile="listing")
+
+        assert result.success
+        assert result.raw_html_content == "<html>venues</html>"
+        assert result.profile == "listing"
+        assert requests[0].extensions["timeout"]["read"] == 10.0
+
+    @pytest.mark.asyncio
+    async def test_profile_timeout_only_shortens_the_client_timeout(self):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, text="<html>venues</html>")
+
+        crawler = self.crawler(handler)
+        await crawler.scrape_single_url(URL, "playo", {"timeout": 2000})
+        with patch('app.services.scraping.crawlers.http_crawler.settings.crawler_http_timeout_seconds', 1.0):
+            await crawler.scrape_single_url(URL, "playo", OPTIONS)
+
+        assert [r.extensions["timeout"]["read"] for r in requests] == [2.0, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_closes_only_a_client_it_created(self):
+        injected = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200)))
+        await HttpCrawler(client=injected).close()
+        assert not injected.is_closed
+
+        crawler = HttpCrawler()
+        own = crawler.client
+        await crawler.close()
+        assert own.is_closed
+        await injected.aclose()
+
+    @pytest.mark.asyncio
+    async def test_error_status_is_a_failed_result(self):
+        result = await self.crawler(lambda request: httpx.Response(403)).scrape_single_url(URL, "playo")
+
+        assert not result.success
+        assert "HTTP 403" in result.error_message
+
+    @pytest.mark.asyncio
+    async def test_transport_error_is_a_failed_result(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        result = await self.crawler(handler).scrape_single_url(URL, "playo")
+
+        assert not result.success
+        assert "ConnectError" in result.error_message
+
+    @pytest.mark.asyncio
+    async def test_warmup_pre_connects_and_warms_fallback(self):
+        methods = []
+
+        def handler(request):
+            methods.append(request.method)
+            return httpx.Response(200)
+
+        crawler = self.crawler(handler)
+        crawler.fallback = StubCrawler()
+        crawler.fallback.warmup = AsyncMock()
+
+        await crawler.warmup("https://playo.co")
+
+        assert methods == ["HEAD"]
+        crawler.fallback.warmup.assert_awaited_once_with("https://playo.co")
+
+    @pytest.mark.asyncio
+    async def test_warmup_failure_is_not_raised(self):
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        await self.crawler(handler).warmup("https://playo.co")
+
+
+class TestReadiness:
+    """Test adaptive waiting for provider-declared page readiness."""
+
+    @staticmethod
+    def ready(html: str) -> bool:
+        return "venues" in html
+
+    def test_budget_tracks_observed_times_within_bounds(self):
+        tracker = ReadyTimeTracker(ceiling=10.0, floor=0.5)
+        assert tracker.budget() == 10.0
+
+        for seconds in (0.1, 0.2, 0.1):
+            tracker.record(seconds)
+        assert tracker.budget() == 0.5
+
+        tracker.record(8.0)
+        assert tracker.budget() == 10.0
+
+    def test_pages_not_ready_widen_the_budget_again(self):
+        tracker = ReadyTimeTracker(ceiling=10.0, floor=0.25)
+        for _ in range(47):
+            tracker.record(0.0)
+        assert tracker.budget() == 0.25
+
+        for _ in range(3):
+            tracker.record_not_ready()
+        assert tracker.budget() == 10.0
+
+    def test_next_wait_aims_for_observed_p90_then_doubles(self):
+        tracker = ReadyTimeTracker(ceiling=10.0, floor=0.25, default_wait=1.0)
+        assert tracker.next_wait(0.0) == 1.0
+
+        for seconds in (1.5, 2.0, 3.0):
+            tracker.record(seconds)
+        assert tracker.next_wait(1.0) == 3.0
+        assert tracker.next_wait(4.0) == 8.0
+
+    @pytest.mark.asyncio
+    async def test_rendering_backend_retries_with_extra_wait(self):
+        crawler = RenderingStubCrawler(page("<html>loading</html>"), page())
+
+        result = await crawler.scrape_until_ready(URL, "playo", self.ready, OPTIONS, max_wait=10.0)
+
+        assert result.raw_html_content == "<html>venues</html>"
+        assert crawler.options[0] == OPTIONS
+        wait, scrape = crawler.options[1]["actions"]
+        assert wait == {"type": "wait", "milliseconds": 1000}
+        assert scrape == {"type": "scrape"}
+        tracker = crawler.ready_times["playo"]
+        assert (tracker.ready, tracker.retries) == (1, 1)
+        # The requested wait is the sample, not the time the stub took
+        assert tracker.quantile(0.5) == 1.0
+
+    @pytest.mark.asyncio
+    async def test_attempts_are_capped(self):
+        crawler = RenderingStubCrawler(*(page("<html>loading</html>") for _ in range(5)))
+
+        result = await crawler.scrape_until_ready(URL, "playo", self.ready, OPTIONS, max_attempts=3)
+
+        assert result.raw_html_content == "<html>loading</html>"
+        assert len(crawler.options) == 3
+        assert [o["actions"][0]["milliseconds"] for o in crawler.options[1:]] == [1000, 2000]
+        assert crawler.ready_times["playo"].not_ready == 1
+
+    @pytest.mark.asyncio
+    async def test_non_rendering_backend_fetches_once(self):
+        crawler = StubCrawler(page("<html>loading</html>"))
+
+        result = await crawler.scrape_until_ready(URL, "playo", self.ready, OPTIONS)
+
+        assert result.raw_html_content == "<html>loading</html>"
+        assert crawler.ready_times["playo"].not_ready == 1
+
+    @pytest.mark.asyncio
+    async def test_spent_budget_returns_last_page(self):
+        crawler = RenderingStubCrawler(page("<html>loading</html>"))
+
+        result = await crawler.scrape_until_ready(URL, "playo", self.ready, OPTIONS, max_wait=0.0)
+
+        assert result.raw_html_content == "<html>loading</html>"
+        assert len(crawler.options) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_scrape_is_not_retried(self):
+        crawler = RenderingStubCrawler(page(success=False))
+
+        result = await crawler.scrape_until_ready(URL, "playo", self.ready, OPTIONS)
+
+        assert not result.success
+        assert crawler.ready_times["playo"].retries == 0
+
+
+class TestCreateCrawler:
+    """Test backend selection from settings."""
+
+    def test_per_provider_backend_overrides_default(self, tmp_path):
+        with patch('app.services.scraping.crawlers.factory.settings') as settings:
+            settings.crawler_backend = "firecrawl"
+            settings.crawler_backends = {"playo": "replay"}
+            settings.crawler_cassette_dir = str(tmp_path)
+            settings.crawler_replay_latency_seconds = 0.5
+            settings.crawler_replay_jitter_seconds = 0.0
+            settings.crawler_replay_failure_rate = 0.0
+            settings.crawler_replay_seed = None
+
+            playo = create_crawler("playo")
+            other = create_crawler("other")
+
+        assert isinstance(playo, ReplayCrawler)
+        assert playo.store.directory == tmp_path / "playo"
+        assert playo.latency == 0.5
+        assert isinstance(other, FirecrawlCrawler)
+
+    def test_http_backend_falls_back_to_firecrawl(self, tmp_path):
+        with patch('app.services.scraping.crawlers.factory.settings') as settings:
+            settings.crawler_backend = "http"
+            settings.crawler_backends = {}
+            settings.crawler_cassette_dir = str(tmp_path)
+            settings.crawler_http_fallback = True
+
+            crawler = create_crawler("playo")
+
+        assert isinstance(crawler, HttpCrawler)
+        assert isinstance(crawler.fallback, FirecrawlCrawler)
+
+    def test_unknown_backend_rejected(self):
+        with patch('app.services.scraping.crawlers.factory.settings') as settings:
+            settings.crawler_backend = "selenium"
+            settings.crawler_backends = {}
+
+            with pytest.raises(ValueError, match="Unknown crawler backend"):
+                create_crawler("playo")
@@ -0,0 +1,106 @@
+"""
+Unit tests for app.services.intent.gazetteer.Gazetteer
+"""
+import pytest
+
+from app.services.intent import Gazetteer, SearchIntent, load_gazetteer
+
+
+@pytest.fixture
+def gazetteer():
+    return Gazetteer.from_dict({
+        'sports': {
+            'cricket': {'aliases': ['box cricket']},
+            'football': {'aliases': ['soccer']},
+        },
+        'cities': {
+            'mumbai': {'aliases': ['bombay'], 'localities': ['andheri', 'andheri west', 'navi mumbai']},
+            'bangalore': {'aliases': ['bengaluru'], 'localities': ['hsr layout']},
+            'delhi': {'aliases': ['delhi ncr'], 'localities': ['noida']},
+        },
+    })
+
+
+class TestGazetteerMatch:
+    """Test phrase matching."""
+
+    def test_longest_phrase_wins(self, gazetteer):
+        matches = gazetteer.match("box cricket in andheri west")
+
+        assert [(m.kind, m.canonical) for m in matches] == [('sport', 'cricket'), ('locality', 'andheri west')]
+
+    def test_multi_token_locality_not_split_into_city(self, gazetteer):
+        matches = gazetteer.match("football in navi mumbai")
+
+        assert matches[-1].kind == 'locality'
+        assert matches[-1].city == 'mumbai'
+
+    def test_typos_are_corrected(self, gazetteer):
+        matches = gazetteer.match("criket in banglore")
+
+        assert [m.canonical for m in matches] == ['cricket', 'bangalore']
+        assert all(m.fuzzy for m in matches)
+
+    def test_short_and_common_words_not_corrected(self, gazetteer):
+        assert gazetteer.correct("dehli") == "delhi"
+        assert gazetteer.correct("mumba") == "mumbai"
+        assert gazetteer.correct("venues") is None
+        assert gazetteer.correct("noid") is None
+
+
+class TestGazetteerExtract:
+    """Test sport/location extraction."""
+
+    @pytest.mark.parametrize("message, expected", [
+        ("Find cricket venues in Bombay", SearchIntent('cricket', 'mumbai')),
+        ("soccer in delhi-ncr", SearchIntent('football', 'delhi')),
+        ("football near Noida", SearchIntent('football', 'delhi', 'noida')),
+        ("cricket bengaluru hsr layout", SearchIntent('cricket', 'bangalore', 'hsr layout')),
+        ("cricket in Paris", None),
+        ("venues in mumbai", None),
+    ])
+    def test_extract(self, gazetteer, message, expected):
+        assert gazetteer.extract(message) == expected
+
+    def test_repeated_messages_are_memoised(self, gazetteer):
+        gazetteer.extract("cricket in Mumbai")
+        gazetteer.extract("Cricket in mumbai!")
+
+        assert gazetteer.stats()['memo_hits'] == 1
+
+    def test_large_gazetteer(self):
+        localities = [f"sector {n}" for n in range(5000)]
+        gazetteer = Gazetteer.from_dict({
+            'sports': {'cricket': {}},
+            'cities': {'gurgaon': {'localities': localities}},
+        })
+
+        assert gazetteer.extract("cricket in sector 4321") == SearchIntent('cricket', 'gurgaon', 'sector 4321')
+
+    def test_bundled_data_file(self):
+        gazetteer = load_gazetteer()
+
+        assert gazetteer.extract("badminton in Koramangala") == SearchIntent('badminton', 'bangalore', 'koramangala')
+        assert gazetteer.extract("cricket in kakkanad") == SearchIntent('cricket', 'kakkanad')
+
+    @pytest.mark.parametrize("message", [
+        "best cricket venues in the world",
+        "thank you, any football venues?",
+        "football and a salad",
+        "cricket on radar",
+    ])
+    def test_english_words_are_not_places(self, message):
+        assert load_gazetteer().extract(message) is None
+
+    def test_common_words_are_never_corrected(self):
+        gazetteer = load_gazetteer()
+
+        assert gazetteer.correct("world") is None
+        assert gazetteer.correct("worly") == "worli"
+
+    def test_corrected_locality_needs_place_cue_or_exact_city(self):
+        gazetteer = load_gazetteer()
+
+        assert gazetteer.extract("cricket in worly") == SearchIntent('cricket', 'mumbai', 'worli')
+        assert gazetteer.extract("cricket mumbai worly") == SearchIntent('cricket', 'mumbai', 'worli')
+        assert gazetteer.extract("cricket worly") is None
@@ -0,0 +1,131 @@
+"""
+Unit tests for app.services.intent.llm.LLMIntentParser
+"""
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from app.services.agents import AgentRouter
+from app.services.intent import LLMIntentParser, SearchIntent, load_gazetteer
+from app.services.intent.llm import cache_key
+
+
+class StubChatModel:
+    """Local stand-in for a chat model: canned reply, optional delay or error."""
+
+    def __init__(self, reply='{"sport": "cricket", "location": "Mumbai", "locality": null}', delay=0.0, error=None):
+        self.reply = reply
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return SimpleNamespace(content=self.reply)
+
+
+def make_parser(model, **kwargs):
+    return LLMIntentParser(model, load_gazetteer(), **kwargs)
+
+
+class TestLLMIntentParser:
+    """Test the async LLM intent path."""
+
+    @pytest.mark.asyncio
+    async def test_answer_mapped_onto_gazetteer(self):
+        parser = make_parser(StubChatModel('```json\n{"sport": "Soccer", "location": null, "locality": "Powai"}\n```'))
+
+        intent = await parser.parse("somewhere to kick a ball around powai way")
+
+        assert intent == SearchIntent('football', 'mumbai', 'powai')
+
+    @pytest.mark.asyncio
+    async def test_rephrased_message_served_from_cache(self):
+        model = StubChatModel()
+        parser = make_parser(model)
+
+        first = await parser.parse("I want to play a cricket game at the Wankhede side of town")
+        second = await parser.parse("want to play cricket game at wankhede side of town!")
+
+        assert first == second == SearchIntent('cricket', 'mumbai')
+        assert model.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_no_intent_is_cached_too(self):
+        model = StubChatModel('{"sport": null, "location": null}')
+        parser = make_parser(model)
+
+        assert await parser.parse("what's the weather like") is None
+        assert await parser.parse("what's the weather like") is None
+        assert model.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_none(self):
+        parser = make_parser(StubChatModel(delay=1.0), timeout=0.01)
+
+        assert await parser.parse("cricket somewhere nice") is None
+        assert parser.stats()['timeouts'] == 1
+        assert len(parser.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_sheds_load_over_concurrency_cap(self):
+        parser = make_parser(StubChatModel(delay=0.05), max_concurrent=1)
+
+        results = await asyncio.gather(parser.parse("first message"), parser.parse("second message"))
+
+        assert results[0] == SearchIntent('cricket', 'mumbai')
+        assert results[1] is None
+        assert parser.stats()['shed'] == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_failures_open_circuit(self):
+        model = StubChatModel(error=RuntimeError("rate limited"))
+        parser = make_parser(model)
+
+        for n in range(5):
+            assert await parser.parse(f"message number {n}") is None
+
+        assert model.calls == 3
+        assert parser.stats()['circuit'] == 'open'
+
+    @pytest.mark.asyncio
+    async def test_works_with_langchain_fake_model(self):
+        model = FakeListChatModel(responses=['{"sport": "badminton", "location": "Bengaluru"}'])
+        parser = make_parser(model)
+
+        assert await parser.parse("shuttle game near office") == SearchIntent('badminton', 'bangalore')
+
+    def test_cache_key_drops_filler(self):
+        assert cache_key("Find me a cricket venue in Mumbai") == cache_key("cricket mumbai")
+
+
+class TestAgentRouterIntent:
+    """Test rule-based first, LLM on a miss."""
+
+    @pytest.fixture
+    def router(self, mock_venue_service):
+        with patch('app.services.agents.settings') as mock_settings:
+            mock_settings.openai_api_key = None
+            router = AgentRouter(mock_venue_service)
+        router.intent_parser = make_parser(StubChatModel())
+        return router
+
+    @pytest.mark.asyncio
+    async def test_rule_hit_skips_llm(self, router):
+        args = await router._resolve_search_args("cricket in Delhi")
+
+        assert args == {"sport": "cricket", "location": "delhi"}
+        assert router.intent_parser.llm.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_rule_miss_uses_llm(self, router):
+        with patch.object(router, '_find_venue_records', AsyncMock(return_value=())) as mock_search:
+            await router.process_message("fancy a knock with the bat this weekend", "user123")
+
+        mock_search.assert_called_once_with("cricket", "mumbai")
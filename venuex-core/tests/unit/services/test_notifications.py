@@ -0,0 +1,137 @@
+"""
+Unit tests for app.services.notifications.NotificationDispatcher
+"""
+import asyncio
+import pytest
+
+from app.services.notifications import (
+    InMemorySender,
+    Notification,
+    NotificationDispatcher,
+    SeenSet,
+    build_multicasts,
+)
+
+
+def alert(user_id: str, tokens=None, title="Slot open", body="Court 2 at 7pm", **kwargs) -> Notification:
+    return Notification(user_id=user_id, tokens=tokens or [f"{user_id}-phone"], title=title, body=body, **kwargs)
+
+
+class TestSeenSet:
+    """Test the windowed dedupe set."""
+
+    def test_pair_forgotten_after_two_windows(self, clock):
+        seen = SeenSet(window=60, clock=clock)
+
+        assert seen.add("u1", "k")
+        assert not seen.add("u1", "k")
+        assert seen.add("u2", "k")
+        clock.now += 61
+        assert not seen.add("u1", "k")  # still in the previous generation
+        clock.now += 61
+        assert seen.add("u1", "k")
+
+    def test_discarded_pair_can_be_added_again(self, clock):
+        seen = SeenSet(window=60, clock=clock)
+        seen.add("u1", "k")
+
+        seen.discard("u1", "k")
+
+        assert seen.add("u1", "k")
+
+
+class TestBuildMulticasts:
+    """Test grouping notifications into multicasts."""
+
+    def test_same_content_merged_and_chunked(self):
+        batch = [alert(f"u{i}") for i in range(5)] + [alert("u9", title="Other")]
+
+        messages = build_multicasts(batch, max_tokens=2)
+
+        assert [len(m.tokens) for m in messages] == [2, 2, 1, 1]
+        assert messages[-1].title == "Other"
+
+
+class TestNotificationDispatcher:
+    """Test queueing, batching and backpressure."""
+
+    @pytest.mark.asyncio
+    async def test_batched_into_one_multicast(self):
+        sender = InMemorySender()
+        dispatcher = NotificationDispatcher(sender, batch_window=0.05)
+        dispatcher.start()
+
+        for i in range(3):
+            assert dispatcher.notify(alert(f"u{i}"))
+        await dispatcher.stop()
+
+        assert len(sender.sent) == 1
+        assert sender.sent[0].tokens == ["u0-phone", "u1-phone", "u2-phone"]
+        assert dispatcher.stats()['delivered'] == 3
+
+    @pytest.mark.asyncio
+    async def test_duplicate_alert_for_user_suppressed(self):
+        dispatcher = NotificationDispatcher(InMemorySender())
+
+        assert dispatcher.notify(alert("u1"))
+        assert not dispatcher.notify(alert("u1"))
+        assert dispatcher.notify(alert("u1", dedupe_key="venue-7:19:00"))
+        assert dispatcher.stats()['deduplicated'] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_without_blocking(self):
+        dispatcher = NotificationDispatcher(InMemorySender(), queue_size=2)
+
+        results = [dispatcher.notify(alert(f"u{i}")) for i in range(4)]
+
+        assert results == [True, True, False, False]
+        assert dispatcher.stats()['dropped'] == 2
+        # A dropped alert was never marked as seen, so it can be retried
+        assert not dispatcher.seen.add("u0", "Slot open\x00Court 2 at 7pm")
+        assert dispatcher.seen.add("u3", "Slot open\x00Court 2 at 7pm")
+
+    @pytest.mark.asyncio
+    async def test_failed_tokens_and_sender_errors_counted(self):
+        class BrokenSender(InMemorySender):
+            async def send_multicast(self, message):
+                raise RuntimeError("FCM unavailable")
+
+        partial = NotificationDispatcher(InMemorySender(fail_tokens=["u1-phone"]))
+        await partial.send_batch([alert("u0"), alert("u1")])
+        broken = NotificationDispatcher(BrokenSender())
+        await broken.send_batch([alert("u0")])
+
+        assert (partial.delivered, partial.failed) == (1, 1)
+        assert (broken.send_errors, broken.failed) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_failed_send_allows_renotify(self):
+        class BrokenSender(InMemorySender):
+            async def send_multicast(self, message):
+                raise RuntimeError("FCM unavailable")
+
+        broken = NotificationDispatcher(BrokenSender())
+        assert broken.notify(alert("u0"))
+        await broken.send_batch([alert("u0")])
+        partial = NotificationDispatcher(InMemorySender(fail_tokens=["u1-phone"]))
+        assert partial.notify(alert("u0")) and partial.notify(alert("u1"))
+        await partial.send_batch([alert("u0"), alert("u1")])
+
+        assert broken.notify(alert("u0"))
+        assert partial.notify(alert("u1"))
+        assert not partial.notify(alert("u0"))
+
+    @pytest.mark.asyncio
+    async def test_slow_sender_does_not_block_notify(self):
+        sender = InMemorySender(delay=0.05)
+        dispatcher = NotificationDispatcher(sender, batch_size=1, batch_window=0)
+        dispatcher.start()
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for i in range(10):
+            dispatcher.notify(alert(f"u{i}"))
+        assert loop.time() - start < 0.05
+
+        await dispatcher.stop()
+        assert len(sender.sent) == 10
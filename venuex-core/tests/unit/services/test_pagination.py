@@ -0,0 +1,87 @@
+"""
+Unit tests for app.services.pagination.ResultPager
+"""
+import pytest
+
+from app.services.pagination import CursorError, ResultPager, decode_cursor, encode_cursor
+from app.services.scraping.base import VenueInfo, VenueListing
+from app.services.scraping.cache import TTLCache
+
+
+def make_records(count: int):
+    venues = [
+        VenueInfo(platform="playo", venue_id=str(i), name=f"Venue {i}", city="Mumbai", rating=4.0)
+        for i in range(count)
+    ]
+    return VenueListing(venues).records
+
+
+@pytest.fixture
+def pager():
+    return ResultPager(TTLCache(ttl=60), default_page_size=2, max_page_size=3)
+
+
+class TestResultPager:
+    """Test slicing pages from a stored result set."""
+
+    def test_pages_walk_the_whole_result_set(self, pager):
+        page = pager.first_page(make_records(5), "cricket", "u1")
+        ids = [s['venue_id'] for s in page.items]
+        while page.next_cursor:
+            page = pager.next_page(page.next_cursor, "u1")
+            ids.extend(s['venue_id'] for s in page.items)
+
+        assert ids == ["0", "1", "2", "3", "4"]
+        assert page.total == 5
+
+    def test_next_page_reads_stored_result_set(self, pager):
+        records = list(make_records(4))
+        page = pager.first_page(records, "cricket", "u1")
+        records.clear()
+
+        second = pager.next_page(page.next_cursor, "u1")
+
+        assert [s['venue_id'] for s in second.items] == ["2", "3"]
+        assert second.items[0]['sport'] == "cricket"
+        assert second.next_cursor is None
+
+    def test_stored_set_shares_the_listing_records(self, pager):
+        records = make_records(4)
+        pager.first_page(records, "cricket", "u1")
+
+        (stored,) = [entry.value for entry in pager.cache._entries.values()]
+
+        assert all(a is b for a, b in zip(stored.records, records))
+
+    def test_cursor_rejected_for_another_user(self, pager):
+        page = pager.first_page(make_records(4), "cricket", "u1")
+
+        with pytest.raises(CursorError):
+            pager.next_page(page.next_cursor, "u2")
+
+    def test_single_page_is_not_stored(self, pager):
+        page = pager.first_page(make_records(2), "cricket", "u1")
+
+        assert page.next_cursor is None
+        assert len(pager.cache) == 0
+
+    def test_page_size_is_capped(self, pager):
+        page = pager.first_page(make_records(10), "cricket", "u1", page_size=50)
+
+        assert len(page.items) == 3
+
+    def test_fields_projection(self, pager):
+        page = pager.first_page(make_records(3), "cricket", "u1", fields=['venue_name'])
+        second = pager.next_page(page.next_cursor, "u1", fields=['rating'])
+
+        assert page.items == [{'venue_name': "Venue 0"}, {'venue_name': "Venue 1"}]
+        assert second.items == [{'rating': 4.0}]
+
+    def test_expired_or_invalid_cursor(self, pager):
+        with pytest.raises(CursorError):
+            pager.next_page("not-a-cursor", "u1")
+        with pytest.raises(CursorError):
+            pager.next_page(encode_cursor("missing", 2, 2), "u1")
+
+    def test_cursor_round_trip(self):
+        assert decode_cursor(encode_cursor("abc_-1", 40, 20)) == ("abc_-1", 40, 20)
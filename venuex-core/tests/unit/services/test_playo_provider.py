@@ -0,0 +1,258 @@
+"""
+Unit tests for app.services.scraping.providers.playo_provider.PlayoProvider parsing
+"""
+import copy
+import json
+from functools import partial
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from app.services.scraping.base import CrawlResult, ProviderError
+from app.services.scraping.crawlers import BaseCrawler
+from app.services.scraping.parsers import decode_playo_next_data, extract_next_data
+from app.services.scraping.providers.playo_provider import PlayoProvider, create_playo_config
+
+NEXT_DATA = {
+    "props": {
+        "pageProps": {
+            "listData": {"data": {"venueList": [
+                {
+                    "id": "v1", "name": "Smash & Volley", "area": "Andheri", "city": "Mumbai",
+                    "address": "1 Link Road", "isBookable": True, "avgRating": 4.5,
+                    "ratingCount": 12, "sports": ["SP1"], "activeKey": "smash-volley",
+                    "distance": 1.2,
+                },
+            ]}},
+            "allSports": {"list": [{"sportId": "SP1", "name": "Badminton"}]},
+        }
+    }
+}
+
+
+def page(payload: str, attrs: str = 'id="__NEXT_DATA__" type="application/json"') -> str:
+    return f"<html><head><script id=\"other\">x</script></head><body><script {attrs}>{payload}</script></body></html>"
+
+
+def stub_crawler() -> Mock:
+    """Mock crawler running the real scrape_until_ready on top of a mocked scrape_single_url."""
+    crawler = Mock(fallback=None, renders_pages=False, ready_times={})
+    crawler.scrape_until_ready = partial(BaseCrawler.scrape_until_ready, crawler)
+    return crawler
+
+
+@pytest.fixture
+def provider():
+    with patch('app.services.scraping.providers.playo_provider.create_crawler', return_value=stub_crawler()):
+        return PlayoProvider(create_playo_config())
+
+
+class TestExtractNextData:
+    """Test the single-pass __NEXT_DATA__ extractor."""
+
+    def test_plain_payload_returned_untouched(self):
+        payload = json.dumps(NEXT_DATA)
+
+        assert extract_next_data(page(payload)) == payload
+
+    def test_attribute_order_and_whitespace(self):
+        payload = json.dumps(NEXT_DATA)
+        html = page(f"\n  {payload}\n", attrs='type="application/json" id="__NEXT_DATA__" crossorigin')
+
+        assert json.loads(extract_next_data(html)) == NEXT_DATA
+
+    def test_entity_escaped_payload_unescaped(self):
+        payload = json.dumps(NEXT_DATA).replace("&", "&amp;").replace('"', "&quot;")
+
+        assert json.loads(extract_next_data(page(payload))) == NEXT_DATA
+
+    def test_missing_script(self):
+        assert extract_next_data("<html><script id=\"other\">{}</script></html>") is None
+
+    def test_unterminated_script(self):
+        assert extract_next_data('<script id="__NEXT_DATA__">{"a": 1}') is None
+
+
+class TestDecodePlayoNextData:
+    """Test selective decoding of the Next.js payload."""
+
+    def test_only_used_subtrees_kept(self):
+        data = copy.deepcopy(NEXT_DATA)
+        data["buildId"] = "abc"
+        data["props"]["pageProps"]["seo"] = {"title": "x" * 100}
+
+        decoded = decode_playo_next_data(json.dumps(data))
+        page_props = decoded["props"]["pageProps"]
+
+        assert page_props["listData"] == NEXT_DATA["props"]["pageProps"]["listData"]
+        assert page_props["allSports"] == NEXT_DATA["props"]["pageProps"]["allSports"]
+
+    def test_unexpected_shape_falls_back_to_full_decode(self):
+        data = {"props": {"pageProps": {"listData": {"data": {"venueList": None}}}}}
+
+        assert decode_playo_next_data(json.dumps(data)) == data
+
+    def test_malformed_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            decode_playo_next_data('{"props": ')
+
+
+class TestScrapeProfiles:
+    """Test scrape profile selection."""
+
+    def test_listing_profile_is_lean(self, provider):
+        options = provider.get_crawl_config()
+
+        assert options['formats'] == ['rawHtml']
+        assert {"type": "wait", "selector": "#__NEXT_DATA__"} in options['actions']
+        assert not any(a.get('milliseconds') for a in options['actions'])
+
+    def test_unknown_profile(self, provider):
+        with pytest.raises(ProviderError):
+            provider.get_crawl_config('nope')
+
+    @pytest.mark.asyncio
+    async def test_scrape_attributed_to_profile(self, provider):
+        result = CrawlResult(platform="playo", url="u", success=True,
+                             raw_html_content=page(json.dumps(NEXT_DATA)))
+        provider.crawler.scrape_single_url = AsyncMock(return_value=result)
+
+        await provider.get_venue_details("mumbai")
+
+        assert provider.crawler.scrape_single_url.call_args.kwargs['profile'] == 'listing'
+        provider.crawler.stats.record_usable.assert_called_once()
+
+
+class TestPageReady:
+    """Test Playo's page readiness check."""
+
+    def test_ready_with_venues(self, provider):
+        assert provider.page_ready(page(json.dumps(NEXT_DATA)))
+
+    def test_ready_with_entity_escaped_payload(self, provider):
+        payload = json.dumps(NEXT_DATA).replace("&", "&amp;").replace('"', "&quot;")
+
+        assert provider.page_ready(page(payload))
+
+    def test_not_ready_with_empty_list_or_no_payload(self, provider):
+        data = copy.deepcopy(NEXT_DATA)
+        data["props"]["pageProps"]["listData"]["data"]["venueList"] = []
+
+        assert not provider.page_ready(page(json.dumps(data)))
+        assert not provider.page_ready("<html><body>Loading...</body></html>")
+
+
+class TestGetVenueDetails:
+    """Test the scrape-to-VenueInfo pipeline with a stubbed crawler."""
+
+    @pytest.mark.asyncio
+    async def test_venues_built_and_page_released(self, provider):
+        result = CrawlResult(platform="playo", url="u", success=True,
+                             raw_html_content=page(json.dumps(NEXT_DATA)), html_content="<html/>")
+        provider.crawler.scrape_single_url = AsyncMock(return_value=result)
+
+        venues = await provider.get_venue_details("mumbai")
+
+        assert len(venues) == 1
+        assert venues[0].name == "Smash & Volley"
+        assert venues[0].sports_offered == ["Badminton"]
+        assert venues[0].venue_url == "https://playo.co/venue/smash-volley"
+        assert result.raw_html_content is None and result.html_content is None
+
+    @pytest.mark.asyncio
+    async def test_page_without_next_data_raises(self, provider):
+        result = CrawlResult(platform="playo", url="u", success=True, raw_html_content="<html></html>")
+        provider.crawler.scrape_single_url = AsyncMock(return_value=result)
+
+        with pytest.raises(ProviderError):
+            await provider.get_venue_details("mumbai")
+
+    @pytest.mark.asyncio
+    async def test_page_not_ready_is_not_parsed_or_snapshotted(self, provider):
+        provider.crawler.scrape_single_url = AsyncMock(return_value=CrawlResult(
+            platform="playo", url="u", success=True, raw_html_content=page(json.dumps(NEXT_DATA))
+        ))
+        await provider.get_venue_details("mumbai")
+        empty = copy.deepcopy(NEXT_DATA)
+        empty["props"]["pageProps"]["listData"]["data"]["venueList"] = []
+        provider.crawler.scrape_single_url = AsyncMock(return_value=CrawlResult(
+            platform="playo", url="u", success=True, raw_html_content=page(json.dumps(empty))
+        ))
+
+        with pytest.raises(ProviderError, match="not ready"):
+            await provider.get_venue_details("mumbai")
+        assert provider.snapshots.deltas_since(0) == []
+
+    @pytest.mark.asyncio
+    async def test_unusable_page_retried_with_fallback(self, provider):
+        fallback = stub_crawler()
+        fallback.scrape_single_url = AsyncMock(return_value=CrawlResult(
+            platform="playo", url="u", success=True, raw_html_content=page(json.dumps(NEXT_DATA))
+        ))
+        provider.crawler.fallback = fallback
+        provider.crawler.scrape_single_url = AsyncMock(return_value=CrawlResult(
+            platform="playo", url="u", success=True, raw_html_content="<html>challenge</html>"
+        ))
+
+        venues = await provider.get_venue_details("mumbai")
+
+        assert [v.venue_id for v in venues] == ["v1"]
+        fallback.scrape_single_url.assert_awaited_once()
+        fallback.stats.record_usable.assert_called_once()
+        provider.crawler.stats.record_usable.assert_not_called()
+
+    def test_build_venues_coerces_and_skips_incomplete(self, provider):
+        data = copy.deepcopy(NEXT_DATA)
+        venue_list = data["props"]["pageProps"]["listData"]["data"]["venueList"]
+        venue_list.append({"id": None, "name": "No id"})
+        venue_list.append({"id": 7, "name": "Bare", "avgRating": None, "area": None, "sports": None})
+        venue_list.append({"id": 8, "name": "Strings", "avgRating": "4.2", "ratingCount": "9", "isBookable": 1})
+        venue_list.append({"id": 9, "name": "Bad rating", "avgRating": "n/a"})
+
+        venues = provider._build_venues(data)
+
+        assert [v.venue_id for v in venues] == ["v1", "7", "8"]
+        assert (venues[2].rating, venues[2].rating_count, venues[2].is_bookable) == (4.2, 9, True)
+        assert venues[1].rating == 0.0
+        assert venues[1].area == ""
+        assert venues[1].sports_offered == []
+        assert venues[0].last_updated is venues[1].last_updated
+
+
+class TestSnapshots:
+    """Test unchanged-page skipping and venue deltas."""
+
+    @staticmethod
+    def scrape_returns(provider, data):
+        result = CrawlResult(platform="playo", url="u", success=True, raw_html_content=page(json.dumps(data)))
+        provider.crawler.scrape_single_url = AsyncMock(return_value=result)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_page_skips_parsing(self, provider):
+        self.scrape_returns(provider, NEXT_DATA)
+        first = await provider.get_venue_details("mumbai")
+
+        self.scrape_returns(provider, NEXT_DATA)
+        with patch.object(provider, '_decode_next_data') as mock_decode:
+            second = await provider.get_venue_details("mumbai")
+
+        mock_decode.assert_not_called()
+        assert second == first
+        assert provider.snapshots.stats()['unchanged_hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_page_records_delta(self, provider):
+        self.scrape_returns(provider, NEXT_DATA)
+        await provider.get_venue_details("mumbai")
+
+        data = copy.deepcopy(NEXT_DATA)
+        venue_list = data["props"]["pageProps"]["listData"]["data"]["venueList"]
+        venue_list[0]["isBookable"] = False
+        venue_list.append({"id": "v2", "name": "New Turf", "sports": ["SP1"]})
+        self.scrape_returns(provider, data)
+        await provider.get_venue_details("mumbai")
+
+        [delta] = provider.snapshots.deltas_since(0)
+        assert [v.venue_id for v in delta.added] == ["v2"]
+        assert delta.bookability_changed[0].venue_id == "v1"
+        assert delta.bookability_changed[0].after is False
@@ -0,0 +1,131 @@
+"""
+Unit tests for app.services.scraping.prewarm.PrewarmScheduler
+"""
+import asyncio
+import pytest
+
+from app.services.scraping.base import VenueInfo
+from app.services.scraping.popularity import PopularityTracker
+from app.services.scraping.prewarm import PrewarmScheduler
+
+
+@pytest.fixture
+def fake_provider(make_provider):
+    return make_provider(
+        supported_cities=["mumbai", "delhi", "pune"],
+        side_effect=lambda location: [VenueInfo(platform="playo", venue_id="1", name="Venue", city=location)],
+    )
+
+
+@pytest.fixture
+def service(fake_provider, make_venue_service, clock):
+    service = make_venue_service(fake_provider, ttl=300, stale_ttl=600)
+    service.popularity = PopularityTracker(half_life=3600, clock=clock)
+    return service
+
+
+def make_scheduler(service, clock, **kwargs):
+    options = dict(interval=60, refresh_margin=60, top_n=10, max_per_cycle=2, max_per_hour=10, clock=clock)
+    options.update(kwargs)
+    return PrewarmScheduler(service, **options)
+
+
+class TestPopularityTracker:
+    """Test decayed query counts."""
+
+    def test_counts_decay_with_half_life(self, clock):
+        tracker = PopularityTracker(half_life=60, clock=clock)
+        tracker.record("a")
+        tracker.record("a")
+        clock.now += 60
+
+        assert tracker.score("a") == pytest.approx(1.0)
+
+    def test_recent_traffic_ranks_first(self, clock):
+        tracker = PopularityTracker(half_life=60, clock=clock)
+        for _ in range(4):
+            tracker.record("old")
+        clock.now += 180
+        tracker.record("new")
+
+        assert [key for key, _ in tracker.top(2)] == ["new", "old"]
+
+    def test_coldest_key_dropped_when_full(self, clock):
+        tracker = PopularityTracker(max_keys=2, clock=clock)
+        tracker.record("a")
+        tracker.record("a")
+        tracker.record("b")
+        tracker.record("c")
+
+        assert set(key for key, _ in tracker.top(5)) == {"a", "c"}
+
+
+class TestPrewarmScheduler:
+    """Test popularity-driven refreshes."""
+
+    @pytest.mark.asyncio
+    async def test_refreshes_hottest_due_listings_within_cycle_budget(self, service, fake_provider, clock):
+        for location, hits in (("mumbai", 3), ("delhi", 2), ("pune", 1)):
+            for _ in range(hits):
+                await service.get_venue_details(location)
+        fake_provider.fetch_venue_details.reset_mock()
+        clock.now += 250  # inside the refresh margin, not yet stale
+
+        scheduler = make_scheduler(service, clock)
+        await scheduler.run_cycle()
+
+        refreshed = [call.args[0] for call in fake_provider.fetch_venue_details.call_args_list]
+        assert refreshed == ["mumbai", "delhi"]
+        stats = scheduler.stats()
+        assert stats['queue'][0]['listing'] == "playo:pune"
+        assert stats['last_lag'] == pytest.approx(10.0)
+        assert service.cache.age(("playo", "mumbai")) == 0
+
+    @pytest.mark.asyncio
+    async def test_fresh_listings_left_alone(self, service, fake_provider, clock):
+        await service.get_venue_details("mumbai")
+        fake_provider.fetch_venue_details.reset_mock()
+
+        scheduler = make_scheduler(service, clock)
+        await scheduler.run_cycle()
+
+        fake_provider.fetch_venue_details.assert_not_called()
+        assert scheduler.stats()['queue_depth'] == 0
+
+    @pytest.mark.asyncio
+    async def test_hourly_budget_caps_refreshes(self, service, fake_provider, clock):
+        await service.get_venue_details("mumbai")
+        scheduler = make_scheduler(service, clock, max_per_hour=2)
+
+        for _ in range(4):
+            clock.now += 300
+            await scheduler.run_cycle()
+
+        assert scheduler.refreshed == 2
+        assert scheduler.stats()['over_budget'] == 2
+
+    @pytest.mark.asyncio
+    async def test_startup_warms_cold_cities_and_stops(self, service, fake_provider, clock):
+        scheduler = make_scheduler(service, clock, startup_locations=["Mumbai", "Delhi"])
+
+        scheduler.start()
+        await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+        assert ("playo", "mumbai") in service.cache
+        assert ("playo", "delhi") in service.cache
+        assert not scheduler.running
+        # Warming is not a user query
+        assert len(service.popularity) == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_counted(self, service, fake_provider, clock):
+        await service.get_venue_details("mumbai")
+        fake_provider.fetch_venue_details.side_effect = Exception("upstream down")
+        clock.now += 250
+
+        scheduler = make_scheduler(service, clock)
+        await scheduler.run_cycle()
+
+        assert scheduler.failed == 1
+        assert service.cache.age(("playo", "mumbai")) == 250
@@ -0,0 +1,105 @@
+"""
+Unit tests for app.services.scraping.rate_limiter.RateLimiter
+"""
+import asyncio
+import pytest
+
+from app.services.scraping.base import ProviderConfig
+from app.services.scraping.rate_limiter import RateLimiter
+
+
+class FakeTime:
+    """Clock and sleep that advance virtual time instead of waiting."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def clock(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def fake_time():
+    return FakeTime()
+
+
+class TestRateLimiter:
+    """Test token bucket and concurrency cap."""
+
+    def test_from_config_uses_slower_of_rate_and_delay(self):
+        config = ProviderConfig(
+            name="playo", base_url="https://playo.co",
+            max_requests_per_minute=20, request_delay=1.0,
+            burst_limit=4, max_concurrent_requests=2,
+        )
+        limiter = RateLimiter.from_config(config)
+
+        assert limiter.interval == 3.0
+        assert limiter.burst == 4
+        assert limiter.max_concurrency == 2
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self, fake_time):
+        limiter = RateLimiter(interval=3.0, burst=2, max_concurrency=10,
+                              clock=fake_time.clock, sleep=fake_time.sleep)
+
+        for _ in range(4):
+            async with limiter:
+                pass
+
+        assert fake_time.sleeps == [3.0, 3.0]
+        assert limiter.stats()['acquired'] == 4
+        assert limiter.stats()['max_wait'] == 3.0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        limiter = RateLimiter(interval=0, burst=1, max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with limiter:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work() for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.stats()['in_flight'] == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_reported_while_waiting(self):
+        limiter = RateLimiter(interval=0, burst=1, max_concurrency=1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        assert limiter.stats()['queue_depth'] == 1
+
+        limiter.release()
+        await waiter
+        limiter.release()
+        assert limiter.stats()['queue_depth'] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_returns_token(self):
+        limiter = RateLimiter(interval=10.0, burst=1, max_concurrency=5)
+        await limiter.acquire()
+        limiter.release()
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert limiter.stats()['in_flight'] == 0
+        assert limiter._tokens > -1
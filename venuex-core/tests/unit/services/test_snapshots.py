@@ -0,0 +1,74 @@
+"""
+Unit tests for app.services.scraping.snapshots
+"""
+from app.services.scraping.base import VenueInfo
+from app.services.scraping.snapshots import SnapshotStore, content_hash, diff_venues
+
+
+def make_venue(venue_id: str, rating: float = 4.0, is_bookable: bool = True) -> VenueInfo:
+    return VenueInfo(
+        platform="playo",
+        venue_id=venue_id,
+        name=f"Venue {venue_id}",
+        city="Mumbai",
+        rating=rating,
+        is_bookable=is_bookable,
+    )
+
+
+class TestDiffVenues:
+    """Test keyed venue diffs."""
+
+    def test_added_removed_and_changed(self):
+        previous = [make_venue("1"), make_venue("2"), make_venue("3")]
+        current = [make_venue("1", rating=4.5), make_venue("3", is_bookable=False), make_venue("4")]
+
+        delta = diff_venues(previous, current, 1, "playo", "mumbai")
+
+        assert [v.venue_id for v in delta.added] == ["4"]
+        assert delta.removed == ["2"]
+        assert [(c.venue_id, c.before, c.after) for c in delta.rating_changed] == [("1", 4.0, 4.5)]
+        assert [(c.venue_id, c.before, c.after) for c in delta.bookability_changed] == [("3", True, False)]
+
+    def test_identical_listings_give_empty_delta(self):
+        assert diff_venues([make_venue("1")], [make_venue("1")], 1, "playo", "mumbai").is_empty
+
+
+class TestSnapshotStore:
+    """Test snapshot hashing and the delta log."""
+
+    def test_unchanged_digest_returns_previous_venues(self):
+        store = SnapshotStore("playo")
+        digest = content_hash('{"a": 1}')
+        store.record("mumbai", digest, [make_venue("1")])
+
+        assert [v.venue_id for v in store.unchanged("mumbai", digest)] == ["1"]
+        assert store.unchanged("mumbai", content_hash('{"a": 2}')) is None
+        assert store.unchanged("delhi", digest) is None
+
+    def test_first_snapshot_is_baseline(self):
+        store = SnapshotStore("playo")
+
+        assert store.record("mumbai", "h1", [make_venue("1")]) is None
+        assert store.deltas_since(0) == []
+
+    def test_deltas_since_sequence(self):
+        store = SnapshotStore("playo")
+        store.record("mumbai", "h1", [make_venue("1")])
+        store.record("delhi", "h1", [make_venue("9")])
+        first = store.record("mumbai", "h2", [make_venue("1"), make_venue("2")])
+        store.record("mumbai", "h3", [make_venue("1"), make_venue("2")])  # same venues, no delta
+        second = store.record("delhi", "h2", [])
+
+        assert [d.sequence for d in store.deltas_since(0)] == [1, 2]
+        assert store.deltas_since(first.sequence) == [second]
+        assert store.deltas_since(0, location="delhi") == [second]
+        assert second.removed == ["9"]
+
+    def test_changed_counts_only_non_empty_deltas(self):
+        store = SnapshotStore("playo")
+        store.record("mumbai", "h1", [make_venue("1")])
+        store.record("mumbai", "h2", [make_venue("1")])  # new payload, same venues
+        store.record("mumbai", "h3", [make_venue("1", rating=4.5)])
+
+        assert store.stats()["changed"] == 1
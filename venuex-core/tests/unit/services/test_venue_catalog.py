@@ -0,0 +1,112 @@
+"""
+Unit tests for app.services.scraping.catalog.VenueCatalog
+"""
+import pytest
+import pytest_asyncio
+from unittest.mock import Mock, AsyncMock
+
+from app.services.scraping.base import VenueInfo
+from app.services.scraping.cache import TTLCache
+from app.services.scraping.catalog import VenueCatalog, create_venue_catalog
+from app.services.scraping.venue_service import VenueService
+
+
+def make_venue(venue_id: str, rating: float = 4.0) -> VenueInfo:
+    return VenueInfo(
+        platform="playo",
+        venue_id=venue_id,
+        name=f"Venue {venue_id}",
+        city="Mumbai",
+        sports_offered=["Cricket"],
+        rating=rating,
+    )
+
+
+@pytest_asyncio.fixture
+async def catalog(tmp_path):
+    catalog = create_venue_catalog(f"sqlite:///{tmp_path / 'catalog.db'}")
+    await catalog.create_schema()
+    yield catalog
+    await catalog.close()
+
+
+class TestVenueCatalog:
+    """Test catalog persistence."""
+
+    @pytest.mark.asyncio
+    async def test_save_and_read_listing(self, catalog):
+        await catalog.save_listing("playo", "Mumbai", [make_venue("1"), make_venue("2")])
+
+        venues = await catalog.get_listing("playo", "mumbai")
+
+        assert [v.venue_id for v in venues] == ["1", "2"]
+        assert venues[0].sports_offered == ["Cricket"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_updates_existing_rows(self, catalog):
+        await catalog.upsert_venues([make_venue("1", rating=3.0)])
+        written = await catalog.upsert_venues([make_venue("1", rating=4.8), make_venue("2")])
+        await catalog.save_listing("playo", "mumbai", [make_venue("1", rating=4.8), make_venue("2")])
+
+        venues = await catalog.get_listing("playo", "mumbai")
+
+        assert written == 2
+        assert venues[0].rating == 4.8
+
+    @pytest.mark.asyncio
+    async def test_listing_replaced_on_save(self, catalog):
+        await catalog.save_listing("playo", "mumbai", [make_venue("1"), make_venue("2")])
+        await catalog.save_listing("playo", "mumbai", [make_venue("2")])
+
+        venues = await catalog.get_listing("playo", "mumbai")
+
+        assert [v.venue_id for v in venues] == ["2"]
+
+    @pytest.mark.asyncio
+    async def test_missing_or_expired_listing(self, catalog):
+        assert await catalog.get_listing("playo", "delhi") is None
+
+        await catalog.save_listing("playo", "mumbai", [make_venue("1")])
+        assert await catalog.get_listing("playo", "mumbai", max_age=-1) is None
+
+
+    @pytest.mark.asyncio
+    async def test_large_batch_split_within_parameter_limit(self, catalog):
+        venues = [make_venue(str(i)) for i in range(300)]
+
+        await catalog.save_listing("playo", "mumbai", venues)
+
+        assert len(await catalog.get_listing("playo", "mumbai")) == 300
+        rows = [dict.fromkeys(range(14))] * 300
+        assert all(len(chunk) * 14 <= 999 for chunk in catalog._chunks(rows))
+
+    def test_unsupported_dialect_rejected_at_construction(self):
+        engine = Mock()
+        engine.dialect.name = "mysql"
+
+        with pytest.raises(NotImplementedError, match="mysql"):
+            VenueCatalog(engine)
+
+
+class TestVenueServiceWithCatalog:
+    """Test VenueService answering from the catalog."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_written_then_served_after_restart(self, catalog):
+        provider = Mock()
+        provider.name = "playo"
+        provider.supported_cities = ["mumbai"]
+        provider.fetch_venue_details = AsyncMock(return_value=[make_venue("1")])
+
+        factory = Mock()
+        factory.get_provider.return_value = provider
+
+        first = VenueService(factory, cache=TTLCache(ttl=60), catalog=catalog, catalog_max_age=60)
+        await first.get_venue_details("mumbai")
+
+        # A new service instance starts with an empty cache, like a restarted process
+        second = VenueService(factory, cache=TTLCache(ttl=60), catalog=catalog, catalog_max_age=60)
+        venues = await second.get_venue_details("mumbai")
+
+        assert [v.venue_id for v in venues] == ["1"]
+        provider.fetch_venue_details.assert_called_once_with("mumbai")
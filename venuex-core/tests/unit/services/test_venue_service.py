@@ -0,0 +1,253 @@
+"""
+Unit tests for app.services.scraping.venue_service.VenueService
+"""
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+from app.services.scraping.base import ProviderError, VenueInfo
+from app.services.scraping.cache import CacheState, TTLCache
+from app.services.scraping.venue_service import VenueService
+
+
+def make_venue(venue_id: str, city: str = "Mumbai") -> VenueInfo:
+    return VenueInfo(platform="playo", venue_id=venue_id, name=f"Venue {venue_id}", city=city)
+
+
+@pytest.fixture
+def fake_provider(make_provider):
+    return make_provider(return_value=[make_venue("1"), make_venue("2")])
+
+
+@pytest.fixture
+def service(fake_provider, make_venue_service):
+    return make_venue_service(fake_provider, ttl=60, stale_ttl=120, max_entries=8)
+
+
+class TestTTLCache:
+    """Test TTLCache eviction and freshness."""
+
+    def test_fresh_stale_and_expired(self, clock):
+        cache = TTLCache(ttl=10, stale_ttl=5, clock=clock)
+        cache.set("k", "v")
+
+        assert cache.get("k") == ("v", CacheState.FRESH)
+        clock.now += 12
+        assert cache.get("k") == ("v", CacheState.STALE)
+        clock.now += 10
+        assert cache.get("k") == (None, CacheState.MISS)
+        assert "k" not in cache
+
+    def test_lru_eviction_by_entries(self, clock):
+        cache = TTLCache(ttl=10, max_entries=2, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert cache.stats()['evictions'] == 1
+
+    def test_eviction_by_bytes(self, clock):
+        cache = TTLCache(ttl=10, max_entries=10, max_bytes=100, sizeof=len, clock=clock)
+        cache.set("a", "x" * 60)
+        cache.set("b", "y" * 60)
+
+        assert "a" not in cache
+        assert cache.stats()['bytes'] == 60
+
+    def test_oversized_value_not_cached(self, clock):
+        cache = TTLCache(ttl=10, max_bytes=10, sizeof=len, clock=clock)
+        cache.set("a", "x" * 20)
+
+        assert len(cache) == 0
+
+
+class TestGetVenueDetails:
+    """Test cached venue lookups."""
+
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self, service, fake_provider):
+        first = await service.get_venue_details("Mumbai")
+        second = await service.get_venue_details("mumbai")
+
+        assert [v.venue_id for v in first] == ["1", "2"]
+        assert [v.venue_id for v in second] == ["1", "2"]
+        fake_provider.fetch_venue_details.assert_called_once_with("mumbai")
+        assert service.cache_stats()['hits'] == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_one_refresh_runs(self, service, fake_provider, clock):
+        await service.get_venue_details("mumbai")
+        fake_provider.fetch_venue_details.return_value = [make_venue("3")]
+        clock.now += 90
+
+        stale_a = await service.get_venue_details("mumbai")
+        stale_b = await service.get_venue_details("mumbai")
+        assert [v.venue_id for v in stale_a] == ["1", "2"]
+        assert [v.venue_id for v in stale_b] == ["1", "2"]
+
+        await asyncio.gather(*service._refresh_tasks.values())
+        refreshed = await service.get_venue_details("mumbai")
+
+        assert [v.venue_id for v in refreshed] == ["3"]
+        assert fake_provider.fetch_venue_details.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_stale_entry(self, service, fake_provider, clock):
+        await service.get_venue_details("mumbai")
+        fake_provider.fetch_venue_details.side_effect = Exception("boom")
+        clock.now += 90
+
+        await service.get_venue_details("mumbai")
+        await asyncio.gather(*service._refresh_tasks.values())
+
+        venues = await service.get_venue_details("mumbai")
+        assert [v.venue_id for v in venues] == ["1", "2"]
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_refreshes_and_in_flight_scrapes(self, service, fake_provider, clock):
+        await service.get_venue_details("mumbai")
+        scrapes_started = []
+
+        async def hanging_scrape(location):
+            scrapes_started.append(location)
+            await asyncio.Event().wait()
+
+        fake_provider.fetch_venue_details.side_effect = hanging_scrape
+        clock.now += 90
+        await service.get_venue_details("mumbai")
+        await asyncio.sleep(0)
+        refresh = next(iter(service._refresh_tasks.values()))
+
+        await service.close()
+
+        assert scrapes_started == ["mumbai"]
+        assert refresh.cancelled()
+        assert service._refresh_tasks == {}
+        assert not service.single_flight.in_flight(("playo", "mumbai"))
+
+    @pytest.mark.asyncio
+    async def test_unsupported_location(self, service):
+        with pytest.raises(ProviderError):
+            await service.get_venue_details("paris")
+
+    @pytest.mark.asyncio
+    async def test_provider_error_not_cached(self, service, fake_provider):
+        fake_provider.fetch_venue_details.side_effect = Exception("boom")
+
+        with pytest.raises(ProviderError):
+            await service.get_venue_details("mumbai")
+        assert len(service.cache) == 0
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent scrapes."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_scrape(self, service, fake_provider):
+        release = asyncio.Event()
+
+        async def slow_scrape(location):
+            await release.wait()
+            return [make_venue("1")]
+
+        fake_provider.fetch_venue_details.side_effect = slow_scrape
+        callers = [asyncio.ensure_future(service.get_venue_details("mumbai")) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert all([v.venue_id for v in r] == ["1"] for r in results)
+        fake_provider.fetch_venue_details.assert_called_once_with("mumbai")
+        stats = service.single_flight_stats()["playo:mumbai"]
+        assert stats == {'calls': 5, 'executions': 1, 'coalesced': 4, 'errors': 0}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_error(self, service, fake_provider):
+        release = asyncio.Event()
+
+        async def failing_scrape(location):
+            await release.wait()
+            raise Exception("upstream down")
+
+        fake_provider.fetch_venue_details.side_effect = failing_scrape
+        callers = [asyncio.ensure_future(service.get_venue_details("mumbai")) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        assert all(isinstance(r, ProviderError) for r in results)
+        assert fake_provider.fetch_venue_details.call_count == 1
+        assert service.single_flight_stats()["playo:mumbai"]['errors'] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_scrape(self, service, fake_provider):
+        release = asyncio.Event()
+
+        async def slow_scrape(location):
+            await release.wait()
+            return [make_venue("1")]
+
+        fake_provider.fetch_venue_details.side_effect = slow_scrape
+        first = asyncio.ensure_future(service.get_venue_details("mumbai"))
+        second = asyncio.ensure_future(service.get_venue_details("mumbai"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        venues = await second
+        assert [v.venue_id for v in venues] == ["1"]
+
+
+class TestFanOut:
+    """Test concurrent multi-provider queries."""
+
+    @pytest.fixture
+    def providers(self, make_provider):
+        async def fast(location):
+            return [make_venue("fast-1")]
+
+        async def slow(location):
+            await asyncio.sleep(5)
+            return [make_venue("slow-1")]
+
+        async def broken(location):
+            raise Exception("bad gateway")
+
+        return {
+            "fast": make_provider("fast", ["mumbai"], side_effect=fast),
+            "slow": make_provider("slow", ["mumbai"], side_effect=slow),
+            "broken": make_provider("broken", ["mumbai"], side_effect=broken),
+        }
+
+    @pytest.fixture
+    def fanout_service(self, providers):
+        factory = Mock()
+        factory.get_all_providers.return_value = list(providers.values())
+        factory.get_provider.side_effect = providers.get
+        return VenueService(factory, cache=TTLCache(ttl=60))
+
+    @pytest.mark.asyncio
+    async def test_aggregate_reports_partial_results(self, fanout_service):
+        result = await fanout_service.get_aggregated_venue_details("mumbai", timeout=0.05)
+
+        assert [v.venue_id for v in result.venues] == ["fast-1"]
+        assert result.succeeded == ["fast"]
+        assert result.timed_out == ["slow"]
+        assert "bad gateway" in result.failed["broken"]
+
+    @pytest.mark.asyncio
+    async def test_outcomes_yielded_fastest_first(self, fanout_service):
+        statuses = []
+        async for outcome in fanout_service.iter_venue_details("mumbai", timeout=0.05):
+            statuses.append((outcome.provider, outcome.status))
+
+        assert statuses[-1] == ("slow", "timeout")
+        assert set(statuses[:2]) == {("fast", "ok"), ("broken", "failed")}
+
+    @pytest.mark.asyncio
+    async def test_no_provider_for_location(self, fanout_service):
+        with pytest.raises(ProviderError):
+            await fanout_service.get_aggregated_venue_details("paris")